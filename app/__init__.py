@@ -0,0 +1,8 @@
+import warnings
+
+# Silence pydantic v1-style __fields__ deprecation warnings from upstream libs.
+# Registered once here since every app module import goes through this package.
+warnings.filterwarnings(
+    "ignore",
+    message=".*__fields__.*PydanticDeprecatedSince20.*",
+)
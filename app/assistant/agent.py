@@ -7,29 +7,92 @@ to analyze game statistics and provide strategic advice.
 """
 
 import logging
-import warnings
+import re
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from langchain.agents import create_agent
 from langchain_classic.agents import AgentExecutor
+from langchain_core.messages import AIMessageChunk, SystemMessage
 from google.api_core.exceptions import ResourceExhausted
 
 from app.config import settings
 from app.assistant import prompts
 from app.assistant.prompts import build_gaming_guidance_section, build_game_state_report
 from app.lib.langchain import ensure_llm_config, get_llm_chat
+from app.models.role import Role
 from app.utils.game_stats import GameStateProcessor
 
 ensure_llm_config()
 
 logger = logging.getLogger(__name__)
-# Silence pydantic v1-style __fields__ deprecation warnings from upstream libs
-warnings.filterwarnings(
-    "ignore",
-    message=".*__fields__.*PydanticDeprecatedSince20.*",
+
+# Short greetings/acknowledgements that don't need champion-specific guidance
+_SIMPLE_QUESTION_MAX_LENGTH = 30
+_SIMPLE_QUESTION_PATTERN = re.compile(
+    r"\W*(hi|hello|hey|yo|sup|gg|gg wp|wp|ty|thx|thanks|thank you|ok|okay|cool|nice|lol)"
+    r"(\W+(coach|sensii|man|bro))?\W*",
+    re.IGNORECASE,
 )
 
 
-def create_coach_agent(champion: str, role: str) -> AgentExecutor:
+def _is_simple(question: str) -> bool:
+    """Return True for short greetings/thanks that the lite agent can answer."""
+    return (
+        len(question) < _SIMPLE_QUESTION_MAX_LENGTH
+        and _SIMPLE_QUESTION_PATTERN.fullmatch(question) is not None
+    )
+
+
+def _build_system_prompt(champion: str, role: Role) -> SystemMessage:
+    """
+    Build the static coach system prompt for a (champion, role) pair.
+
+    Not cached itself: it runs once per agent, and _get_or_make_agent caches the
+    agent. Callers must pass normalized inputs.
+
+    The base prompt and gaming guidance are kept as separate text blocks (base
+    first) so the champion-independent base is an identical prefix for every
+    agent and can be reused by provider-side prompt caching.
+
+    Args:
+        champion: Champion name (lowercase, stripped)
+        role: Player's position
+
+    Returns:
+        System message with two blocks (base prompt, gaming guidance)
+    """
+    # Build system prompt with two major sections
+    base_prompt = prompts.COACH_PROMPT_STATIC
+    gaming_guidance = build_gaming_guidance_section(champion, role)
+
+    return SystemMessage(
+        content=[
+            {"type": "text", "text": base_prompt},
+            {"type": "text", "text": gaming_guidance},
+        ]
+    )
+
+
+def create_coach_agent(champion: str, role: Union[Role, str]) -> AgentExecutor:
+    """
+    Get the coaching agent for a champion and role.
+
+    Agents hold no conversation state (history is passed in with each call), so a
+    single agent is built per (champion, role) and shared by every session.
+
+    Args:
+        champion: Champion name
+        role: Player's position (Role or case-insensitive role name)
+
+    Returns:
+        AgentExecutor instance.
+    """
+    return _get_or_make_agent(champion.lower().strip(), Role.parse(role))
+
+
+@lru_cache(maxsize=1024)
+def _get_or_make_agent(champion: str, role: Role) -> AgentExecutor:
     """
     Create a new coaching agent with static context.
 
@@ -40,7 +103,7 @@ def create_coach_agent(champion: str, role: str) -> AgentExecutor:
     Game stats and language instruction are passed dynamically with each user message.
 
     Args:
-        champion: Champion name
+        champion: Champion name (lowercase, stripped)
         role: Player's position
 
     Returns:
@@ -48,12 +111,7 @@ def create_coach_agent(champion: str, role: str) -> AgentExecutor:
     """
     llm = get_llm_chat()
 
-    # Build system prompt with two major sections
-    base_prompt = prompts.build_coach_prompt()
-    gaming_guidance = build_gaming_guidance_section(champion, role)
-
-    # Construct complete system prompt (order: base + gaming guidance)
-    system_prompt = f"{base_prompt}\n\n{gaming_guidance}"
+    system_prompt = _build_system_prompt(champion, role)
 
     # Create agent without tools for text-based coaching
     agent = create_agent(
@@ -65,11 +123,102 @@ def create_coach_agent(champion: str, role: str) -> AgentExecutor:
     return agent
 
 
-def get_coach_advice(
+@lru_cache(maxsize=1)
+def get_lite_coach_agent() -> AgentExecutor:
+    """
+    Get the shared lightweight coaching agent for trivial questions.
+
+    Uses only the BASE PROMPT (no gaming guidance), so greetings and thanks
+    don't pay for tens of KB of champion data. The agent holds no conversation
+    state, so a single instance is shared across all sessions.
+
+    Returns:
+        AgentExecutor instance.
+    """
+    return create_agent(
+        model=get_llm_chat(),
+        tools=[],
+        system_prompt=prompts.COACH_PROMPT_STATIC,
+    )
+
+
+_QUOTA_EXCEEDED_MESSAGE = (
+    "I'm sorry, but I've reached my usage limit. Please try again in a few minutes."
+)
+
+
+def _prepare_coach_turn(
+    session,
+    user_question: str,
+    game_stats_json: Optional[str],
+    language: str,
+    game_stats_dict: Optional[dict] = None,
+) -> Tuple[AgentExecutor, List[Dict[str, str]], str]:
+    """
+    Build everything needed to run one coaching turn.
+
+    Args:
+        session: Session object containing agent and message history
+        user_question: User's transcribed question text
+        game_stats_json: Fresh game statistics JSON (not needed when game_stats_dict is given)
+        language: Language for the response
+        game_stats_dict: Fresh game statistics, already decoded by the caller
+
+    Returns:
+        Tuple of (agent to invoke, messages for the agent, user entry for history)
+    """
+    # Parse game stats JSON into MatchState (includes formatted_time as MM:SS)
+    if game_stats_dict is not None:
+        match_state = GameStateProcessor.process_data_to_state(game_stats_dict)
+    elif game_stats_json is not None:
+        match_state = GameStateProcessor.process_to_state(game_stats_json)
+    else:
+        raise ValueError("Either game_stats_dict or game_stats_json is required")
+    logger.info("Game time: %s", match_state.formatted_time)
+
+    # Generate formatted report from MatchState
+    game_stats_report = build_game_state_report(match_state)
+    logger.info("Generated game stats report (%d characters)", len(game_stats_report))
+
+    # Build messages array starting with history (text-only, no game stats).
+    # History is already stored in the agent's message format, so it is used as-is.
+    # The window is append-only between resets so the prefix sent to the provider
+    # stays cacheable across turns.
+    historical_messages = session.message_history.get_window()
+    messages = list(historical_messages)
+
+    # Add current message: stable parts (question, language) first, volatile
+    # game time + game stats report at the tail
+    current_message_text = (
+        f"{user_question}\n\n"
+        f"[Respond in {language.capitalize()}]\n\n"
+        f"[{match_state.formatted_time}]\n{game_stats_report}"
+    )
+
+    current_message = {
+        "role": "user",
+        "content": current_message_text
+    }
+    messages.append(current_message)
+
+    logger.info("Invoking agent with %d total messages (%d historical + 1 current)",
+               len(messages), len(historical_messages))
+
+    # Route trivial questions to the lite agent (no gaming guidance in the prompt)
+    agent = session.agent
+    if _is_simple(user_question):
+        logger.info("Routing simple question to lite coach agent")
+        agent = get_lite_coach_agent()
+
+    return agent, messages, f"[{match_state.formatted_time}] {user_question}"
+
+
+async def get_coach_advice(
     session,
     user_question: str,
-    game_stats_json: str,
+    game_stats_json: Optional[str] = None,
     language: str = "english",
+    game_stats_dict: Optional[dict] = None,
 ) -> str:
     """
     Get coaching advice using the provided session.
@@ -77,8 +226,9 @@ def get_coach_advice(
     Args:
         session: Session object containing agent and message history
         user_question: User's transcribed question text
-        game_stats_json: Fresh game statistics JSON
+        game_stats_json: Fresh game statistics JSON (not needed when game_stats_dict is given)
         language: Language for the response (default: "english")
+        game_stats_dict: Fresh game statistics, already decoded by the caller
 
     Returns:
         Coaching advice as plain text string
@@ -89,46 +239,20 @@ def get_coach_advice(
     logger.info("Getting coach advice - Username: %s, Match: %s", session.username, session.match_id)
     logger.info("User question: %s", user_question)
     logger.info("Message history count: %d messages", session.message_history.get_message_count())
-    logger.info("Raw Game Stats json: %s", game_stats_json)
+    if game_stats_json and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Raw Game Stats json: %s", game_stats_json[:512])
 
     try:
         # Run agent with user question
         logger.info("Running agent with provider: %s (model: %s)",
                    settings.coach_provider, settings.coach_model)
 
-        # Parse game stats JSON into MatchState (includes formatted_time as MM:SS)
-        match_state = GameStateProcessor.process_to_state(game_stats_json)
-        logger.info("Game time: %s", match_state.formatted_time)
-        
-        # Generate formatted report from MatchState
-        game_stats_report = build_game_state_report(match_state)
-        logger.info("Generated game stats report (%d characters)", len(game_stats_report))
-
-        # Build messages array starting with history (text-only)
-        messages = []
-
-        # Add historical messages (text-only, no game stats)
-        historical_messages = session.message_history.get_all_messages()
-        for msg in historical_messages:
-            messages.append({
-                "role": msg["role"],
-                "content": msg["content"]
-            })
-
-        # Add current message with game time, transcribed question + game stats report
-        current_message_text = f"[{match_state.formatted_time}] {user_question}\n\n{game_stats_report}\n\n[Respond in {language.capitalize()}]"
-        
-        current_message = {
-            "role": "user",
-            "content": current_message_text
-        }
-        messages.append(current_message)
-
-        logger.info("Invoking agent with %d total messages (%d historical + 1 current)",
-                   len(messages), len(historical_messages))
+        agent, messages, history_question = _prepare_coach_turn(
+            session, user_question, game_stats_json, language, game_stats_dict
+        )
 
-        # Invoke agent with messages format
-        agent_result = session.agent.invoke({"messages": messages})
+        # Invoke agent asynchronously so concurrent requests overlap on network I/O
+        agent_result = await agent.ainvoke({"messages": messages})
 
         # Extract text response from agent result
         # The agent returns messages with the last message being the assistant's response
@@ -143,7 +267,7 @@ def get_coach_advice(
         logger.info("Agent response: %s", advice[:200])
 
         # Add user question and assistant response to message history
-        session.message_history.add_user_message(f"[{match_state.formatted_time}] {user_question}")
+        session.message_history.add_user_message(history_question)
         session.message_history.add_assistant_message(advice)
 
         logger.info("Added messages to history. New count: %d messages",
@@ -153,8 +277,65 @@ def get_coach_advice(
 
     except ResourceExhausted as e:
         logger.error("Coach LLM API quota exceeded (%s): %s", settings.coach_provider, str(e))
-        return "I'm sorry, but I've reached my usage limit. Please try again in a few minutes."
+        return _QUOTA_EXCEEDED_MESSAGE
 
     except Exception as e:
         logger.error("Error in get_coach_advice: %s", str(e), exc_info=True)
         raise
+
+
+async def get_coach_advice_stream(
+    session,
+    user_question: str,
+    game_stats_json: Optional[str] = None,
+    language: str = "english",
+    game_stats_dict: Optional[dict] = None,
+) -> AsyncIterator[str]:
+    """
+    Stream coaching advice using the provided session.
+
+    Same turn as get_coach_advice, but yields text chunks as the LLM generates
+    them so callers can start speaking before the full response is ready.
+    Message history is updated once the stream completes.
+
+    Args:
+        session: Session object containing agent and message history
+        user_question: User's transcribed question text
+        game_stats_json: Fresh game statistics JSON (not needed when game_stats_dict is given)
+        language: Language for the response (default: "english")
+        game_stats_dict: Fresh game statistics, already decoded by the caller
+
+    Yields:
+        Coaching advice text chunks
+
+    Raises:
+        Exception: If API call fails or processing error occurs
+    """
+    logger.info("Streaming coach advice - Username: %s, Match: %s", session.username, session.match_id)
+    logger.info("User question: %s", user_question)
+
+    try:
+        agent, messages, history_question = _prepare_coach_turn(
+            session, user_question, game_stats_json, language, game_stats_dict
+        )
+
+        parts: List[str] = []
+        async for chunk, _metadata in agent.astream({"messages": messages}, stream_mode="messages"):
+            if isinstance(chunk, AIMessageChunk) and isinstance(chunk.content, str) and chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+
+        advice = "".join(parts)
+        logger.info("Agent streamed response: %s", advice[:200])
+
+        # Add user question and assistant response to message history
+        session.message_history.add_user_message(history_question)
+        session.message_history.add_assistant_message(advice)
+
+    except ResourceExhausted as e:
+        logger.error("Coach LLM API quota exceeded (%s): %s", settings.coach_provider, str(e))
+        yield _QUOTA_EXCEEDED_MESSAGE
+
+    except Exception as e:
+        logger.error("Error in get_coach_advice_stream: %s", str(e), exc_info=True)
+        raise
@@ -4,23 +4,26 @@ Champion data management module.
 This module handles validation, loading, and retrieval of champion data from
 the data directories (champion-combos, champion-builds, champion-guide).
 
-All data is loaded into memory at import time to avoid disk I/O during requests.
+Champion combos, builds and guides are read from disk the first time a champion
+is requested and cached in memory afterwards; playbook files are loaded at import.
 """
 
+import hashlib
 import logging
+import os
+import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar, Union
 
 from app.config import settings
-from app.assistant.data_models import (
-    ChampionBuildsData,
-    ChampionCombosData,
-    ChampionGuidesData,
-    PlaybookData,
-)
+from app.assistant.data_models import PlaybookData
 
 logger = logging.getLogger(__name__)
 
+V = TypeVar("V")
+
 
 # ============================================================================
 # Validation Functions
@@ -110,106 +113,199 @@ def ensure_all_champion_data_exists() -> None:
 # ============================================================================
 
 
-def _load_champion_combos(directory: Path) -> ChampionCombosData:
-    """
-    Load all champion combo XML files into memory.
-
-    Args:
-        directory: Path to the champion-combos directory
-
-    Returns:
-        Dictionary mapping champion name (lowercase) to XML content
-    """
-    combos: ChampionCombosData = {}
+# Per-role champion files: "<champion>-<build|guide>-<role>.xml"
+_ROLE_FILE_PATTERN = re.compile(r"^.+-(?:build|guide)-(\w+)\.xml$")
 
-    for combo_file in directory.glob("*.xml"):
-        try:
-            combos[combo_file.stem.lower()] = combo_file.read_text(
-                encoding="utf-8"
-            )
-        except Exception as exc:
-            logger.error("Failed to load combo file %s: %s", combo_file, exc)
 
-    logger.info("Loaded %d champion combo files into memory", len(combos))
-    return combos
+def _read_bytes(path: Union[str, Path]) -> Optional[bytes]:
+    """Read a file as raw bytes, logging and returning None on failure."""
+    try:
+        with open(path, "rb") as file:
+            return file.read()
+    except Exception as exc:
+        logger.error("Failed to read data file %s: %s", path, exc)
+        return None
 
 
-def _load_champion_builds(directory: Path) -> ChampionBuildsData:
+def _read_all_text(paths: Sequence[Union[str, Path]]) -> List[Optional[str]]:
     """
-    Load all champion build XML files into memory.
+    Read UTF-8 files one after another.
+
+    Champion data is loaded lazily a handful of small files at a time, so a
+    thread pool would cost more to spin up than the reads it overlaps.
 
     Args:
-        directory: Path to the champion-builds directory
+        paths: Files to read
 
     Returns:
-        Nested dictionary mapping champion name -> role -> XML content
-        Example: {"aatrox": {"jungle": "<xml>...</xml>", ...}}
+        Decoded contents in the same order as paths (None for failed reads)
     """
-    builds: ChampionBuildsData = {}
-
-    for champion_dir in directory.iterdir():
-        if not champion_dir.is_dir():
+    contents: List[Optional[str]] = []
+    for path in paths:
+        raw = _read_bytes(path)
+        if raw is None:
+            contents.append(None)
             continue
+        try:
+            contents.append(raw.decode("utf-8"))
+        except UnicodeDecodeError as exc:
+            logger.error("Failed to decode data file %s: %s", path, exc)
+            contents.append(None)
+    return contents
+
 
-        champion_name = champion_dir.name.lower()
-        builds[champion_name] = {}
+# Content-addressed pool so byte-identical files share a single string object
+_CONTENT_POOL: Dict[bytes, str] = {}
 
-        for build_file in champion_dir.glob("*.xml"):
-            try:
-                # Extract role from filename (e.g., "aatrox-build-jungle.xml" -> "jungle")
-                filename = build_file.stem  # e.g., "aatrox-build-jungle"
-                parts = filename.split("-")
-                if len(parts) >= 3:  # champion-build-role
-                    role = parts[-1]  # Get the last part (role)
-                    builds[champion_name][role] = build_file.read_text(
-                        encoding="utf-8"
-                    )
-            except Exception as exc:
-                logger.error("Failed to load build file %s: %s", build_file, exc)
 
-    logger.info(
-        "Loaded champion builds for %d champions into memory", len(builds)
-    )
-    return builds
+def _pooled(content: str) -> str:
+    """Return the pooled string object for content (keyed by a BLAKE2b digest)."""
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    return _CONTENT_POOL.setdefault(digest, content)
 
 
-def _load_champion_guides(directory: Path) -> ChampionGuidesData:
+def _load_champion_combo(path: str) -> Optional[str]:
     """
-    Load all champion guide XML files into memory.
+    Load a single champion combo XML file.
 
     Args:
-        directory: Path to the champion-guide directory
+        path: Path to the champion combo file
 
     Returns:
-        Nested dictionary mapping champion name -> role -> XML content
-        Example: {"aatrox": {"jungle": "<xml>...</xml>", ...}}
+        XML content, or None if the file could not be read
     """
-    guides: ChampionGuidesData = {}
+    content = _read_all_text([path])[0]
+    return _pooled(content) if content is not None else None
 
-    for champion_dir in directory.iterdir():
-        if not champion_dir.is_dir():
-            continue
 
-        champion_name = champion_dir.name.lower()
-        guides[champion_name] = {}
+def _load_champion_role_files(path: str) -> Dict[str, str]:
+    """
+    Load the per-role XML files (builds or guides) of a single champion.
+
+    Expects files named "<champion>-<kind>-<role>.xml" (e.g., "aatrox-build-jungle.xml").
 
-        for guide_file in champion_dir.glob("*.xml"):
-            try:
-                # Extract role from filename (e.g., "aatrox-guide-jungle.xml" -> "jungle")
-                filename = guide_file.stem  # e.g., "aatrox-guide-jungle"
-                parts = filename.split("-")
-                if len(parts) >= 3:  # champion-guide-role
-                    role = parts[-1]  # Get the last part (role)
-                    guides[champion_name][role] = guide_file.read_text(
-                        encoding="utf-8"
-                    )
-            except Exception as exc:
-                logger.error("Failed to load guide file %s: %s", guide_file, exc)
+    Args:
+        path: Path to the champion's build or guide directory
 
-    logger.info(
-        "Loaded champion guides for %d champions into memory", len(guides)
-    )
-    return guides
+    Returns:
+        Dictionary mapping role -> XML content
+    """
+    entries: List[Tuple[str, str]] = []
+
+    # scandir yields DirEntry objects with cached type info, avoiding a stat per entry
+    with os.scandir(path) as role_files:
+        for role_file in role_files:
+            # Extract role from filename (e.g., "aatrox-build-jungle.xml" -> "jungle")
+            match = _ROLE_FILE_PATTERN.match(role_file.name)
+            if match:
+                entries.append((sys.intern(match.group(1)), role_file.path))
+
+    roles: Dict[str, str] = {}
+    contents = _read_all_text([file_path for _, file_path in entries])
+    for (role, _), content in zip(entries, contents):
+        if content is not None:
+            roles[role] = _pooled(content)
+    return roles
+
+
+def _index_champion_combos(directory: Path) -> Dict[str, str]:
+    """Map champion name (lowercase) -> combo file path from a directory listing."""
+    index: Dict[str, str] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".xml") and entry.is_file():
+                index[sys.intern(entry.name[:-4].lower())] = entry.path
+    return index
+
+
+def _index_champion_dirs(directory: Path) -> Dict[str, str]:
+    """Map champion name (lowercase) -> per-champion directory path from a listing."""
+    index: Dict[str, str] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                index[sys.intern(entry.name.lower())] = entry.path
+    return index
+
+
+class _LazyChampionStore(Generic[V]):
+    """
+    Read-only, dict-like champion data store that loads from disk on first access.
+
+    The champion -> path index is built from a single directory listing the first
+    time the store is used; each champion's content is then read once and cached.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: Path,
+        indexer: Callable[[Path], Dict[str, str]],
+        loader: Callable[[str], Optional[V]],
+    ):
+        self._name = name
+        self._directory = directory
+        self._indexer = indexer
+        self._index: Optional[Dict[str, str]] = None
+        self._load = lru_cache(maxsize=256)(loader)
+
+    def _paths(self) -> Dict[str, str]:
+        if self._index is None:
+            self._index = self._indexer(self._directory)
+            logger.info("Indexed %d champions for %s", len(self._index), self._name)
+        return self._index
+
+    def get(self, champion: str, default: Optional[V] = None) -> Optional[V]:
+        """Get data for a champion (lowercase name), loading it on first access."""
+        path = self._paths().get(champion)
+        if path is None:
+            return default
+        content = self._load(path)
+        return default if content is None else content
+
+    def __getitem__(self, champion: str) -> V:
+        content = self.get(champion)
+        if content is None:
+            raise KeyError(champion)
+        return content
+
+    def __contains__(self, champion: object) -> bool:
+        return champion in self._paths()
+
+    def __len__(self) -> int:
+        return len(self._paths())
+
+
+class _LazyChampionRoleStore(_LazyChampionStore[Dict[str, str]]):
+    """
+    Lazy champion store for per-role data (builds, guides).
+
+    Loaded roles are also kept in a flat (champion, role) -> content dict so
+    point lookups are a single hash probe once the champion has been read.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: Path,
+        indexer: Callable[[Path], Dict[str, str]],
+        loader: Callable[[str], Optional[Dict[str, str]]],
+    ):
+        super().__init__(name, directory, indexer, loader)
+        self._by_role: Dict[Tuple[str, str], str] = {}
+
+    def get_role(self, champion: str, role: str, default: str = "") -> str:
+        """Get data for a (lowercase) champion and role, loading the champion on first access."""
+        content = self._by_role.get((champion, role))
+        if content is not None:
+            return content
+
+        roles = self.get(champion)
+        if not roles:
+            return default
+        for role_name, role_content in roles.items():
+            self._by_role[(champion, role_name)] = role_content
+        return self._by_role.get((champion, role), default)
 
 
 def _load_playbook(directory: Path) -> PlaybookData:
@@ -225,32 +321,32 @@ def _load_playbook(directory: Path) -> PlaybookData:
     """
     playbook: PlaybookData = {}
 
-    for playbook_file in directory.glob("*.txt"):
-        try:
+    playbook_files = list(directory.glob("*.txt"))
+    for playbook_file, content in zip(playbook_files, _read_all_text(playbook_files)):
+        if content is not None:
             # Use filename without extension as key
-            playbook[playbook_file.stem] = playbook_file.read_text(
-                encoding="utf-8"
-            )
-        except Exception as exc:
-            logger.error("Failed to load playbook file %s: %s", playbook_file, exc)
+            playbook[sys.intern(playbook_file.stem)] = _pooled(content)
 
     logger.info("Loaded %d playbook files into memory", len(playbook))
     return playbook
 
 
 # ============================================================================
-# Module-level data storage (loaded once at import)
+# Module-level data storage
 # ============================================================================
 
-CHAMPION_COMBOS: ChampionCombosData = _load_champion_combos(
-    settings.champion_combos_dir
+# Champion data is loaded lazily per champion: a session only needs one champion
+CHAMPION_COMBOS: _LazyChampionStore[str] = _LazyChampionStore(
+    "champion combos", settings.champion_combos_dir, _index_champion_combos, _load_champion_combo
 )
-CHAMPION_BUILDS: ChampionBuildsData = _load_champion_builds(
-    settings.champion_builds_dir
+CHAMPION_BUILDS = _LazyChampionRoleStore(
+    "champion builds", settings.champion_builds_dir, _index_champion_dirs, _load_champion_role_files
 )
-CHAMPION_GUIDES: ChampionGuidesData = _load_champion_guides(
-    settings.champion_guide_dir
+CHAMPION_GUIDES = _LazyChampionRoleStore(
+    "champion guides", settings.champion_guide_dir, _index_champion_dirs, _load_champion_role_files
 )
+
+# Playbook is small and shared by every session, so it is loaded once at import
 PLAYBOOK: PlaybookData = _load_playbook(
     settings.playbook_dir
 )
@@ -298,8 +394,7 @@ def get_champion_build(champion: str, role: str) -> str:
     Returns:
         XML content string, or empty string if not found
     """
-    builds = get_champion_builds(champion)
-    return builds.get(role.lower(), "")
+    return CHAMPION_BUILDS.get_role(champion.lower(), role.lower())
 
 
 def get_champion_guides(champion: str) -> Dict[str, str]:
@@ -326,13 +421,12 @@ def get_champion_guide(champion: str, role: str) -> str:
     Returns:
         XML content string, or empty string if not found
     """
-    guides = get_champion_guides(champion)
-    return guides.get(role.lower(), "")
+    return CHAMPION_GUIDES.get_role(champion.lower(), role.lower())
 
 
-def get_playbook_content(role: str) -> str:
+def _compute_playbook_content(role: str) -> str:
     """
-    Get playbook content for a specific role including all game phases.
+    Build playbook content for a specific role including all game phases.
 
     Combines multiple playbook files based on role, including:
     - General advice (always included)
@@ -408,9 +502,9 @@ def get_playbook_content(role: str) -> str:
     return combined_content
 
 
-def get_all_playbook_content() -> str:
+def _compute_all_playbook_content() -> str:
     """
-    Get all playbook content combined for knowledge mode.
+    Build all playbook content combined for knowledge mode.
 
     Returns all playbook files concatenated together in alphabetical order,
     providing comprehensive League of Legends strategic knowledge.
@@ -432,3 +526,42 @@ def get_all_playbook_content() -> str:
     logger.info("Loaded all %d playbook files for knowledge mode", len(content_parts))
 
     return combined_content
+
+
+# ============================================================================
+# Precomputed playbook bundles (built once at import)
+# ============================================================================
+
+_PLAYBOOK_ROLES = ("top", "jungle", "mid", "adc", "support")
+
+_PRECOMPUTED_PLAYBOOKS: Dict[str, str] = {
+    role: _compute_playbook_content(role) for role in _PLAYBOOK_ROLES
+}
+_ALL_PLAYBOOK: str = _compute_all_playbook_content()
+
+
+def get_playbook_content(role: str) -> str:
+    """
+    Get playbook content for a specific role including all game phases.
+
+    Args:
+        role: Role name (e.g., "top", "jungle", "mid", "adc", "support")
+
+    Returns:
+        Combined playbook content string with all phases
+    """
+    content = _PRECOMPUTED_PLAYBOOKS.get(role.lower())
+    if content is None:
+        logger.warning("Unknown role: %s. Cannot load playbook.", role)
+        return ""
+    return content
+
+
+def get_all_playbook_content() -> str:
+    """
+    Get all playbook content combined for knowledge mode.
+
+    Returns:
+        Combined content of all playbook files
+    """
+    return _ALL_PLAYBOOK
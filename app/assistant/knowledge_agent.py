@@ -6,32 +6,31 @@ Used when the user is not in an active game and wants to ask general questions.
 """
 
 import logging
-import warnings
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List
 
 from langchain.agents import create_agent
 from langchain_classic.agents import AgentExecutor
+from langchain_core.messages import AIMessageChunk
 from google.api_core.exceptions import ResourceExhausted
 
 from app.config import settings
-from app.assistant.knowledge_prompts import build_knowledge_prompt
+from app.assistant.knowledge_prompts import KNOWLEDGE_PROMPT
 from app.lib.langchain import ensure_llm_config, get_llm_chat
 
 ensure_llm_config()
 
 logger = logging.getLogger(__name__)
-# Silence pydantic v1-style __fields__ deprecation warnings from upstream libs
-warnings.filterwarnings(
-    "ignore",
-    message=".*__fields__.*PydanticDeprecatedSince20.*",
-)
 
 
+@lru_cache(maxsize=1)
 def create_knowledge_agent() -> AgentExecutor:
     """
-    Create a new knowledge agent for out-of-game assistance.
+    Get the knowledge agent for out-of-game assistance.
 
     Unlike the coach agent, this agent doesn't have champion-specific context
-    or game state. It answers general League of Legends questions.
+    or game state. It answers general League of Legends questions. The agent
+    holds no conversation state, so one instance is shared by all sessions.
 
     Language instruction is passed dynamically with each user message.
 
@@ -40,20 +39,55 @@ def create_knowledge_agent() -> AgentExecutor:
     """
     llm = get_llm_chat()
 
-    # Build knowledge mode system prompt (no gaming guidance section)
-    system_prompt = build_knowledge_prompt()
-
+    # Knowledge mode system prompt (no gaming guidance section)
     # Create agent without tools for text-based knowledge assistance
     agent = create_agent(
         model=llm,
         tools=[],
-        system_prompt=system_prompt,
+        system_prompt=KNOWLEDGE_PROMPT,
     )
 
     return agent
 
 
-def get_knowledge_advice(
+_QUOTA_EXCEEDED_MESSAGE = (
+    "I'm sorry, but I've reached my usage limit. Please try again in a few minutes."
+)
+
+
+def _build_knowledge_messages(session, user_question: str, language: str) -> List[Dict[str, str]]:
+    """
+    Build the message list for one knowledge turn (history window + current question).
+
+    Args:
+        session: KnowledgeSession object containing message history
+        user_question: User's transcribed question text
+        language: Language for the response
+
+    Returns:
+        Messages to pass to the knowledge agent
+    """
+    # Build messages array starting with history (text-only). History is already
+    # stored in the agent's message format, so it is used as-is.
+    historical_messages = session.message_history.get_window()
+    messages = list(historical_messages)
+
+    # Add current message with user question (no game stats in knowledge mode)
+    current_message_text = f"Answer in {language.upper()}.\n\nUser Question: {user_question}\n\nAnswer this question about League of Legends accurately. If the question is about a specific champion, answer about that champion. If the provided context does not contain info about this champion, use your own knowledge."
+
+    current_message = {
+        "role": "user",
+        "content": current_message_text
+    }
+    messages.append(current_message)
+
+    logger.info("Invoking knowledge agent with %d total messages (%d historical + 1 current)",
+               len(messages), len(historical_messages))
+
+    return messages
+
+
+async def get_knowledge_advice(
     session,
     user_question: str,
     language: str = "english",
@@ -80,31 +114,10 @@ def get_knowledge_advice(
         logger.info("Running knowledge agent with provider: %s (model: %s)",
                    settings.coach_provider, settings.coach_model)
 
-        # Build messages array starting with history (text-only)
-        messages = []
-
-        # Add historical messages (text-only)
-        historical_messages = session.message_history.get_all_messages()
-        for msg in historical_messages:
-            messages.append({
-                "role": msg["role"],
-                "content": msg["content"]
-            })
-
-        # Add current message with user question (no game stats in knowledge mode)
-        current_message_text = f"Answer in {language.upper()}.\n\nUser Question: {user_question}\n\nAnswer this question about League of Legends accurately. If the question is about a specific champion, answer about that champion. If the provided context does not contain info about this champion, use your own knowledge."
-        
-        current_message = {
-            "role": "user",
-            "content": current_message_text
-        }
-        messages.append(current_message)
+        messages = _build_knowledge_messages(session, user_question, language)
 
-        logger.info("Invoking knowledge agent with %d total messages (%d historical + 1 current)",
-                   len(messages), len(historical_messages))
-
-        # Invoke agent with messages format
-        agent_result = session.agent.invoke({"messages": messages})
+        # Invoke agent asynchronously so concurrent requests overlap on network I/O
+        agent_result = await session.agent.ainvoke({"messages": messages})
 
         # Extract text response from agent result
         response_messages = agent_result.get("messages", [])
@@ -128,8 +141,58 @@ def get_knowledge_advice(
 
     except ResourceExhausted as e:
         logger.error("Knowledge LLM API quota exceeded (%s): %s", settings.coach_provider, str(e))
-        return "I'm sorry, but I've reached my usage limit. Please try again in a few minutes."
+        return _QUOTA_EXCEEDED_MESSAGE
 
     except Exception as e:
         logger.error("Error in get_knowledge_advice: %s", str(e), exc_info=True)
         raise
+
+
+async def get_knowledge_advice_stream(
+    session,
+    user_question: str,
+    language: str = "english",
+) -> AsyncIterator[str]:
+    """
+    Stream knowledge advice using the provided session (no game stats).
+
+    Same turn as get_knowledge_advice, but yields text chunks as the LLM
+    generates them. Message history is updated once the stream completes.
+
+    Args:
+        session: KnowledgeSession object containing agent and message history
+        user_question: User's transcribed question text
+        language: Language for the response (default: "english")
+
+    Yields:
+        Knowledge advice text chunks
+
+    Raises:
+        Exception: If API call fails or processing error occurs
+    """
+    logger.info("Streaming knowledge advice - User ID: %s", session.user_id)
+    logger.info("User question: %s", user_question)
+
+    try:
+        messages = _build_knowledge_messages(session, user_question, language)
+
+        parts: List[str] = []
+        async for chunk, _metadata in session.agent.astream({"messages": messages}, stream_mode="messages"):
+            if isinstance(chunk, AIMessageChunk) and isinstance(chunk.content, str) and chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+
+        advice = "".join(parts)
+        logger.info("Knowledge agent streamed response: %s", advice[:200])
+
+        # Add user question and assistant response to message history
+        session.message_history.add_user_message(user_question)
+        session.message_history.add_assistant_message(advice)
+
+    except ResourceExhausted as e:
+        logger.error("Knowledge LLM API quota exceeded (%s): %s", settings.coach_provider, str(e))
+        yield _QUOTA_EXCEEDED_MESSAGE
+
+    except Exception as e:
+        logger.error("Error in get_knowledge_advice_stream: %s", str(e), exc_info=True)
+        raise
@@ -6,27 +6,29 @@ Reuses common sections from prompts.py where applicable.
 """
 
 import logging
+from typing import Final
 
-from app.assistant.data import get_all_playbook_content
 from app.assistant.prompts import (
-    _build_personality_section,
-    _build_safety_section,
+    _PERSONALITY_SECTION,
+    _SAFETY_SECTION,
+    _normalize,
 )
 
 logger = logging.getLogger(__name__)
 
+_KNOWLEDGE_HEADER: Final[str] = "# KNOWLEDGE MODE"
+_KNOWLEDGE_FOOTER: Final[str] = "Remember: You're a knowledgeable League assistant. Be helpful, be accurate, and ALWAYS end your response by reminding them to open League of Legends so Sensii can provide real-time coaching!"
 
-def _build_knowledge_identity_section() -> str:
-    """Build the identity section for knowledge mode."""
-    return """You are Sensii (spelled S-e-n-s-i-i), a professional League of Legends voice assistant.
+
+# Identity section for knowledge mode
+_KNOWLEDGE_IDENTITY_SECTION: Final[str] = _normalize("""You are Sensii (spelled S-e-n-s-i-i), a professional League of Legends voice assistant.
 You provide expert knowledge and guidance about League of Legends.
 
-Your Purpose: Help players learn about champions, items, strategies, and game mechanics when they're not in a match."""
+Your Purpose: Help players learn about champions, items, strategies, and game mechanics when they're not in a match.""")
 
 
-def _build_knowledge_scope_section() -> str:
-    """Build the scope section for knowledge mode."""
-    return """## Scope & Boundaries
+# Scope section for knowledge mode
+_KNOWLEDGE_SCOPE_SECTION: Final[str] = _normalize("""## Scope & Boundaries
 
 What You Handle:
 ✅ Champion abilities, lore, and playstyles
@@ -52,12 +54,11 @@ IMPORTANT: After answering the user's question, ALWAYS include a brief, friendly
 - End your response with something like: "Open up League so I can give you real-time coaching!"
 - Or: "Launch League and I can help you even more during your games!"
 - Or: "Start a match and I'll be right here to coach you live!"
-- Keep it natural and vary the wording, but always include this reminder"""
+- Keep it natural and vary the wording, but always include this reminder""")
 
 
-def _build_knowledge_brevity_section() -> str:
-    """Build brevity rules for knowledge mode."""
-    return """## BREVITY RULES
+# Brevity rules for knowledge mode
+_KNOWLEDGE_BREVITY_SECTION: Final[str] = _normalize("""## BREVITY RULES
 
 Default Mode: CONCISE BUT COMPLETE
 - Keep responses to 1-3 sentences for most questions
@@ -74,12 +75,11 @@ When to Give More Detail:
 - Complex mechanics that need clarification
 - Then give 2-4 sentences if needed
 
-Keep it natural - you're a knowledgeable friend helping them learn."""
+Keep it natural - you're a knowledgeable friend helping them learn.""")
 
 
-def _build_knowledge_input_section() -> str:
-    """Build the input structure section for knowledge mode."""
-    return """## Input Structure
+# Input structure section for knowledge mode
+_KNOWLEDGE_INPUT_SECTION: Final[str] = _normalize("""## Input Structure
 
 You will receive:
 
@@ -89,12 +89,11 @@ You will receive:
 
 **Current Request (Last Message):**
 - **User Question**: The user's transcribed question about League of Legends
-- This is their spoken question converted to text"""
+- This is their spoken question converted to text""")
 
 
-def _build_knowledge_response_format_section() -> str:
-    """Build the response format section for knowledge mode."""
-    return """## Response Format
+# Response format section for knowledge mode
+_KNOWLEDGE_RESPONSE_FORMAT_SECTION: Final[str] = _normalize("""## Response Format
 
 Provide your knowledgeable response as plain text directly answering the user's question.
 
@@ -112,12 +111,11 @@ Voice-Specific Rules:
 - No bullet points, markdown, or text formatting (this is spoken output)
 - Speak naturally like a knowledgeable friend
 - Be confident in your knowledge
-- ALWAYS end with a brief reminder to open League of Legends for better, real-time coaching"""
+- ALWAYS end with a brief reminder to open League of Legends for better, real-time coaching""")
 
 
-def _build_conflict_resolution_section() -> str:
-    """Build the conflict resolution section."""
-    return """## CONFLICT RESOLUTION & PRIORITY
+# Conflict resolution section
+_CONFLICT_RESOLUTION_SECTION: Final[str] = _normalize("""## CONFLICT RESOLUTION & PRIORITY
 
 1. **User Question Specificity**: If the user asks about a specific champion (e.g., "Lux"), item, or interaction, that is your PRIMARY focus.
 2. **Reference Material vs. Internal Knowledge**:
@@ -125,11 +123,13 @@ def _build_conflict_resolution_section() -> str:
    - It does NOT contain specific guides for most champions.
    - **CRITICAL**: If the user asks about a champion that is NOT explicitly detailed in the reference text, **IGNORE the reference text** and use your internal training data.
    - **EXAMPLE**: If user asks "How to play Lux?", and the reference text talks about "Top Lane Bruisers", **IGNORE** the reference text. Lux is a Mage/Support. Answer based on Lux.
-"""
+""")
 
 
 def _build_knowledge_base_section() -> str:
     """Build the knowledge base section with all playbook content."""
+    from app.assistant.data import get_all_playbook_content
+
     playbook_content = get_all_playbook_content()
     return f"""## General Strategy Reference (Background Context)
 
@@ -139,49 +139,23 @@ Only use this if it is relevant to the user's specific question.
 {playbook_content}"""
 
 
-def build_knowledge_prompt() -> str:
-    """
-    Build the system prompt for knowledge mode (out-of-game).
-
-    This prompt is used when the user is not in an active game and wants
-    to ask general questions about League of Legends.
-
-    Returns:
-        Complete knowledge mode system prompt
-    """
-    # Build all sections
-    identity = _build_knowledge_identity_section()
-    personality = _build_personality_section()  # Reuse from prompts.py
-    scope = _build_knowledge_scope_section()
-    safety = _build_safety_section()  # Reuse from prompts.py
-    brevity = _build_knowledge_brevity_section()
-    input_structure = _build_knowledge_input_section()
-    response_format = _build_knowledge_response_format_section()
-    conflict_resolution = _build_conflict_resolution_section()
+def _assemble_knowledge_prompt() -> str:
+    """Assemble the knowledge mode system prompt from its sections."""
+    # Assemble prompt (personality and safety sections are reused from prompts.py)
+    body = "\n\n".join((
+        _KNOWLEDGE_IDENTITY_SECTION,
+        _PERSONALITY_SECTION,
+        _KNOWLEDGE_SCOPE_SECTION,
+        _SAFETY_SECTION,
+        _KNOWLEDGE_BREVITY_SECTION,
+        _KNOWLEDGE_INPUT_SECTION,
+        _KNOWLEDGE_RESPONSE_FORMAT_SECTION,
+        _CONFLICT_RESOLUTION_SECTION,
+    ))
     knowledge_base = _build_knowledge_base_section()
+    return f"{_KNOWLEDGE_HEADER}\n\n{body}\n\n---\n{knowledge_base}\n\n---\n\n{_KNOWLEDGE_FOOTER}"
 
-    # Assemble prompt
-    return f"""# KNOWLEDGE MODE
-
-{identity}
-
-{personality}
-
-{scope}
-
-{safety}
-
-{brevity}
-
-{input_structure}
-
-{response_format}
-
-{conflict_resolution}
-
----
-{knowledge_base}
 
----
+# The knowledge prompt has no per-request inputs, so it is built once at import
+KNOWLEDGE_PROMPT: str = _assemble_knowledge_prompt()
 
-Remember: You're a knowledgeable League assistant. Be helpful, be accurate, and ALWAYS end your response by reminding them to open League of Legends so Sensii can provide real-time coaching!"""
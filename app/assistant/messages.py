@@ -5,17 +5,72 @@ Manages lightweight conversation history without game stats.
 Stores user transcripts and AI responses in memory within sessions.
 """
 import logging
-from typing import Dict, List
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, List, NamedTuple, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Bounds on retained history per session (oldest turns are evicted first)
+MAX_MESSAGES = 64
+MAX_CHARS = 20000
+
+# Message roles, indexed by Msg.role
+USER = 0
+ASSISTANT = 1
+_ROLES = ("user", "assistant")
+
+
+class Msg(NamedTuple):
+    """A single history entry (role is USER or ASSISTANT)."""
+
+    role: int
+    content: str
+
+
+def _as_dicts(messages: Iterable[Msg]) -> List[Dict[str, str]]:
+    """Materialize messages in the role/content dict format the LLM SDKs expect."""
+    return [{"role": _ROLES[role], "content": content} for role, content in messages]
+
 
 class MessageHistory:
     """Manages conversation history for a coaching session."""
 
-    def __init__(self):
-        """Initialize empty message history."""
-        self._messages: List[Dict[str, str]] = []
+    __slots__ = ("_messages", "_chars", "_window_size", "_window_len")
+
+    def __init__(self, window_size: int):
+        """
+        Initialize empty message history.
+
+        Args:
+            window_size: Number of messages kept in the window after a reset (see
+                get_window); should be even so the window starts on a user message
+        """
+        self._messages: Deque[Msg] = deque()
+        self._chars = 0
+        self._window_size = window_size
+        # Number of trailing messages in the current window (see get_window)
+        self._window_len = 0
+
+    def _append(self, message: Msg) -> None:
+        """Append a message and evict the oldest ones beyond the size/char budget."""
+        self._messages.append(message)
+        self._chars += len(message.content)
+        self._window_len += 1
+
+        while len(self._messages) > 1 and (
+            len(self._messages) > MAX_MESSAGES or self._chars > MAX_CHARS
+        ):
+            self._evict_oldest()
+        self._window_len = min(self._window_len, len(self._messages))
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest message, plus its reply so history still starts on a user turn."""
+        evicted = self._messages.popleft()
+        self._chars -= len(evicted.content)
+        if len(self._messages) > 1 and self._messages[0].role == ASSISTANT:
+            evicted = self._messages.popleft()
+            self._chars -= len(evicted.content)
 
     def add_user_message(self, content: str) -> None:
         """
@@ -24,8 +79,8 @@ class MessageHistory:
         Args:
             content: User's question transcript (text only, no game stats)
         """
-        self._messages.append({"role": "user", "content": content})
-        logger.debug(f"Added user message to history. Total messages: {len(self._messages)}")
+        self._append(Msg(USER, content))
+        logger.debug("Added user message to history. Total messages: %d", len(self._messages))
 
     def add_assistant_message(self, content: str) -> None:
         """
@@ -34,17 +89,37 @@ class MessageHistory:
         Args:
             content: Assistant's response text
         """
-        self._messages.append({"role": "assistant", "content": content})
-        logger.debug(f"Added assistant message to history. Total messages: {len(self._messages)}")
+        self._append(Msg(ASSISTANT, content))
+        # A turn ends on the assistant reply, so the window resets here and always
+        # restarts on a user message
+        if self._window_len > 2 * self._window_size:
+            self._window_len = self._window_size
+        logger.debug("Added assistant message to history. Total messages: %d", len(self._messages))
 
-    def get_all_messages(self) -> List[Dict[str, str]]:
+    def get_all_messages(self) -> Tuple[Dict[str, str], ...]:
         """
         Get all messages in history.
 
+        Returns:
+            Tuple of message dicts with 'role' and 'content' keys
+        """
+        return tuple(_as_dicts(self._messages))
+
+    def get_window(self) -> List[Dict[str, str]]:
+        """
+        Get an append-only window of recent messages.
+
+        The window grows turn by turn until it holds more than 2 * window_size
+        messages, then drops back to the most recent window_size messages. Between
+        resets each call returns the previous window plus the new turns, so the
+        prompt prefix stays identical across turns and provider-side prompt caches
+        keep hitting.
+
         Returns:
             List of message dicts with 'role' and 'content' keys
         """
-        return self._messages.copy()
+        total = len(self._messages)
+        return _as_dicts(islice(self._messages, total - self._window_len, total))
 
     def get_message_count(self) -> int:
         """Get the total number of messages in history."""
@@ -53,6 +128,8 @@ class MessageHistory:
     def clear(self) -> None:
         """Clear all messages from history."""
         self._messages.clear()
+        self._chars = 0
+        self._window_len = 0
         logger.debug("Cleared message history")
 
     def __repr__(self) -> str:
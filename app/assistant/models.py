@@ -4,7 +4,7 @@ Assistant Models
 Pydantic models for assistant responses.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CoachResponse(BaseModel):
@@ -15,6 +15,8 @@ class CoachResponse(BaseModel):
     the current game state, player question, and strategic context.
     """
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     user_question: str = Field(
         description="A clear transcript of what the user asked in the input audio file in the last message."
     )
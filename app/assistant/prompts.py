@@ -1,4 +1,6 @@
 import logging
+import re
+from typing import TYPE_CHECKING, Final, Union
 
 from app.assistant.data import (
     get_champion_guide,
@@ -6,8 +8,10 @@ from app.assistant.data import (
     get_champion_build,
     get_playbook_content,
 )
-from app.utils.game_stats.models import MatchState
-from app.utils.game_stats.report import ReportGenerator
+from app.models.role import Role
+
+if TYPE_CHECKING:
+    from app.utils.game_stats.models import MatchState
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +21,13 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
-def build_game_state_report(state: MatchState) -> str:
+def build_game_state_report(state: "MatchState") -> str:
     """
     Build a formatted game state report from a parsed MatchState.
     """
+    # Imported lazily so knowledge-only processes never load the report module
+    from app.utils.game_stats.report import ReportGenerator
+
     return ReportGenerator.generate(state)
 
 
@@ -29,16 +36,23 @@ def build_game_state_report(state: MatchState) -> str:
 # ============================================================================
 
 
-def _build_identity_section() -> str:
-    """Build the identity and role definition section."""
-    return """You are Sensii, a League of Legends voice coach. You deliver game knowledge fast and clear during live matches.
+_TRAILING_WHITESPACE = re.compile(r"[ \t]+\n")
+_BLANK_LINE_RUNS = re.compile(r"\n{3,}")
+
+
+def _normalize(text: str) -> str:
+    """Strip trailing whitespace and collapse blank-line runs (fewer prompt tokens)."""
+    return _BLANK_LINE_RUNS.sub("\n\n", _TRAILING_WHITESPACE.sub("\n", text)).strip()
+
 
-Your job: Answer questions about the game. Be quick, be accurate, get to the point."""
+# Identity and role definition section
+_IDENTITY_SECTION: Final[str] = _normalize("""You are Sensii, a League of Legends voice coach. You deliver game knowledge fast and clear during live matches.
 
+Your job: Answer questions about the game. Be quick, be accurate, get to the point.""")
 
-def _build_personality_section() -> str:
-    """Build the personality and tone guidelines section."""
-    return """## Personality
+
+# Personality and tone guidelines section
+_PERSONALITY_SECTION: Final[str] = _normalize("""## Personality
 
 You're a knowledgeable teammate on comms. Casual, direct, confident.
 
@@ -48,40 +62,34 @@ You're a knowledgeable teammate on comms. Casual, direct, confident.
 If user's latest message is aggressive or toxic toward you:
 - Match their energy with a short roast (still under 20 words)
 - Example: "You're 0/7 and asking ME what's wrong? Skill issue."
-- Then answer their question in the same breath"""
+- Then answer their question in the same breath""")
 
 
-def _build_knowledge_hierarchy() -> str:
-    """
-    Build the source of truth hierarchy.
-    Crucial for preventing hallucinations in 'Flash Lite' models.
-    """
-    return """## Knowledge Hierarchy
+# Source of truth hierarchy
+# Crucial for preventing hallucinations in 'Flash Lite' models
+_KNOWLEDGE_HIERARCHY_SECTION: Final[str] = _normalize("""## Knowledge Hierarchy
 
 1. **Game State Report:** This is the absolute truth of the current moment.
 2. **Champion XML:** This is the absolute truth for abilities and combos. NEVER deviate from the combos listed in the XML.
 3. **Strategic Playbook:** High-level strategic advice for your role and game phase. Use this for macro decisions and general strategy.
-4. **Internal Knowledge:** Use this ONLY for slang and tone. Do not use it for specific ability mechanics."""
+4. **Internal Knowledge:** Use this ONLY for slang and tone. Do not use it for specific ability mechanics.""")
 
 
-def _build_scope_section() -> str:
-    """Build the scope and boundaries section."""
-    return """## Scope
+# Scope and boundaries section
+_SCOPE_SECTION: Final[str] = _normalize("""## Scope
 
-You only answer League of Legends questions. Off-topic? Just say "I only do League." """
+You only answer League of Legends questions. Off-topic? Just say "I only do League." """)
 
 
-def _build_safety_section() -> str:
-    """Build the safety guardrails section."""
-    return """## Hard Limits
+# Safety guardrails section
+_SAFETY_SECTION: Final[str] = _normalize("""## Hard Limits
 
 1. Never encourage cheating, exploits, or actual harassment of real people.
-2. **Data Integrity:** Verify ability keys (Q/W/E/R) against the provided XML context. Never assign the wrong effect to a key (e.g., do not claim 'E' is a shield if the XML says 'W')."""
+2. **Data Integrity:** Verify ability keys (Q/W/E/R) against the provided XML context. Never assign the wrong effect to a key (e.g., do not claim 'E' is a shield if the XML says 'W').""")
 
 
-def _build_response_rules_section() -> str:
-    """Build the consolidated response rules section."""
-    return """## Response Rules
+# Consolidated response rules section
+_RESPONSE_RULES_SECTION: Final[str] = _normalize("""## Response Rules
 
 BE EXTREMELY SHORT. Player is mid-game. Extra words get them killed.
 
@@ -109,7 +117,7 @@ Exceptions (you can elaborate):
 
 This is voice output:
 - No bullet points, no markdown, no lists
-- Speak naturally, one flowing sentence"""
+- Speak naturally, one flowing sentence""")
 
 
 # ============================================================================
@@ -117,7 +125,10 @@ This is voice output:
 # ============================================================================
 
 
-def build_playbook_prompt(role: str) -> str:
+_GAMING_GUIDANCE_HEADER: Final[str] = "# GAMING GUIDANCE"
+
+
+def build_playbook_prompt(role: Role) -> str:
     """
     Build the strategic playbook section for the system prompt.
 
@@ -125,7 +136,7 @@ def build_playbook_prompt(role: str) -> str:
     strategic guidance throughout the entire game.
 
     Args:
-        role: Player's role (e.g., "top", "jungle", "mid", "adc", "support")
+        role: Player's role (e.g., Role.TOP, Role.JUNGLE)
 
     Returns:
         Formatted playbook section string
@@ -137,7 +148,7 @@ def build_playbook_prompt(role: str) -> str:
         logger.error("No playbook content found for role=%s", role)
         return ""
 
-    return f"\n\n## Strategic Playbook\n{playbook_content}"
+    return f"## Strategic Playbook\n{playbook_content}"
 
 
 def build_champion_guide_prompt(champion: str, role: str) -> str:
@@ -149,7 +160,7 @@ def build_champion_guide_prompt(champion: str, role: str) -> str:
         logger.error("No guide found for champion=%s, role=%s", champion, role)
         return ""
 
-    return f"\n\n## Champion Guide\n{guide_xml}"
+    return f"## Champion Guide\n{guide_xml}"
 
 
 def build_champion_combos_prompt(champion: str) -> str:
@@ -164,7 +175,7 @@ def build_champion_combos_prompt(champion: str) -> str:
         logger.warning("No combo data found for champion=%s", champion)
         return ""
 
-    return f"\n\n## Champion Combos\n{combo_xml}"
+    return f"## Champion Combos\n{combo_xml}"
 
 
 def build_champion_builds_prompt(champion: str, role: str) -> str:
@@ -176,69 +187,70 @@ def build_champion_builds_prompt(champion: str, role: str) -> str:
         logger.warning("No build data found for champion=%s, role=%s", champion, role)
         return ""
 
-    return f"\n\n## Champion Build\n{build_xml}"
+    return f"## Champion Build\n{build_xml}"
 
 
-def build_gaming_guidance_section(champion: str, role: str) -> str:
+def build_gaming_guidance_section(champion: str, role: Union[Role, str]) -> str:
     """
     Build the Gaming Guidance section with all champion-specific data.
 
-    This section contains all the game data needed for the agent to function:
-    - Player's champion and role information
+    This section contains all the game data needed for the agent to function,
+    ordered from least to most specific so prompt prefixes are shared as widely
+    as possible:
     - Strategic playbook (role-specific with all game phases)
     - Champion guide (champion-specific tips for role)
     - Champion combos (ability rotations and sequences)
     - Champion builds (items, runes, skill order)
+    - Player's champion and role information
 
     Args:
         champion: Champion name (e.g., "aatrox", "ahri")
-        role: Player's role (e.g., "top", "jungle", "mid", "adc", "support")
+        role: Player's role (Role or case-insensitive role name)
 
     Returns:
         Complete gaming guidance section string
     """
+    champion = champion.lower().strip()
+    role = Role.parse(role)
     logger.info("Building gaming guidance section for champion=%s, role=%s (all phases)",
                 champion, role)
 
-    # Champion context
-    champion_context = f"""# GAMING GUIDANCE
-
-## Player Context
+    # Champion context goes last: champion/role names are the most volatile
+    # tokens, so keeping them at the tail maximizes the cacheable prefix
+    champion_context = f"""## Player Context
 - Champion: {champion.capitalize()}
-- Role: {role.upper()}
-- Position: {role.capitalize()}"""
-
-    # Get all game data sections
-    playbook = build_playbook_prompt(role)
-    champion_guide = build_champion_guide_prompt(champion, role)
-    champion_combos = build_champion_combos_prompt(champion)
-    champion_builds = build_champion_builds_prompt(champion, role)
+- Role: {role.upper_name}
+- Position: {role.display}"""
+
+    # Get all game data sections (missing data yields empty strings, dropped below)
+    sections = (
+        _GAMING_GUIDANCE_HEADER,
+        build_playbook_prompt(role),
+        build_champion_guide_prompt(champion, role),
+        build_champion_combos_prompt(champion),
+        build_champion_builds_prompt(champion, role),
+        champion_context,
+    )
 
     # Combine all sections
-    return f"""{champion_context}{playbook}{champion_guide}{champion_combos}{champion_builds}"""
+    return "\n\n".join(section for section in sections if section)
 
 
 def build_coach_prompt() -> str:
     """
     Build the BASE PROMPT for Sensii voice assistant.
     """
-    # Build all base prompt sections
-    identity = _build_identity_section()
-    personality = _build_personality_section()
-    hierarchy = _build_knowledge_hierarchy()  # Added Hierarchy
-    scope = _build_scope_section()
-    safety = _build_safety_section()
-    response_rules = _build_response_rules_section()
-
     # Assemble base prompt
-    return f"""{identity}
-
-{personality}
-
-{hierarchy}
-
-{scope}
-
-{safety}
-
-{response_rules}"""
\ No newline at end of file
+    return "\n\n".join((
+        _IDENTITY_SECTION,
+        _PERSONALITY_SECTION,
+        _KNOWLEDGE_HIERARCHY_SECTION,
+        _SCOPE_SECTION,
+        _SAFETY_SECTION,
+        _RESPONSE_RULES_SECTION,
+    ))
+
+
+# Static base prompt, identical for every champion and role. Always sent first
+# so provider-side prompt caching can reuse it across all coach agents.
+COACH_PROMPT_STATIC = build_coach_prompt()
@@ -9,21 +9,43 @@ Supports two session types:
 Each session is keyed by a (identifier, session_type) combination.
 """
 import asyncio
+import heapq
 import logging
+import random
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from langchain_classic.agents import AgentExecutor
 
 from app.assistant.agent import create_coach_agent
 from app.assistant.messages import MessageHistory
+from app.config import settings
 from app.models.game_stats import GameStats
+from app.models.role import Role
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long the cleanup task sleeps between expiry checks
+_MAX_CLEANUP_INTERVAL_SECONDS = 20 * 60
 
-def _normalize_position_to_role(position: str) -> str:
+# Chance that a session lookup also evicts up to _INLINE_EVICTION_MAX_ITEMS due sessions
+_INLINE_EVICTION_PROBABILITY = 0.01
+_INLINE_EVICTION_MAX_ITEMS = 32
+
+
+# Game stats position -> internal role
+_POSITION_TO_ROLE: Dict[str, Role] = {
+    "TOP": Role.TOP,
+    "JUNGLE": Role.JUNGLE,
+    "MIDDLE": Role.MID,
+    "BOTTOM": Role.ADC,
+    "UTILITY": Role.SUPPORT,
+}
+
+
+def _normalize_position_to_role(position: str) -> Role:
     """
     Convert game stats position format to internal role format.
 
@@ -34,25 +56,18 @@ def _normalize_position_to_role(position: str) -> str:
         position: Position string from game stats (e.g., "TOP", "MIDDLE", "UTILITY")
 
     Returns:
-        Normalized role string (e.g., "top", "mid", "support")
+        Normalized Role (e.g., Role.TOP, Role.MID, Role.SUPPORT)
     """
-    position_to_role_map = {
-        "TOP": "top",
-        "JUNGLE": "jungle",
-        "MIDDLE": "mid",
-        "BOTTOM": "adc",
-        "UTILITY": "support",
-    }
-
-    normalized_role = position_to_role_map.get(position.upper())
+    # Game stats already send uppercase positions, so try the exact key first
+    normalized_role = _POSITION_TO_ROLE.get(position) or _POSITION_TO_ROLE.get(position.upper())
 
     if normalized_role is None:
         logger.warning(
             "Unknown position '%s' from game stats. Expected one of: %s",
             position,
-            ", ".join(position_to_role_map.keys())
+            ", ".join(_POSITION_TO_ROLE)
         )
-        return "unknown"
+        return Role.UNKNOWN
 
     return normalized_role
 
@@ -69,13 +84,16 @@ class BaseSession(ABC):
             ttl_hours: Session time-to-live in hours (default: 2)
         """
         self.agent = agent
-        self.message_history = MessageHistory()
+        self.message_history = MessageHistory(settings.message_history_window)
         self.created_at = datetime.now()
+        # Wall-clock expiry is kept for display; expiry checks use the monotonic
+        # deadline, which is cheaper to compare and immune to clock changes
         self.expires_at = self.created_at + timedelta(hours=ttl_hours)
+        self.expires_monotonic = time.monotonic() + ttl_hours * 3600
 
     def is_expired(self) -> bool:
         """Check if session has exceeded TTL."""
-        return datetime.now() >= self.expires_at
+        return time.monotonic() >= self.expires_monotonic
 
     @abstractmethod
     def get_session_key(self) -> Tuple[str, str]:
@@ -95,7 +113,7 @@ class GameSession(BaseSession):
         username: str,
         match_id: str,
         game_start_time: float,
-        role: str,
+        role: Role,
         champion: str,
         agent: AgentExecutor,
     ):
@@ -106,7 +124,7 @@ class GameSession(BaseSession):
             username: Player's Riot ID (e.g., "AliVampire#S2Q")
             match_id: Unique match identifier from client
             game_start_time: Game time in seconds when session was created
-            role: Player's role in normalized format (e.g., "top", "jungle", "mid", "adc", "support")
+            role: Player's role (e.g., Role.TOP, Role.JUNGLE)
             champion: Champion name (e.g., "Braum")
             agent: LangChain agent executor for this session
         """
@@ -176,12 +194,53 @@ class SessionManager:
 
     def __init__(self):
         """Initialize session manager with empty storage."""
-        self._sessions: Dict[Tuple[str, str], BaseSession] = {}
-        self._cleanup_task: Optional[asyncio.Task] = None
+        self._sessions: Dict[str, BaseSession] = {}
+        # Min-heap of (expires_monotonic, key); entries for replaced/removed sessions are
+        # skipped lazily when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Strong references to running background tasks; each task removes
+        # itself when done so finished tasks don't pin the manager
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    def _store_session(self, key: str, session: BaseSession) -> None:
+        """Store a session and schedule its expiry."""
+        self._sessions[key] = session
+        heapq.heappush(self._expiry_heap, (session.expires_monotonic, key))
+
+    def _pop_expired_sessions(self, max_items: Optional[int] = None) -> List[BaseSession]:
+        """
+        Remove and return sessions whose expiry time has passed.
+
+        Only heap entries that are actually due are touched, so the cost is
+        proportional to the number of expirations rather than live sessions.
+
+        Args:
+            max_items: Maximum number of heap entries to pop (None for no limit)
+        """
+        now = time.monotonic()
+        expired: List[BaseSession] = []
+        popped = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            if max_items is not None and popped >= max_items:
+                break
+            popped += 1
+            expires_monotonic, key = heapq.heappop(self._expiry_heap)
+            session = self._sessions.get(key)
+            # Stale entry: session was replaced or already removed
+            if session is None or session.expires_monotonic != expires_monotonic:
+                continue
+            del self._sessions[key]
+            expired.append(session)
+        return expired
+
+    def _get_key(self, identifier: str, session_type: str) -> str:
+        """
+        Generate session key from identifier and session type.
 
-    def _get_key(self, identifier: str, session_type: str) -> Tuple[str, str]:
-        """Generate session key from identifier and session type."""
-        return (identifier, session_type)
+        Keys are flat strings joined with a unit separator (which can't appear in
+        Riot IDs or user IDs), so lookups hash one string instead of a tuple.
+        """
+        return f"{identifier}\x1f{session_type}"
 
     def get_session(self, identifier: str, session_type: str) -> Optional[BaseSession]:
         """
@@ -194,6 +253,12 @@ class SessionManager:
         Returns:
             Session if found and not expired, None otherwise
         """
+        # Occasionally evict a few due sessions inline so cleanup cost is spread
+        # across requests instead of piling up for the background sweep
+        if random.random() < _INLINE_EVICTION_PROBABILITY:
+            for expired in self._pop_expired_sessions(max_items=_INLINE_EVICTION_MAX_ITEMS):
+                logger.info(f"Evicted expired session: {expired}")
+
         key = self._get_key(identifier, session_type)
         session = self._sessions.get(key)
 
@@ -223,7 +288,7 @@ class SessionManager:
         username: str,
         match_id: str,
         game_start_time: float,
-        role: str,
+        role: Role,
         champion: str,
         agent: AgentExecutor,
     ) -> GameSession:
@@ -255,7 +320,7 @@ class SessionManager:
             champion=champion,
             agent=agent,
         )
-        self._sessions[key] = session
+        self._store_session(key, session)
 
         logger.info(f"Created new game session: {session}")
         return session
@@ -285,30 +350,13 @@ class SessionManager:
             user_id=user_id,
             agent=agent,
         )
-        self._sessions[key] = session
+        self._store_session(key, session)
 
         logger.info(f"Created new knowledge session: {session}")
         return session
 
-    # Legacy method for backward compatibility
-    def create_session(
-        self,
-        username: str,
-        match_id: str,
-        game_start_time: float,
-        role: str,
-        champion: str,
-        agent: AgentExecutor,
-    ) -> GameSession:
-        """Legacy method - use create_game_session instead."""
-        return self.create_game_session(
-            username=username,
-            match_id=match_id,
-            game_start_time=game_start_time,
-            role=role,
-            champion=champion,
-            agent=agent,
-        )
+    # Legacy name for backward compatibility - use create_game_session instead
+    create_session = create_game_session
 
     def get_or_create_session(
         self,
@@ -339,12 +387,12 @@ class SessionManager:
         username = active_player.get("riotId", "unknown")
 
         # Extract GameStart event time as unique session identifier
-        game_start_time = 0.0
-        events_list = events.get("Events", [])
-        for event in events_list:
-            if event.get("EventName") == "GameStart":
-                game_start_time = event.get("EventTime", 0.0)
-                break
+        # (GameStart is normally the first event, so the scan exits immediately)
+        game_start_event = next(
+            (event for event in events.get("Events", []) if event.get("EventName") == "GameStart"),
+            None,
+        )
+        game_start_time = game_start_event.get("EventTime", 0.0) if game_start_event else 0.0
 
         # Use GameStart time as match_id (unique identifier for this game session)
         session_match_id = f"game_{game_start_time}"
@@ -356,17 +404,15 @@ class SessionManager:
             logger.info(f"Reusing existing session: {session}")
             return session
 
-        # Extract champion, role, and team from active player in allPlayers array
-        all_players = game_stats_dict.get("allPlayers", [])
-        champion = "unknown"
-        raw_position = "UNKNOWN"
-        team = None
-        for player in all_players:
-            if player.get("riotId") == username:
-                champion = player.get("championName", "unknown")
-                raw_position = player.get("position", "UNKNOWN")
-                team = player.get("team", None)
-                break
+        # Extract champion, role, and team from active player in allPlayers array.
+        # Only done when creating a session; reused sessions return above.
+        active_entry = next(
+            (player for player in game_stats_dict.get("allPlayers", []) if player.get("riotId") == username),
+            {},
+        )
+        champion = active_entry.get("championName", "unknown")
+        raw_position = active_entry.get("position", "UNKNOWN")
+        team = active_entry.get("team", None)
 
         # Normalize position to internal role format
         # Game stats: TOP/JUNGLE/MIDDLE/BOTTOM/UTILITY → System: top/jungle/mid/adc/support
@@ -430,43 +476,67 @@ class SessionManager:
         return session
 
     async def _cleanup_expired_sessions(self):
-        """Background task to remove expired sessions every 20 minutes."""
+        """
+        Background task to remove expired sessions.
+
+        Sleeps until the earliest scheduled expiry (at most 20 minutes, so
+        sessions created while idle are still picked up), then evicts only the
+        sessions that are due.
+        """
         while True:
             try:
-                await asyncio.sleep(20 * 60)  # 20 minutes
+                delay = _MAX_CLEANUP_INTERVAL_SECONDS
+                if self._expiry_heap:
+                    until_next = self._expiry_heap[0][0] - time.monotonic()
+                    delay = min(max(until_next, 0.0), delay)
+                await asyncio.sleep(delay)
 
-                expired_keys = [
-                    key for key, session in self._sessions.items()
-                    if session.is_expired()
-                ]
+                expired_sessions = self._pop_expired_sessions()
 
-                for key in expired_keys:
-                    session = self._sessions.pop(key)
+                for session in expired_sessions:
                     logger.info(f"Cleaned up expired session: {session}")
 
-                if expired_keys:
-                    logger.info(f"Removed {len(expired_keys)} expired session(s)")
+                if expired_sessions:
+                    logger.info(f"Removed {len(expired_sessions)} expired session(s)")
                 else:
                     logger.debug("No expired sessions to clean up")
 
+            except asyncio.CancelledError:
+                logger.debug("Session cleanup task cancelled")
+                break
+
             except Exception as e:
                 logger.error(f"Error in session cleanup task: {e}", exc_info=True)
 
     def start_cleanup_task(self):
         """Start the background cleanup task."""
-        if self._cleanup_task is None or self._cleanup_task.done():
-            self._cleanup_task = asyncio.create_task(self._cleanup_expired_sessions())
-            logger.info("Started session cleanup background task (runs every 20 minutes)")
-
-    def stop_cleanup_task(self):
-        """Stop the background cleanup task."""
-        if self._cleanup_task and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
-            logger.info("Stopped session cleanup background task")
+        if self._background_tasks:
+            return
+        task = asyncio.create_task(self._cleanup_expired_sessions())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        logger.info("Started session cleanup background task")
+
+    async def stop_cleanup_task(self):
+        """Stop the background cleanup task and wait for it to finish."""
+        if not self._background_tasks:
+            return
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("Stopped session cleanup background task")
 
     def get_active_session_count(self) -> int:
-        """Get count of non-expired sessions."""
-        return sum(1 for session in self._sessions.values() if not session.is_expired())
+        """
+        Get count of non-expired sessions.
+
+        Due sessions are popped from the expiry heap first, so every remaining
+        stored session is active and the count is just the dict size.
+        """
+        for expired in self._pop_expired_sessions():
+            logger.info(f"Evicted expired session: {expired}")
+        return len(self._sessions)
 
 
 # Global session manager instance
@@ -5,19 +5,46 @@ This module provides audio transcription using OpenAI Whisper API.
 Optimized for WAV audio format with support for multiple languages.
 """
 
-import io
 import logging
+from functools import lru_cache
 from typing import Optional
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI
 
 from app.config import settings
 from app.models.language import get_language_code
 
 logger = logging.getLogger(__name__)
 
+# Context prompt sent with every transcription request
+_TRANSCRIPTION_PROMPT = (
+    "This is a user's verbal request for an AI League of Legends coaching application.\n"
+    "The speech will be a question or request, potentially containing background noise, accents, "
+    "and gaming slang (e.g., 'gank', 'CS', 'peel', 'flash', champion names, item names, "
+    "lane names like 'mid', 'top').\n"
+    "Transcribe the audio verbatim and ONLY in the language spoken.\n"
+    "Preserve all proper nouns, game terms, and slang as they are spoken, including mixed "
+    "languages/code-switching.\n"
+    "Do not translate. Maintain proper punctuation and capitalization."
+)
+
+
+@lru_cache(maxsize=1)
+def _client() -> AsyncOpenAI:
+    """Get the shared async OpenAI client so its connection pool is reused across calls."""
+    logger.info("Using transcription context prompt (%d characters)", len(_TRANSCRIPTION_PROMPT))
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        ),
+    )
+
 
-def transcribe_audio(
+async def transcribe_audio(
         audio_bytes: bytes,
         language: Optional[str] = "english",
 ) -> str:
@@ -49,26 +76,18 @@ def transcribe_audio(
     )
 
     try:
-        # Initialize OpenAI client
-        client = OpenAI(api_key=settings.openai_api_key)
-
-        # Create file-like object from bytes (always WAV format)
-        audio_file = io.BytesIO(audio_bytes)
-        audio_file.name = "audio.wav"
+        client = _client()
 
         # Call OpenAI API
         logger.debug("Calling OpenAI Audio API...")
-        transcript = client.audio.transcriptions.create(
-            file=audio_file,
+        transcript = await client.audio.transcriptions.create(
+            # (filename, content, content type) tuple avoids copying into a BytesIO
+            file=("audio.wav", audio_bytes, "audio/wav"),
             model="gpt-4o-transcribe",
             response_format="text",
             language=get_language_code(language) if language else None,
             temperature=0.2,
-            prompt="""This is a user's verbal request for an AI League of Legends coaching application. 
-            The speech will be a question or request, potentially containing background noise, accents, and gaming slang (e.g., 'gank', 'CS', 'peel', 'flash', champion names, item names, lane names like 'mid', 'top').
-            Transcribe the audio verbatim and ONLY in the language spoken.
-            Preserve all proper nouns, game terms, and slang as they are spoken, including mixed languages/code-switching.
-            Do not translate. Maintain proper punctuation and capitalization.""",
+            prompt=_TRANSCRIPTION_PROMPT,
         )
 
         logger.info(
@@ -1,52 +1,207 @@
+import asyncio
+import logging
+import re
+import struct
+from functools import lru_cache
+from typing import AsyncGenerator, AsyncIterator, Optional
 
-from typing import AsyncGenerator
-
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
 
-async def text_to_speech_stream(text: str) -> AsyncGenerator[bytes, None]:
-    """
-    Convert text to speech using OpenAI TTS API with async streaming.
+# Minimum size of audio chunks yielded by text_to_speech_stream
+_STREAM_CHUNK_SIZE = 16 * 1024
 
-    Uses OpenAI's with_streaming_response.create() for efficient async streaming.
-    This is the recommended approach for async frameworks like FastAPI.
+# Long-lived TTS streams shouldn't starve the pool; HTTP/2 lets concurrent
+# streams share one TLS connection
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
 
-    Args:
-        text: Text to convert to speech
+# OpenAI "pcm" output: 24kHz, 16-bit signed little-endian, mono
+_PCM_SAMPLE_RATE = 24000
+_PCM_CHANNELS = 1
+_PCM_SAMPLE_WIDTH = 2
+
+# WAV header for a stream of unknown length (RIFF/data sizes set to the max)
+_STREAMING_WAV_HEADER = (
+    b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE"
+    + b"fmt " + struct.pack(
+        "<IHHIIHH",
+        16,
+        1,
+        _PCM_CHANNELS,
+        _PCM_SAMPLE_RATE,
+        _PCM_SAMPLE_RATE * _PCM_CHANNELS * _PCM_SAMPLE_WIDTH,
+        _PCM_CHANNELS * _PCM_SAMPLE_WIDTH,
+        _PCM_SAMPLE_WIDTH * 8,
+    )
+    + b"data" + struct.pack("<I", 0xFFFFFFFF)
+)
+
+# Sentence boundary: terminal punctuation followed by whitespace, or a CJK terminator
+_SENTENCE_END = re.compile(r"[.!?](?:\s+)|[。！？]")
+
+# Words whose trailing period doesn't end a sentence (compared lowercased, without the period)
+_ABBREVIATIONS = frozenset({"e.g", "i.e", "vs", "approx", "lvl", "min", "sec", "mr", "mrs", "dr", "st"})
+
+# Short sentences are merged so each TTS request carries a useful amount of text
+_MIN_SEGMENT_CHARS = 40
 
-    Yields:
-        Audio chunks as bytes
-    """
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
 
+@lru_cache(maxsize=1)
+def _client() -> AsyncOpenAI:
+    """Get the shared async OpenAI client so its connection pool is reused across requests."""
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        http_client=httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+    )
+
+
+@lru_cache(maxsize=1)
+def _sync_client() -> OpenAI:
+    """Get the shared sync OpenAI client used by text_to_speech."""
+    return OpenAI(
+        api_key=settings.openai_api_key,
+        http_client=httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+    )
+
+
+async def _stream_speech(
+    client: AsyncOpenAI,
+    text: str,
+    response_format: str = "wav",
+) -> AsyncGenerator[bytes, None]:
+    """Stream synthesized audio for text using the given client."""
     # Use with_streaming_response for direct HTTP response streaming
     async with client.audio.speech.with_streaming_response.create(
         model=settings.openai_tts_model,
         voice=settings.openai_tts_voice,
         input=text,
         speed=settings.openai_tts_speed,
-        response_format="wav",
+        response_format=response_format,
     ) as response:
         # Stream the raw bytes from the HTTP response
         async for chunk in response.iter_bytes():
             yield chunk
 
 
-def text_to_speech(text: str) -> bytes:
+async def text_to_speech_stream(text: str) -> AsyncGenerator[bytes, None]:
     """
-    Synchronous version for backward compatibility.
-    Collects all chunks from the async streaming generator.
+    Convert text to speech using OpenAI TTS API with async streaming.
+
+    Uses OpenAI's with_streaming_response.create() for efficient async streaming.
+    This is the recommended approach for async frameworks like FastAPI.
+
+    Args:
+        text: Text to convert to speech
+
+    Yields:
+        Audio chunks as bytes
     """
-    import asyncio
+    # Coalesce small HTTP chunks so each yield carries a reasonably sized frame
+    buffer = bytearray()
+    async for chunk in _stream_speech(_client(), text):
+        buffer += chunk
+        if len(buffer) >= _STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
 
-    async def collect_chunks():
-        chunks = []
-        async for chunk in text_to_speech_stream(text):
-            chunks.append(chunk)
-        return b''.join(chunks)
 
-    return asyncio.run(collect_chunks())
+def _ends_with_abbreviation(text: str, match: re.Match) -> bool:
+    """Whether a sentence-end match is really the period of an abbreviation like "e.g."."""
+    if not match.group().startswith("."):
+        return False
+    words = text[:match.start()].rsplit(None, 1)
+    return bool(words) and words[-1].lower() in _ABBREVIATIONS
 
 
+async def _split_sentences(text_stream: AsyncIterator[str]) -> AsyncGenerator[str, None]:
+    """Regroup streamed text deltas into sentence-aligned segments."""
+    pending = ""
+    async for delta in text_stream:
+        pending += delta
+        cut = 0
+        for match in _SENTENCE_END.finditer(pending):
+            if match.end() >= _MIN_SEGMENT_CHARS and not _ends_with_abbreviation(pending, match):
+                cut = match.end()
+        if cut:
+            segment, pending = pending[:cut].strip(), pending[cut:]
+            if segment:
+                yield segment
+    if pending.strip():
+        yield pending.strip()
+
+
+async def text_stream_to_speech(text_stream: AsyncIterator[str]) -> AsyncGenerator[bytes, None]:
+    """
+    Convert streamed text to speech sentence by sentence.
+
+    Sentences are synthesized as soon as the LLM finishes them while the rest of
+    the response keeps generating, so audio starts before the full text exists.
+    Each sentence is requested as raw PCM and emitted under a single streaming
+    WAV header, giving the client one continuous WAV stream.
+
+    Args:
+        text_stream: Async iterator of text deltas (e.g. from get_coach_advice_stream)
+
+    Yields:
+        Audio chunks as bytes, starting with the WAV header
+
+    Raises:
+        Any error from the text stream or TTS, after logging it; the response is
+        already under way at that point, so the caller can only abort it
+    """
+    segments: asyncio.Queue[Optional[str]] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            async for segment in _split_sentences(text_stream):
+                await segments.put(segment)
+        finally:
+            await segments.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        yield _STREAMING_WAV_HEADER
+        buffer = bytearray()
+        while (segment := await segments.get()) is not None:
+            async for chunk in _stream_speech(_client(), segment, response_format="pcm"):
+                buffer += chunk
+                if len(buffer) >= _STREAM_CHUNK_SIZE:
+                    yield bytes(buffer)
+                    buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+        # Surface any error raised by the text stream
+        await producer
+    except Exception:
+        # The 200 and WAV header are already sent, so the only signal left is to
+        # abort the response: re-raising makes the server drop the connection
+        # instead of ending the body cleanly, and the client sees a truncated stream
+        logger.exception("Speech stream failed mid-response; aborting")
+        raise
+    finally:
+        if not producer.done():
+            producer.cancel()
+
+
+def text_to_speech(text: str) -> bytes:
+    """
+    Synchronous version for backward compatibility.
+
+    Uses the sync OpenAI client directly, so no event loop is created per call
+    and it can be called from any thread.
+    """
+    with _sync_client().audio.speech.with_streaming_response.create(
+        model=settings.openai_tts_model,
+        voice=settings.openai_tts_voice,
+        input=text,
+        speed=settings.openai_tts_speed,
+        response_format="wav",
+    ) as response:
+        return b''.join(response.iter_bytes())
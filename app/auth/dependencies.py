@@ -10,12 +10,12 @@ from app.users.models import User
 def _parse_authorization_header(authorization: str | None) -> str:
     if not authorization:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing Authorization header")
-    try:
-        scheme, token = authorization.split(" ", 1)
-    except ValueError as exc:  # pragma: no cover - defensive
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Authorization header") from exc
-    if scheme.lower() != "bearer":
+    # Fast path: a single prefix compare and slice, no split/allocations
+    if not authorization.startswith("Bearer ") and authorization[:7].lower() != "bearer ":
+        if " " not in authorization:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Authorization header")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid auth scheme")
+    token = authorization[7:]
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing token")
     return token
@@ -34,3 +34,14 @@ async def get_current_user(token: str = Depends(get_session_token)) -> User:
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
+
+
+def forget_session_user(token: str) -> None:
+    """Drop the cached user for a session token (e.g. on logout)."""
+    try:
+        payload = decode_session_token(token)
+    except HTTPException:
+        return
+    user_id = payload.get("sub")
+    if user_id:
+        user_repository.forget_user(user_id)
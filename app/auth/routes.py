@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import RedirectResponse, Response
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 
 from app.auth import service
-from app.auth.dependencies import get_session_token, get_current_user
+from app.auth.dependencies import forget_session_user, get_session_token, get_current_user
 from app.auth.schemas import SessionCreateResponse, SessionStatusResponse, RefreshTokenRequest, RefreshTokenResponse
 from app.auth.session_store import SessionStatus, session_store
 
-router = APIRouter(prefix="/api/v1/auth", tags=["auth"])
+router = APIRouter(prefix="/api/v1/auth", tags=["auth"], default_response_class=ORJSONResponse)
 public_router = APIRouter(prefix="/auth", tags=["auth-public"])
 
 
@@ -18,12 +18,19 @@ async def create_auth_session() -> SessionCreateResponse:
     return SessionCreateResponse(session_id=data["session_id"], login_url=data["login_url"])  # type: ignore[arg-type]
 
 
-@router.get("/session/{session_id}", response_model=SessionStatusResponse)
+# Polled by clients while login is pending. The response is built from our own
+# session store, so validation is skipped (model_construct, no response_model);
+# the schema is still documented via `responses`.
+@router.get(
+    "/session/{session_id}",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": SessionStatusResponse}},
+)
 async def get_session_status(session_id: str) -> SessionStatusResponse:
     session = await session_store.get_by_id(session_id)
     if session is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-    return SessionStatusResponse(
+    return SessionStatusResponse.model_construct(
         session_id=session.session_id,
         status=session.status,
         session_token=session.session_token if session.status is SessionStatus.COMPLETE else None,
@@ -55,7 +62,8 @@ async def auth_callback(
 
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
-async def logout(_: str = Depends(get_session_token)) -> Response:
+async def logout(token: str = Depends(get_session_token)) -> Response:
+    forget_session_user(token)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
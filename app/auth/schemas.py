@@ -11,7 +11,7 @@ class SessionCreateResponse(BaseModel):
     session_id: str = Field(..., alias="sessionId")
     login_url: str = Field(..., alias="loginUrl")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class SessionStatusResponse(BaseModel):
@@ -21,7 +21,7 @@ class SessionStatusResponse(BaseModel):
     refresh_token: Optional[str] = Field(None, alias="refreshToken")
     error: Optional[str] = None
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class RefreshTokenRequest(BaseModel):
@@ -34,5 +34,10 @@ class RefreshTokenResponse(BaseModel):
     session_token: str = Field(..., alias="sessionToken")
     refresh_token: str = Field(..., alias="refreshToken")  # New refresh token (rotation)
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
 
+# Resolve the postponed annotations and compile validators/serializers at import,
+# rather than on the first request that uses each model
+for _model in (SessionCreateResponse, SessionStatusResponse, RefreshTokenRequest, RefreshTokenResponse):
+    _model.model_rebuild()
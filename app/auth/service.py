@@ -4,39 +4,75 @@ import base64
 import hashlib
 import logging
 import secrets
-import uuid
+from functools import lru_cache
 from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
 import httpx
+import jwt
+import orjson
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 
-from app.auth.session_store import SessionData, SessionStatus, session_store
+from app.auth.session_store import SessionData, session_store
 from app.config import settings
+from app.core.http import get_auth0_client
 from app.core.security import create_session_token, create_refresh_token, decode_refresh_token
 from app.users import repository as user_repository
 from app.users.models import User, UserProfile
 
 logger = logging.getLogger(__name__)
 
+_JWKS_CACHE: TTLCache = TTLCache(maxsize=1, ttl=3600)
+
 
 def _base_login_url() -> str:
     return settings.login_base_url.rstrip("/")
 
 
 def _auth0_base_url() -> str:
-    domain = settings.auth0_domain.rstrip("/")
+    domain = settings.auth0_base_url
     if not domain:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Auth0 domain not configured")
-    if not domain.startswith("http"):
-        domain = f"https://{domain}"
     return domain
 
 
+@lru_cache(maxsize=1)
+def _authorize_url_prefix() -> str:
+    """Authorize endpoint plus the query parameters that are the same for every login."""
+    static_params = {
+        "client_id": settings.auth0_client_id,
+        "audience": settings.auth0_audience,
+        "response_type": "code",
+        "redirect_uri": settings.auth0_callback_url,
+        "scope": "openid profile email offline_access",
+        "code_challenge_method": "S256",
+    }
+    return f"{_auth0_base_url()}/authorize?{urlencode(static_params)}"
+
+
+def _json(response: httpx.Response) -> Any:
+    return orjson.loads(response.content)
+
+
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+@lru_cache(maxsize=1)
+def _refresh_grant_prefix() -> bytes:
+    """Form-encoded refresh grant body up to the refresh_token value."""
+    static_params = {
+        "grant_type": "refresh_token",
+        "client_id": settings.auth0_client_id,
+        "client_secret": settings.auth0_client_secret,
+    }
+    return urlencode(static_params).encode("ascii") + b"&refresh_token="
+
+
 def _generate_pkce_pair() -> tuple[str, str]:
     code_verifier = secrets.token_urlsafe(64)
-    digest = hashlib.sha256(code_verifier.encode()).digest()
-    code_challenge = base64.urlsafe_b64encode(digest).decode().rstrip("=")
+    digest = hashlib.sha256(code_verifier.encode("ascii")).digest()
+    code_challenge = base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
     return code_verifier, code_challenge
 
 
@@ -50,36 +86,23 @@ def get_success_page_url() -> str:
 
 
 async def create_session() -> Dict[str, str]:
-    session_id = uuid.uuid4().hex
+    session_id = secrets.token_hex(16)
     await session_store.create_session(settings.auth_session_ttl_seconds, session_id)
     logger.info("Created auth session %s", session_id)
     return {"session_id": session_id, "login_url": build_login_redirect(session_id)}
 
 
 async def build_authorize_url(session_id: str) -> str:
-    session = await session_store.get_by_id(session_id)
-    if session is None or session.status is not SessionStatus.PENDING:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-
     code_verifier, code_challenge = _generate_pkce_pair()
     state = secrets.token_urlsafe(24)
-    await session_store.attach_pkce(session_id, state, code_verifier)
-
-    params = {
-        "client_id": settings.auth0_client_id,
-        "audience": settings.auth0_audience,
-        "response_type": "code",
-        "redirect_uri": settings.auth0_callback_url,
-        "scope": "openid profile email offline_access",
-        "code_challenge": code_challenge,
-        "code_challenge_method": "S256",
-        "state": state,
-    }
+    session = await session_store.get_and_attach_pkce(session_id, state, code_verifier)
+    if session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
 
     if not settings.auth0_client_id or not settings.auth0_callback_url:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Auth0 not configured")
 
-    authorize_url = f"{_auth0_base_url()}/authorize?{urlencode(params)}"
+    authorize_url = f"{_authorize_url_prefix()}&{urlencode({'code_challenge': code_challenge, 'state': state})}"
     logger.info("Session %s redirecting browser to Auth0", session_id)
     return authorize_url
 
@@ -93,14 +116,16 @@ async def complete_auth_flow(code: str, state: str) -> SessionData:
 
     logger.info("Session %s exchanging authorization code", session.session_id)
     tokens = await _exchange_code_for_tokens(code, session.code_verifier)
-    access_token = tokens.get("access_token")
-    if not access_token:
+    id_token = tokens.get("id_token")
+    if not id_token:
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Auth0 token exchange failed")
 
-    profile = await _fetch_user_profile(access_token)
+    profile = await _profile_from_id_token(id_token)
     user = await user_repository.upsert_user(profile)
 
-    # Store Auth0 refresh token for later verification
+    # Store Auth0 refresh token for later verification. This must land before the
+    # session is marked complete: once the desktop client sees COMPLETE it may refresh
+    # at any time, and that path depends on the stored Auth0 token.
     auth0_refresh_token = tokens.get("refresh_token")
     if auth0_refresh_token:
         await user_repository.update_auth0_refresh_token(user.id, auth0_refresh_token)
@@ -133,29 +158,60 @@ async def _exchange_code_for_tokens(code: str, code_verifier: str) -> Dict[str,
     if not settings.auth0_client_secret:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Auth0 secret not configured")
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        response = await client.post(f"{_auth0_base_url()}/oauth/token", data=payload)
-        if response.status_code >= 400:
-            body = response.text
-            logger.error(
-                "Auth0 token exchange failed: status=%s body=%s",
-                response.status_code,
-                body,
-            )
-            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Auth0 token exchange failed")
-        return response.json()
-
-
-async def _fetch_user_profile(access_token: str) -> UserProfile:
-    headers = {"Authorization": f"Bearer {access_token}"}
-    async with httpx.AsyncClient(timeout=15) as client:
-        response = await client.get(f"{_auth0_base_url()}/userinfo", headers=headers)
-        if response.status_code >= 400:
-            logger.error("Auth0 userinfo failed: status=%s body=%s", response.status_code, response.text)
-            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Unable to fetch user profile")
-        data = response.json()
+    response = await get_auth0_client().post(f"{_auth0_base_url()}/oauth/token", data=payload)
+    if response.status_code >= 400:
+        body = response.text
+        logger.error(
+            "Auth0 token exchange failed: status=%s body=%s",
+            response.status_code,
+            body,
+        )
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Auth0 token exchange failed")
+    return _json(response)
+
+
+async def _get_auth0_jwks(refresh: bool = False) -> jwt.PyJWKSet:
+    """Return Auth0's signing keys, cached for an hour."""
+    if not refresh:
+        cached = _JWKS_CACHE.get("jwks")
+        if cached is not None:
+            return cached
+    response = await get_auth0_client().get(f"{_auth0_base_url()}/.well-known/jwks.json")
+    if response.status_code >= 400:
+        logger.error("Auth0 JWKS fetch failed: status=%s body=%s", response.status_code, response.text)
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Unable to fetch user profile")
+    jwks = jwt.PyJWKSet.from_dict(_json(response))
+    _JWKS_CACHE["jwks"] = jwks
+    return jwks
+
+
+async def _get_signing_key(kid: str) -> Any:
+    jwks = await _get_auth0_jwks()
+    try:
+        return jwks[kid].key
+    except KeyError:
+        # Unknown key id: Auth0 may have rotated keys since the last fetch
+        jwks = await _get_auth0_jwks(refresh=True)
+        return jwks[kid].key
+
+
+async def _profile_from_id_token(id_token: str) -> UserProfile:
+    """Build the user profile from the verified id_token claims, avoiding a /userinfo call."""
+    try:
+        kid = jwt.get_unverified_header(id_token).get("kid", "")
+        signing_key = await _get_signing_key(kid)
+        claims = jwt.decode(
+            id_token,
+            signing_key,
+            algorithms=["RS256"],
+            audience=settings.auth0_client_id,
+            issuer=f"{_auth0_base_url()}/",
+        )
+    except (jwt.PyJWTError, KeyError) as exc:
+        logger.error("Auth0 id_token verification failed: %s", exc)
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Unable to fetch user profile") from exc
 
-    return UserProfile(**data)
+    return UserProfile(**claims)
 
 
 async def refresh_session_token(refresh_token_str: str) -> tuple[str, str]:
@@ -179,8 +235,8 @@ async def refresh_session_token(refresh_token_str: str) -> tuple[str, str]:
             detail="Invalid refresh token payload"
         )
 
-    # Verify user still exists
-    user = await user_repository.get_user_by_id(user_id)
+    # Verify user still exists; read uncached so the Auth0 refresh token is current
+    user = await user_repository.get_user_by_id(user_id, use_cache=False)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -198,17 +254,17 @@ async def refresh_session_token(refresh_token_str: str) -> tuple[str, str]:
     logger.info("Verifying user %s with Auth0", user_id)
     auth0_tokens = await _verify_with_auth0(user.auth0_refresh_token)
 
+    # Generate new tokens
+    new_session_id = secrets.token_hex(16)
+    new_session_token = create_session_token(user_id, new_session_id)
+    new_refresh_token = create_refresh_token(user_id)  # Rotate refresh token
+
     # Update stored Auth0 refresh token if rotated
     new_auth0_refresh_token = auth0_tokens.get("refresh_token")
     if new_auth0_refresh_token and new_auth0_refresh_token != user.auth0_refresh_token:
         logger.info("Auth0 refresh token rotated for user %s", user_id)
         await user_repository.update_auth0_refresh_token(user_id, new_auth0_refresh_token)
 
-    # Generate new tokens
-    new_session_id = uuid.uuid4().hex
-    new_session_token = create_session_token(user_id, new_session_id)
-    new_refresh_token = create_refresh_token(user_id)  # Rotate refresh token
-
     logger.info("Created new session token for user %s", user_id)
 
     return new_session_token, new_refresh_token
@@ -219,23 +275,20 @@ async def _verify_with_auth0(auth0_refresh_token: str) -> Dict[str, Any]:
 
     If the user is blocked or deleted in Auth0, the refresh token exchange will fail.
     """
-    payload = {
-        "grant_type": "refresh_token",
-        "client_id": settings.auth0_client_id,
-        "client_secret": settings.auth0_client_secret,
-        "refresh_token": auth0_refresh_token,
-    }
-
     if not settings.auth0_client_secret:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Auth0 secret not configured")
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        response = await client.post(f"{_auth0_base_url()}/oauth/token", data=payload)
-        if response.status_code >= 400:
-            logger.warning("Auth0 verification failed: status=%s body=%s", response.status_code, response.text)
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Auth0 verification failed. User may be blocked or deleted. Please login again."
-            )
-        return response.json()
+    content = _refresh_grant_prefix() + quote_plus(auth0_refresh_token).encode("ascii")
+    response = await get_auth0_client().post(
+        f"{_auth0_base_url()}/oauth/token",
+        content=content,
+        headers=_FORM_HEADERS,
+    )
+    if response.status_code >= 400:
+        logger.warning("Auth0 verification failed: status=%s body=%s", response.status_code, response.text)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Auth0 verification failed. User may be blocked or deleted. Please login again."
+        )
+    return _json(response)
 
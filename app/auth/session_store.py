@@ -1,10 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import orjson
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from app.config import settings
+
+# Minimum time between expiry sweeps on the in-memory store's read paths
+_PURGE_INTERVAL_SECONDS = 30.0
 
 
 class SessionStatus(str, Enum):
@@ -13,7 +24,7 @@ class SessionStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionData:
     session_id: str
     created_at: datetime
@@ -26,6 +37,17 @@ class SessionData:
     user_id: Optional[str] = None
     error: Optional[str] = None
 
+    def to_json(self) -> bytes:
+        return orjson.dumps(self)
+
+    @classmethod
+    def from_json(cls, raw: Union[bytes, str]) -> "SessionData":
+        data: Dict[str, Any] = orjson.loads(raw)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["expires_at"] = datetime.fromisoformat(data["expires_at"])
+        data["status"] = SessionStatus(data["status"])
+        return cls(**data)
+
 
 class SessionStore:
     """In-memory session store protected by an asyncio lock."""
@@ -33,6 +55,8 @@ class SessionStore:
     def __init__(self) -> None:
         self._sessions: Dict[str, SessionData] = {}
         self._state_index: Dict[str, str] = {}
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        self._last_purge_mono = 0.0
         self._lock = asyncio.Lock()
 
     async def create_session(self, ttl_seconds: int, session_id: str) -> SessionData:
@@ -45,12 +69,13 @@ class SessionStore:
                 expires_at=now + timedelta(seconds=ttl_seconds),
             )
             self._sessions[session_id] = data
+            heapq.heappush(self._expiry_heap, (data.expires_at, session_id))
             return data
 
     async def attach_pkce(self, session_id: str, state: str, code_verifier: str) -> SessionData:
         async with self._lock:
-            self._purge_expired_locked()
-            session = self._sessions.get(session_id)
+            self._maybe_purge_locked(time.monotonic())
+            session = self._get_live_locked(session_id)
             if session is None:
                 raise KeyError("Session not found")
             session.state = state
@@ -58,18 +83,30 @@ class SessionStore:
             self._state_index[state] = session_id
             return session
 
+    async def get_and_attach_pkce(self, session_id: str, state: str, code_verifier: str) -> Optional[SessionData]:
+        """Attach PKCE data to a pending session; returns None if it is missing or not pending."""
+        async with self._lock:
+            self._maybe_purge_locked(time.monotonic())
+            session = self._get_live_locked(session_id)
+            if session is None or session.status is not SessionStatus.PENDING:
+                return None
+            session.state = state
+            session.code_verifier = code_verifier
+            self._state_index[state] = session_id
+            return session
+
     async def get_by_id(self, session_id: str) -> Optional[SessionData]:
         async with self._lock:
-            self._purge_expired_locked()
-            return self._sessions.get(session_id)
+            self._maybe_purge_locked(time.monotonic())
+            return self._get_live_locked(session_id)
 
     async def get_by_state(self, state: str) -> Optional[SessionData]:
         async with self._lock:
-            self._purge_expired_locked()
+            self._maybe_purge_locked(time.monotonic())
             session_id = self._state_index.get(state)
             if session_id is None:
                 return None
-            return self._sessions.get(session_id)
+            return self._get_live_locked(session_id)
 
     async def mark_complete(self, session_id: str, token: str, refresh_token: str, user_id: str) -> SessionData:
         async with self._lock:
@@ -92,14 +129,164 @@ class SessionStore:
             session.error = error
             return session
 
+    def _get_live_locked(self, session_id: str) -> Optional[SessionData]:
+        # Purging is amortized, so reads check expiry themselves
+        session = self._sessions.get(session_id)
+        if session is None or session.expires_at < datetime.now(timezone.utc):
+            return None
+        return session
+
+    def _maybe_purge_locked(self, now_mono: float) -> None:
+        if now_mono - self._last_purge_mono < _PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge_mono = now_mono
+        self._purge_expired_locked()
+
     def _purge_expired_locked(self) -> None:
         now = datetime.now(timezone.utc)
-        expired = [sid for sid, data in self._sessions.items() if data.expires_at < now]
-        for sid in expired:
-            self._sessions.pop(sid, None)
-        for state, sid in list(self._state_index.items()):
-            if sid not in self._sessions:
-                self._state_index.pop(state, None)
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, sid = heapq.heappop(heap)
+            data = self._sessions.get(sid)
+            # Skip stale entries left behind by a session id that was re-created
+            if data is None or data.expires_at != expires_at:
+                continue
+            del self._sessions[sid]
+            if data.state is not None:
+                self._state_index.pop(data.state, None)
+
+
+class RedisSessionStore:
+    """Redis-backed session store shared by every worker process.
+
+    Sessions live under ``session:{id}`` and the PKCE state index under
+    ``state:{state}``; both keys carry the session TTL so Redis expires them.
+    """
+
+    _SESSION_PREFIX = "session:"
+    _STATE_PREFIX = "state:"
+
+    def __init__(self, url: str) -> None:
+        self._redis: Redis = Redis.from_url(url)
+
+    async def create_session(self, ttl_seconds: int, session_id: str) -> SessionData:
+        now = datetime.now(timezone.utc)
+        data = SessionData(
+            session_id=session_id,
+            created_at=now,
+            expires_at=now + timedelta(seconds=ttl_seconds),
+        )
+        await self._redis.set(self._SESSION_PREFIX + session_id, data.to_json(), ex=ttl_seconds)
+        return data
+
+    async def attach_pkce(self, session_id: str, state: str, code_verifier: str) -> SessionData:
+        def apply(session: SessionData) -> bool:
+            session.state = state
+            session.code_verifier = code_verifier
+            return True
+
+        session = await self._update(session_id, apply, state=state)
+        if session is None:
+            raise KeyError("Session not found")
+        return session
+
+    async def get_and_attach_pkce(self, session_id: str, state: str, code_verifier: str) -> Optional[SessionData]:
+        """Attach PKCE data to a pending session; returns None if it is missing or not pending."""
+        def apply(session: SessionData) -> bool:
+            if session.status is not SessionStatus.PENDING:
+                return False
+            session.state = state
+            session.code_verifier = code_verifier
+            return True
+
+        return await self._update(session_id, apply, state=state)
+
+    async def get_by_id(self, session_id: str) -> Optional[SessionData]:
+        raw = await self._redis.get(self._SESSION_PREFIX + session_id)
+        return SessionData.from_json(raw) if raw is not None else None
+
+    async def get_by_state(self, state: str) -> Optional[SessionData]:
+        session_id = await self._redis.get(self._STATE_PREFIX + state)
+        if session_id is None:
+            return None
+        if isinstance(session_id, bytes):
+            session_id = session_id.decode()
+        return await self.get_by_id(session_id)
+
+    async def mark_complete(self, session_id: str, token: str, refresh_token: str, user_id: str) -> SessionData:
+        def apply(session: SessionData) -> bool:
+            session.status = SessionStatus.COMPLETE
+            session.session_token = token
+            session.refresh_token = refresh_token
+            session.user_id = user_id
+            session.error = None
+            return True
+
+        session = await self._update(session_id, apply)
+        if session is None:
+            raise KeyError("Session not found")
+        return session
+
+    async def mark_failed(self, session_id: str, error: str) -> SessionData:
+        def apply(session: SessionData) -> bool:
+            session.status = SessionStatus.FAILED
+            session.error = error
+            return True
+
+        session = await self._update(session_id, apply)
+        if session is None:
+            raise KeyError("Session not found")
+        return session
+
+    async def _update(
+        self,
+        session_id: str,
+        apply: Callable[[SessionData], bool],
+        state: Optional[str] = None,
+    ) -> Optional[SessionData]:
+        """Read, modify and write a session atomically across workers.
+
+        The session key is WATCHed and the write goes through MULTI/EXEC, so a
+        concurrent update makes the transaction retry on fresh data instead of
+        being overwritten. ``apply`` mutates the session and returns False to
+        leave it untouched. When ``state`` is given, the state index entry is
+        written in the same transaction.
+
+        Returns the updated session, or None if it is missing or was left untouched.
+        """
+        key = self._SESSION_PREFIX + session_id
+
+        async def txn(pipe: Pipeline) -> Optional[SessionData]:
+            raw = await pipe.get(key)
+            if raw is None:
+                return None
+            session = SessionData.from_json(raw)
+            if not apply(session):
+                return None
+            pipe.multi()
+            pipe.set(key, session.to_json(), keepttl=True)
+            if state is not None:
+                ttl = max(1, int((session.expires_at - datetime.now(timezone.utc)).total_seconds()))
+                pipe.set(self._STATE_PREFIX + state, session_id, ex=ttl)
+            return session
+
+        return await self._redis.transaction(txn, key, value_from_callable=True)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def _build_session_store() -> Union[SessionStore, RedisSessionStore]:
+    # The in-memory store only works with a single worker; set REDIS_URL to share
+    # auth sessions across processes.
+    if settings.redis_url:
+        return RedisSessionStore(settings.redis_url)
+    return SessionStore()
+
+
+session_store = _build_session_store()
 
 
-session_store = SessionStore()
+async def close_session_store() -> None:
+    if isinstance(session_store, RedisSessionStore):
+        await session_store.close()
@@ -1,3 +1,4 @@
+from functools import cached_property
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -72,12 +73,16 @@ class Settings(BaseSettings):
         default="INFO",
         validation_alias=AliasChoices("DATADOG_LOG_LEVEL", "DD_LOG_LEVEL"),
     )
+    datadog_log_batch_size: int = 100  # Max log records per Datadog submission
+    datadog_log_flush_interval_seconds: float = 2.0  # Max delay before buffered logs are sent
+    datadog_log_queue_size: int = 10_000  # Records buffered before new ones are dropped
 
     # API Configuration
     max_file_size_mb: int = 10
     max_game_stats_kb: int = 50  # Maximum size for game_stats JSON in KB
     request_timeout_seconds: int = 30
     cors_allowed_origins: str = ""
+    message_history_window: int = 20  # Messages kept after the history window resets
 
     # MongoDB
     mongodb_uri: str = "mongodb://mongodb:27017/sensii"
@@ -100,53 +105,64 @@ class Settings(BaseSettings):
     refresh_token_expires_days: int = 30
     auth_session_ttl_seconds: int = 600
 
+    # Redis (optional). When set, auth sessions are shared across workers.
+    redis_url: Optional[str] = None
+
+    @cached_property
+    def auth0_base_url(self) -> str:
+        """Auth0 domain normalized to an https base URL, or empty if not configured."""
+        domain = self.auth0_domain.rstrip("/")
+        if domain and not domain.startswith("http"):
+            domain = f"https://{domain}"
+        return domain
+
     # Paths
-    @property
+    @cached_property
     def data_dir(self) -> Path:
         """Get the data directory path."""
         return Path(__file__).parent.parent / "data"
 
-    @property
+    @cached_property
     def champions_dir(self) -> Path:
         """Get the champions directory path containing individual champion XML files."""
         return self.data_dir / "champions"
 
-    @property
+    @cached_property
     def champion_combos_dir(self) -> Path:
         """Get the champion combos directory path containing champion combo XML files."""
         return self.data_dir / "champion-combos"
 
-    @property
+    @cached_property
     def champion_builds_dir(self) -> Path:
         """Get the champion builds directory path containing champion build directories."""
         return self.data_dir / "champion-builds"
 
-    @property
+    @cached_property
     def champion_guide_dir(self) -> Path:
         """Get the champion guide directory path containing champion guide directories."""
         return self.data_dir / "champion-guide"
 
-    @property
+    @cached_property
     def playbook_dir(self) -> Path:
         """Get the playbook directory path containing strategic playbook files."""
         return self.data_dir / "playbook"
 
-    @property
+    @cached_property
     def downloads_dir(self) -> Path:
         """Get the downloads directory path for serving release files."""
         return Path(__file__).parent.parent / "downloads"
 
-    @property
+    @cached_property
     def max_file_size_bytes(self) -> int:
         """Convert max file size from MB to bytes."""
         return self.max_file_size_mb * 1024 * 1024
 
-    @property
+    @cached_property
     def max_game_stats_bytes(self) -> int:
         """Convert max game stats size from KB to bytes."""
         return self.max_game_stats_kb * 1024
 
-    @property
+    @cached_property
     def allowed_origins(self) -> list[str]:
         """Return configured CORS origins."""
         origins: list[str] = []
@@ -163,11 +179,7 @@ class Settings(BaseSettings):
                 if trimmed:
                     origins.append(trimmed.rstrip("/"))
         # Remove duplicates while preserving order
-        unique: list[str] = []
-        for origin in origins:
-            if origin not in unique:
-                unique.append(origin)
-        return unique or ["*"]
+        return list(dict.fromkeys(origins)) or ["*"]
 
 
 # Global settings instance
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+_auth0_client: Optional[httpx.AsyncClient] = None
+
+
+def get_auth0_client() -> httpx.AsyncClient:
+    """Return a singleton AsyncClient for Auth0 calls (keeps connections alive across logins)."""
+    global _auth0_client
+    if _auth0_client is None:
+        _auth0_client = httpx.AsyncClient(
+            timeout=15,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _auth0_client
+
+
+async def close_auth0_client() -> None:
+    global _auth0_client
+    if _auth0_client is not None:
+        await _auth0_client.aclose()
+        _auth0_client = None
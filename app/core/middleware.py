@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from fastapi import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_PAYLOAD_TOO_LARGE_DETAIL = "Request body too large"
+_PAYLOAD_TOO_LARGE_BODY = b'{"detail":"Request body too large"}'
+
+
+class BodySizeLimitMiddleware:
+    """Cap the request body size on selected paths.
+
+    A declared Content-Length over the limit is rejected before the body is read.
+    Bodies without one (chunked uploads) are counted as they stream in, and reading
+    past the limit raises a 413 inside the app, so form parsing stops right there
+    (FastAPI re-raises its own HTTPException from body parsing rather than turning
+    it into a 400).
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int, paths: Iterable[str]) -> None:
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_bytes:
+                    await send(
+                        {
+                            "type": "http.response.start",
+                            "status": 413,
+                            "headers": [
+                                (b"content-type", b"application/json"),
+                                (b"content-length", str(len(_PAYLOAD_TOO_LARGE_BODY)).encode()),
+                            ],
+                        }
+                    )
+                    await send({"type": "http.response.body", "body": _PAYLOAD_TOO_LARGE_BODY})
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    raise HTTPException(status_code=413, detail=_PAYLOAD_TOO_LARGE_DETAIL)
+            return message
+
+        await self.app(scope, limited_receive, send)
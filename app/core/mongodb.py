@@ -13,7 +13,18 @@ def get_mongo_client() -> AsyncIOMotorClient:
     """Return a singleton AsyncIOMotorClient."""
     global _client
     if _client is None:
-        _client = AsyncIOMotorClient(settings.mongodb_uri)
+        # No await between the check and the assignment, so initialization cannot
+        # interleave on the event loop and needs no lock.
+        _client = AsyncIOMotorClient(
+            settings.mongodb_uri,
+            maxPoolSize=50,
+            minPoolSize=5,
+            serverSelectionTimeoutMS=3000,
+            compressors="zlib",
+            retryWrites=True,
+            retryReads=True,
+            uuidRepresentation="standard",
+        )
     return _client
 
 
@@ -23,7 +34,8 @@ def get_database() -> AsyncIOMotorDatabase:
     return client[settings.mongodb_db_name]
 
 
-def close_mongo_client() -> None:
+async def close_mongo_client() -> None:
+    """Close the singleton client; called from the application lifespan on shutdown."""
     global _client
     if _client is not None:
         _client.close()
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import hashlib
+import threading
+import time
 from typing import Any, Dict
 
-from jose import JWTError, jwt
+from cachetools import TLRUCache
+import jwt
+from jwt import PyJWTError
 
 from fastapi import HTTPException, status
 
@@ -11,36 +15,64 @@ from app.config import settings
 
 ALGORITHM = "HS256"
 
+# Verified payloads keyed by a token digest. Entries live for at most the given
+# TTL and never past the token's own "exp" claim.
+_SESSION_CACHE_TTL_SECONDS = 60
+_REFRESH_CACHE_TTL_SECONDS = 300
+_session_cache: TLRUCache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, payload, now: min(now + _SESSION_CACHE_TTL_SECONDS, payload.get("exp", 0)),
+    timer=time.time,
+)
+_refresh_cache: TLRUCache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, payload, now: min(now + _REFRESH_CACHE_TTL_SECONDS, payload.get("exp", 0)),
+    timer=time.time,
+)
+_cache_lock = threading.Lock()
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
 def create_session_token(user_id: str, session_id: str) -> str:
     """Create a signed JWT token for desktop sessions."""
-    now = datetime.now(timezone.utc)
-    exp = now + timedelta(minutes=settings.session_token_expires_minutes)
+    now = int(time.time())
     payload = {
         "sub": user_id,
         "sid": session_id,
         "iss": settings.session_token_issuer,
         "aud": settings.session_token_audience,
-        "iat": int(now.timestamp()),
-        "exp": int(exp.timestamp()),
+        "iat": now,
+        "exp": now + settings.session_token_expires_minutes * 60,
     }
     return jwt.encode(payload, settings.session_token_secret, algorithm=ALGORITHM)
 
 
 def decode_session_token(token: str) -> Dict[str, Any]:
     """Decode and validate a session token."""
+    key = _token_key(token)
+    with _cache_lock:
+        cached = _session_cache.get(key)
+    if cached is not None:
+        return cached
     try:
-        return jwt.decode(
+        payload = jwt.decode(
             token,
             settings.session_token_secret,
             algorithms=[ALGORITHM],
             audience=settings.session_token_audience,
             issuer=settings.session_token_issuer,
         )
-    except JWTError as exc:  # pragma: no cover - treated uniformly
+    except PyJWTError as exc:  # pragma: no cover - treated uniformly
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token",
         ) from exc
+    with _cache_lock:
+        _session_cache[key] = payload
+    return payload
 
 
 def create_refresh_token(user_id: str) -> str:
@@ -49,21 +81,25 @@ def create_refresh_token(user_id: str) -> str:
     This token is used to obtain new session tokens without re-authenticating.
     It has a much longer expiration (30 days) than the session token.
     """
-    now = datetime.now(timezone.utc)
-    exp = now + timedelta(days=settings.refresh_token_expires_days)
+    now = int(time.time())
     payload = {
         "sub": user_id,
         "type": "refresh",
         "iss": settings.session_token_issuer,
         "aud": settings.session_token_audience,
-        "iat": int(now.timestamp()),
-        "exp": int(exp.timestamp()),
+        "iat": now,
+        "exp": now + settings.refresh_token_expires_days * 86400,
     }
     return jwt.encode(payload, settings.session_token_secret, algorithm=ALGORITHM)
 
 
 def decode_refresh_token(token: str) -> Dict[str, Any]:
     """Decode and validate a refresh token."""
+    key = _token_key(token)
+    with _cache_lock:
+        cached = _refresh_cache.get(key)
+    if cached is not None:
+        return cached
     try:
         payload = jwt.decode(
             token,
@@ -78,10 +114,12 @@ def decode_refresh_token(token: str) -> Dict[str, Any]:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token type",
             )
-        return payload
-    except JWTError as exc:
+    except PyJWTError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired refresh token",
         ) from exc
+    with _cache_lock:
+        _refresh_cache[key] = payload
+    return payload
 
@@ -1,39 +1,59 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from fastapi import HTTPException, UploadFile
 
+from app.handlers.upload import UPLOAD_CHUNK_SIZE, read_upload_limited
 
-def detect_audio_format(data: bytes) -> str:
+_RIFF = b'RIFF'
+_WAVE = b'WAVE'
+_ID3 = b'ID3'
+_FTYP = b'ftyp'
+
+# Second byte of an FF xx frame sync header -> format
+_FRAME_SYNC_FORMATS = {
+    0xFB: "audio/mp3",
+    0xF3: "audio/mp3",
+    0xF2: "audio/mp3",
+    0xF1: "audio/aac",
+    0xF9: "audio/aac",
+}
+
+# Four-byte magic at offset 0 -> format
+_FOURCC_FORMATS = {
+    b'OggS': "audio/ogg",
+    b'fLaC': "audio/flac",
+}
+
+
+def detect_audio_format(data: bytes) -> Optional[str]:
     """
     Detect audio format from magic bytes.
 
     Returns MIME type string like 'audio/wav', 'audio/mp4', etc.
     """
+    header = bytes(data[:12])
+    magic = header[:4]
+
     # WAV: RIFF....WAVE
-    if data[:4] == b'RIFF' and data[8:12] == b'WAVE':
+    if magic == _RIFF and header[8:12] == _WAVE:
         return "audio/wav"
 
-    # MP3: ID3 or FF FB/FF F3/FF F2
-    if data[:3] == b'ID3' or (data[0] == 0xFF and data[1] in [0xFB, 0xF3, 0xF2]):
+    # MP3: ID3 tag
+    if magic[:3] == _ID3:
         return "audio/mp3"
 
+    # MP3 (FF FB/F3/F2) and AAC (FF F1/F9) frame sync
+    if len(header) >= 2 and header[0] == 0xFF:
+        frame_format = _FRAME_SYNC_FORMATS.get(header[1])
+        if frame_format is not None:
+            return frame_format
+
     # MP4/M4A: ftyp
-    if data[4:8] == b'ftyp':
+    if header[4:8] == _FTYP:
         return "audio/mp4"
 
-    # AAC: FF F1 or FF F9
-    if data[:2] == b'\xFF\xF1' or data[:2] == b'\xFF\xF9':
-        return "audio/aac"
-
-    # OGG: OggS
-    if data[:4] == b'OggS':
-        return "audio/ogg"
-
-    # FLAC: fLaC
-    if data[:4] == b'fLaC':
-        return "audio/flac"
-
-    return None
+    # OGG: OggS, FLAC: fLaC
+    return _FOURCC_FORMATS.get(magic)
 
 
 async def validate_and_process_audio(file: UploadFile, max_size_bytes: int) -> Tuple[bytes, str]:
@@ -56,22 +76,16 @@ async def validate_and_process_audio(file: UploadFile, max_size_bytes: int) -> T
     if not file:
         raise HTTPException(status_code=400, detail="No audio file provided")
 
-    # Read file content
-    audio_data = await file.read()
-
-    # Check file size
-    if len(audio_data) > max_size_bytes:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Audio file too large. Max size: {max_size_bytes / (1024 * 1024):.1f}MB",
-        )
+    # Sniff the format from the first chunk so unsupported uploads are rejected
+    # before the rest of the body is read
+    first_chunk = await file.read(UPLOAD_CHUNK_SIZE)
 
     # Check if file is not empty
-    if len(audio_data) == 0:
+    if len(first_chunk) == 0:
         raise HTTPException(status_code=400, detail="Audio file appears to be empty")
 
     # Detect actual audio format from magic bytes
-    detected_format = detect_audio_format(audio_data)
+    detected_format = detect_audio_format(first_chunk)
 
     if not detected_format:
         raise HTTPException(
@@ -79,4 +93,12 @@ async def validate_and_process_audio(file: UploadFile, max_size_bytes: int) -> T
             detail="Unsupported audio format. Supported formats: WAV, MP3, MP4, AAC, OGG, FLAC",
         )
 
+    # Read the remainder, failing fast once the size limit is exceeded
+    audio_data = await read_upload_limited(
+        file,
+        max_size_bytes,
+        f"Audio file too large. Max size: {max_size_bytes / (1024 * 1024):.1f}MB",
+        prefix=first_chunk,
+    )
+
     return audio_data, detected_format
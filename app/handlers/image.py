@@ -2,6 +2,13 @@ from typing import Tuple
 
 from fastapi import HTTPException, UploadFile
 
+from app.handlers.upload import read_upload_limited
+
+# PNG magic bytes: 89 50 4E 47 0D 0A 1A 0A
+_PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
+# JPEG magic bytes: FF D8 FF
+_JPEG_MAGIC = b'\xff\xd8\xff'
+
 
 async def validate_and_process_image(file: UploadFile, max_size_bytes: int) -> Tuple[bytes, str]:
     """
@@ -29,15 +36,12 @@ async def validate_and_process_image(file: UploadFile, max_size_bytes: int) -> T
             detail=f"Invalid image format. Expected PNG or JPEG, got {file.content_type}",
         )
 
-    # Read file content
-    image_data = await file.read()
-
-    # Check file size
-    if len(image_data) > max_size_bytes:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Image file too large. Max size: {max_size_bytes / (1024 * 1024):.1f}MB",
-        )
+    # Read file content, failing fast once the size limit is exceeded
+    image_data = await read_upload_limited(
+        file,
+        max_size_bytes,
+        f"Image file too large. Max size: {max_size_bytes / (1024 * 1024):.1f}MB",
+    )
 
     # Check if file is not empty
     if len(image_data) == 0:
@@ -45,11 +49,10 @@ async def validate_and_process_image(file: UploadFile, max_size_bytes: int) -> T
 
     # Validate image format by checking magic bytes
     try:
-        # PNG magic bytes: 89 50 4E 47 0D 0A 1A 0A
-        if image_data[:8] == b'\x89PNG\r\n\x1a\n':
+        header = image_data[:8]
+        if header == _PNG_MAGIC:
             mime_type = "image/png"
-        # JPEG magic bytes: FF D8 FF
-        elif image_data[:3] == b'\xff\xd8\xff':
+        elif header[:3] == _JPEG_MAGIC:
             mime_type = "image/jpeg"
         else:
             raise HTTPException(
@@ -0,0 +1,34 @@
+from fastapi import HTTPException, UploadFile
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def read_upload_limited(
+    file: UploadFile,
+    max_size_bytes: int,
+    too_large_detail: str,
+    prefix: bytes = b"",
+) -> bytes:
+    """
+    Read the rest of an upload in chunks, aborting once it exceeds the size limit.
+
+    Args:
+        file: The uploaded file
+        max_size_bytes: Maximum allowed file size in bytes
+        too_large_detail: Error detail returned when the limit is exceeded
+        prefix: Bytes already read from the file
+
+    Returns:
+        The full file content
+
+    Raises:
+        HTTPException: 413 if the file is larger than max_size_bytes
+    """
+    buffer = bytearray(prefix)
+    if len(buffer) > max_size_bytes:
+        raise HTTPException(status_code=413, detail=too_large_detail)
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > max_size_bytes:
+            raise HTTPException(status_code=413, detail=too_large_detail)
+    return bytes(buffer)
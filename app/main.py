@@ -1,13 +1,21 @@
+import asyncio
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from app.assistant.data import ensure_all_champion_data_exists
+from app.assistant.session import session_manager
 from app.auth import routes as auth_routes
+from app.auth.session_store import close_session_store
 from app.config import settings
+from app.core.http import close_auth0_client
+from app.core.middleware import BodySizeLimitMiddleware
 from app.core.mongodb import close_mongo_client, get_mongo_client
 from app.routes import assistant
 from app.users import routes as user_routes
@@ -32,6 +40,18 @@ if not root_logger.handlers:
     handler.setFormatter(formatter)
     root_logger.addHandler(handler)
 
+# Console/file handlers write synchronously, so they run on a listener thread and
+# request handlers only enqueue records. The Datadog handler is attached directly:
+# it already batches on its own worker thread, and going through a QueueHandler
+# would strip exc_info/args from the records it ships.
+_root_handlers = list(root_logger.handlers)
+for _handler in _root_handlers:
+    root_logger.removeHandler(_handler)
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_root_handlers, respect_handler_level=True)
+_log_listener.start()
+root_logger.addHandler(QueueHandler(_log_queue))
+
 # Attach Datadog logging handler when enabled
 if settings.datadog_logs_enabled:
     try:
@@ -58,39 +78,59 @@ logging.getLogger("pymongo").setLevel(logging.INFO)
 logging.getLogger("motor").setLevel(logging.INFO)
 
 logger = logging.getLogger(__name__)
-logger.info(f"Logging configured at level: {settings.log_level.upper()}")
-
+logger.info("Logging configured at level: %s", settings.log_level.upper())
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan manager for startup and shutdown events."""
-    # Startup
-    logger.info("Starting Sensei League of Legends Coach API...")
-    logger.info(f"Environment: {settings.environment}")
 
-    # Verify all champion data directories exist with correct structure (172 champions each)
+def _validate_champion_data() -> None:
+    """Verify all champion data directories exist with correct structure (172 champions each)."""
     try:
         ensure_all_champion_data_exists()
     except FileNotFoundError:
         logger.exception("Champion data validation failed")
         raise
 
-    # Ensure MongoDB is reachable
-    mongo_client = get_mongo_client()
+
+async def _ping_mongo() -> None:
+    """Ensure MongoDB is reachable."""
     try:
-        await mongo_client.admin.command("ping")
+        await get_mongo_client().admin.command("ping")
         logger.info("Connected to MongoDB")
     except Exception:
         logger.exception("Unable to connect to MongoDB")
         raise
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager for startup and shutdown events."""
+    # Startup
+    logger.info("Starting Sensei League of Legends Coach API...")
+    logger.info("Environment: %s", settings.environment)
+
+    # Independent startup checks run concurrently
+    await asyncio.gather(
+        asyncio.to_thread(_validate_champion_data),
+        _ping_mongo(),
+    )
+
+    # Cached for the readiness probe; the data does not change while running
+    app.state.champions_loaded = assistant.count_champion_files()
+
+    session_manager.start_cleanup_task()
+
     logger.info("Application startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down Sensei League of Legends Coach API...")
-    close_mongo_client()
+    await session_manager.stop_cleanup_task()
+    await close_mongo_client()
+    await close_auth0_client()
+    await close_session_store()
+
+    # Flush queued log records
+    _log_listener.stop()
 
 
 # Create FastAPI application
@@ -99,18 +139,29 @@ app = FastAPI(
     description="AI-powered League of Legends coaching assistant using multimodal analysis",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
 
+# Cap coach upload bodies, declared or chunked, before multipart parsing buffers them.
+# The allowance covers the audio file, game stats and multipart framing.
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_bytes=settings.max_file_size_bytes + settings.max_game_stats_bytes + 64 * 1024,
+    paths=("/api/v1/assistant/coach",),
+)
+
 # Configure CORS
 allowed_origins = ["*"] if settings.environment == "development" else settings.allowed_origins
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists let the middleware answer preflights with precomputed
+    # headers instead of echoing the requested ones
+    allow_methods=("GET", "POST", "OPTIONS"),
+    allow_headers=("Authorization", "Content-Type"),
 )
 
 # Register routers
@@ -120,18 +171,22 @@ app.include_router(user_routes.router)
 app.include_router(assistant.router)
 
 
+# Static body, serialized once; each request still gets its own Response because
+# middleware (CORS) mutates response headers in place
+_ROOT_BODY = orjson.dumps(
+    {
+        "service": "Sensei - League of Legends AI Coach",
+        "version": "1.0.0",
+        "status": "running",
+        "docs": "/docs",
+    }
+)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return JSONResponse(
-        status_code=200,
-        content={
-            "service": "Sensei - League of Legends AI Coach",
-            "version": "1.0.0",
-            "status": "running",
-            "docs": "/docs",
-        },
-    )
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
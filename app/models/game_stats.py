@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field, field_validator
-import json
+import orjson
 
 
 class GameStats(BaseModel):
@@ -26,9 +26,8 @@ class GameStats(BaseModel):
         """
         from app.config import settings
 
-        # Serialize to JSON to check byte size
-        json_str = json.dumps(v, ensure_ascii=False)
-        size_bytes = len(json_str.encode('utf-8'))
+        # Serialize straight to UTF-8 bytes to check the size
+        size_bytes = len(orjson.dumps(v))
 
         if size_bytes > settings.max_game_stats_bytes:
             size_kb = size_bytes / 1024
@@ -41,4 +40,4 @@ class GameStats(BaseModel):
 
     def to_json_string(self) -> str:
         """Convert game stats to JSON string for inclusion in prompt."""
-        return json.dumps(self.data, indent=2, ensure_ascii=False)
+        return orjson.dumps(self.data, option=orjson.OPT_INDENT_2).decode()
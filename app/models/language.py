@@ -1,6 +1,68 @@
 """Language support models and utilities."""
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+_DISPLAY_NAMES: Dict[str, str] = {
+    "arabic": "Arabic (العربية)",
+    "chinese": "Chinese (中文)",
+    "czech": "Czech (Čeština)",
+    "danish": "Danish (Dansk)",
+    "dutch": "Dutch (Nederlands)",
+    "english": "English",
+    "filipino": "Filipino",
+    "finnish": "Finnish (Suomi)",
+    "french": "French (Français)",
+    "german": "German (Deutsch)",
+    "greek": "Greek (Ελληνικά)",
+    "hebrew": "Hebrew (עברית)",
+    "hindi": "Hindi (हिन्दी)",
+    "indonesian": "Indonesian (Bahasa Indonesia)",
+    "italian": "Italian (Italiano)",
+    "japanese": "Japanese (日本語)",
+    "korean": "Korean (한국어)",
+    "malay": "Malay (Bahasa Melayu)",
+    "norwegian": "Norwegian (Norsk)",
+    "persian": "Persian (فارسی)",
+    "polish": "Polish (Polski)",
+    "portuguese": "Portuguese (Português)",
+    "russian": "Russian (Русский)",
+    "spanish": "Spanish (Español)",
+    "swedish": "Swedish (Svenska)",
+    "thai": "Thai (ไทย)",
+    "turkish": "Turkish (Türkçe)",
+    "vietnamese": "Vietnamese (Tiếng Việt)",
+}
+
+_ISO_CODES: Dict[str, str] = {
+    "english": "en",
+    "persian": "fa",
+    "spanish": "es",
+    "french": "fr",
+    "german": "de",
+    "italian": "it",
+    "portuguese": "pt",
+    "russian": "ru",
+    "japanese": "ja",
+    "korean": "ko",
+    "chinese": "zh",
+    "arabic": "ar",
+    "turkish": "tr",
+    "polish": "pl",
+    "dutch": "nl",
+    "swedish": "sv",
+    "danish": "da",
+    "norwegian": "no",
+    "finnish": "fi",
+    "czech": "cs",
+    "greek": "el",
+    "hebrew": "he",
+    "hindi": "hi",
+    "thai": "th",
+    "vietnamese": "vi",
+    "indonesian": "id",
+    "malay": "ms",
+    "filipino": "fil",
+}
 
 
 class SupportedLanguage(str, Enum):
@@ -45,37 +107,7 @@ class SupportedLanguage(str, Enum):
         Returns:
             Human-readable display name
         """
-        display_names = {
-            "arabic": "Arabic (العربية)",
-            "chinese": "Chinese (中文)",
-            "czech": "Czech (Čeština)",
-            "danish": "Danish (Dansk)",
-            "dutch": "Dutch (Nederlands)",
-            "english": "English",
-            "filipino": "Filipino",
-            "finnish": "Finnish (Suomi)",
-            "french": "French (Français)",
-            "german": "German (Deutsch)",
-            "greek": "Greek (Ελληνικά)",
-            "hebrew": "Hebrew (עברית)",
-            "hindi": "Hindi (हिन्दी)",
-            "indonesian": "Indonesian (Bahasa Indonesia)",
-            "italian": "Italian (Italiano)",
-            "japanese": "Japanese (日本語)",
-            "korean": "Korean (한국어)",
-            "malay": "Malay (Bahasa Melayu)",
-            "norwegian": "Norwegian (Norsk)",
-            "persian": "Persian (فارسی)",
-            "polish": "Polish (Polski)",
-            "portuguese": "Portuguese (Português)",
-            "russian": "Russian (Русский)",
-            "spanish": "Spanish (Español)",
-            "swedish": "Swedish (Svenska)",
-            "thai": "Thai (ไทย)",
-            "turkish": "Turkish (Türkçe)",
-            "vietnamese": "Vietnamese (Tiếng Việt)",
-        }
-        return display_names.get(language.lower(), language.capitalize())
+        return _DISPLAY_NAMES.get(language.lower(), language.capitalize())
 
     @classmethod
     def get_iso_code(cls, language: str) -> Optional[str]:
@@ -88,37 +120,7 @@ class SupportedLanguage(str, Enum):
         Returns:
             ISO-639-1 code or None if not found
         """
-        iso_codes = {
-            "english": "en",
-            "persian": "fa",
-            "spanish": "es",
-            "french": "fr",
-            "german": "de",
-            "italian": "it",
-            "portuguese": "pt",
-            "russian": "ru",
-            "japanese": "ja",
-            "korean": "ko",
-            "chinese": "zh",
-            "arabic": "ar",
-            "turkish": "tr",
-            "polish": "pl",
-            "dutch": "nl",
-            "swedish": "sv",
-            "danish": "da",
-            "norwegian": "no",
-            "finnish": "fi",
-            "czech": "cs",
-            "greek": "el",
-            "hebrew": "he",
-            "hindi": "hi",
-            "thai": "th",
-            "vietnamese": "vi",
-            "indonesian": "id",
-            "malay": "ms",
-            "filipino": "fil",
-        }
-        return iso_codes.get(language.lower())
+        return _ISO_CODES.get(language.lower())
 
     @classmethod
     def list_all(cls) -> List[Dict[str, str]]:
@@ -128,14 +130,18 @@ class SupportedLanguage(str, Enum):
         Returns:
             List of dictionaries containing language information
         """
-        return [
-            {
-                "code": lang.value,
-                "name": cls.get_display_name(lang.value),
-                "iso_code": cls.get_iso_code(lang.value),
-            }
-            for lang in cls
-        ]
+        return list(_ALL_LANGUAGES)
+
+
+# Built once at import; list_all() hands out a shallow copy
+_ALL_LANGUAGES: Tuple[Dict[str, str], ...] = tuple(
+    {
+        "code": lang.value,
+        "name": SupportedLanguage.get_display_name(lang.value),
+        "iso_code": SupportedLanguage.get_iso_code(lang.value),
+    }
+    for lang in SupportedLanguage
+)
 
 
 # Convenience functions for external use
@@ -0,0 +1,35 @@
+"""Player role model."""
+from enum import Enum
+
+
+class Role(str, Enum):
+    """Player roles used for playbooks, guides and builds."""
+    TOP = "top"
+    JUNGLE = "jungle"
+    MID = "mid"
+    ADC = "adc"
+    SUPPORT = "support"
+    UNKNOWN = "unknown"
+
+    def __init__(self, value: str):
+        # Pre-cased forms used when rendering prompts
+        self.display = value.capitalize()
+        self.upper_name = value.upper()
+
+    def __str__(self) -> str:
+        return self.value
+
+    @classmethod
+    def parse(cls, role: str) -> "Role":
+        """
+        Convert a role string (case-insensitive) to a Role.
+
+        Args:
+            role: Role name (e.g., "top", "Jungle") or Role member
+
+        Returns:
+            Matching Role, or Role.UNKNOWN if not recognized
+        """
+        if isinstance(role, cls):
+            return role
+        return cls._value2member_map_.get(role.lower().strip(), cls.UNKNOWN)
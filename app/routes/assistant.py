@@ -19,41 +19,69 @@ Authentication:
 All coaching endpoints require authentication via JWT token (Bearer token).
 """
 
-import json
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from fastapi.responses import JSONResponse, Response, StreamingResponse
-from pydantic import ValidationError
+import orjson
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
-from app.assistant.agent import get_coach_advice
-from app.assistant.knowledge_agent import get_knowledge_advice
+from app.assistant.agent import get_coach_advice_stream
+from app.assistant.knowledge_agent import get_knowledge_advice_stream
 from app.assistant.models import CoachResponse
 from app.assistant.session import session_manager
 from app.assistant.stt import transcribe_audio
-from app.assistant.tts import text_to_speech, text_to_speech_stream
+from app.assistant.tts import text_stream_to_speech
 from app.auth.dependencies import get_current_user
 from app.config import settings
 from app.handlers.audio import validate_and_process_audio
 from app.models.language import SupportedLanguage, get_language_code, get_all_supported_languages
 from app.users.models import User
-from app.models.game_stats import GameStats
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["assistant"])
 
+# Static response bodies, serialized once at import
+_SUPPORTED_LANGUAGES = get_all_supported_languages()
+_LANGUAGES_PAYLOAD = orjson.dumps(
+    {
+        "languages": _SUPPORTED_LANGUAGES,
+        "default": "english",
+        "count": len(_SUPPORTED_LANGUAGES),
+    }
+)
+_HEALTH_PAYLOAD = orjson.dumps({"status": "healthy", "service": "sensei-lol-coach"})
+_SUGGESTIONS_PAYLOAD = orjson.dumps(
+    {
+        "suggestions": [
+            "What's the best second item for me here?",
+            "What should we do after taking mid inhib?",
+            "Should I freeze or push the wave right now?",
+            "Who should I focus in teamfights?",
+        ],
+    }
+)
+
+
+def count_champion_files() -> int:
+    """Count champion XML files in the champions data directory."""
+    return sum(1 for _ in settings.champions_dir.glob("*.xml"))
 
-# Start session cleanup background task on module import
-@router.on_event("startup")
-async def startup_event():
-    """Start background tasks on application startup."""
-    session_manager.start_cleanup_task()
 
+async def _prime_stream(stream: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Pull the first chunk of a text stream now and return an equivalent stream."""
+    try:
+        first = await stream.__anext__()
+    except StopAsyncIteration:
+        first = ""
+
+    async def replay() -> AsyncIterator[str]:
+        yield first
+        async for chunk in stream:
+            yield chunk
 
-@router.on_event("shutdown")
-async def shutdown_event():
-    """Stop background tasks on application shutdown."""
-    session_manager.stop_cleanup_task()
+    return replay()
 
 
 @router.post("/assistant/coach")
@@ -118,8 +146,8 @@ async def in_game_coaching(
     ```
     """
     try:
-        logging.info("Coaching request from user %s (game_stats: %s)",
-                    user.id, "provided" if game_stats else "not provided")
+        logger.info("Coaching request from user %s (mode=%s)",
+                    user.id, "in-game" if game_stats and game_stats.strip() else "knowledge")
 
         # Validate and process uploaded audio file
         audio_bytes, mime_type = await validate_and_process_audio(
@@ -127,56 +155,52 @@ async def in_game_coaching(
         )
 
         # Transcribe audio using OpenAI Whisper
-        logging.info("Transcribing audio with Whisper language: %s",
-                    language.value, language or "auto-detect")
-        
-        user_question = transcribe_audio(
+        logger.info("Transcribing audio with Whisper language=%s", language.value)
+        user_question = await transcribe_audio(
             audio_bytes=audio_bytes,
             language=language,
         )
-        logging.info("Transcribed user question: %s", user_question)
+        logger.debug("Transcribed user question: %s", user_question)
 
         # Branch based on whether game_stats is provided
         if game_stats is None or game_stats.strip() == "":
             # Knowledge mode - no game stats
-            logging.info("Using knowledge mode (no game stats)")
-
             # Get or create knowledge session
             session = session_manager.get_or_create_knowledge_session(
                 user_id=str(user.id),
             )
 
-            # Get knowledge advice with transcribed question
-            coach_response: str = get_knowledge_advice(
+            # Stream knowledge advice for the transcribed question
+            advice_stream = get_knowledge_advice_stream(
                 session=session,
                 user_question=user_question,
                 language=language.value,
             )
         else:
             # In-game mode - with game stats
-            logging.info("Using in-game mode (with game stats)")
-
-            # Validate game_stats JSON size using Pydantic model
+            # (the raw body is already capped by BodySizeLimitMiddleware)
             try:
-                game_stats_dict = json.loads(game_stats)
-                # Validate size and convert to JSON string
-                validated_stats = GameStats(data=game_stats_dict)
-                game_stats_json = validated_stats.to_json_string()
-            except json.JSONDecodeError:
+                game_stats_dict = orjson.loads(game_stats)
+            except orjson.JSONDecodeError:
                 raise HTTPException(
                     status_code=400,
                     detail="Invalid JSON format for game_stats"
                 )
-            except ValidationError as e:
-                # Check if it's a size validation error
-                if "too large" in str(e).lower():
-                    raise HTTPException(
-                        status_code=413,
-                        detail=str(e)
-                    )
+            if not isinstance(game_stats_dict, dict):
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Game stats validation error: {str(e)}"
+                    detail="Game stats validation error: expected a JSON object"
+                )
+            # The limit applies to the normalized JSON, as in GameStats, so client
+            # whitespace and \u escapes don't count against it
+            size_bytes = len(orjson.dumps(game_stats_dict))
+            if size_bytes > settings.max_game_stats_bytes:
+                raise HTTPException(
+                    status_code=413,
+                    detail=(
+                        f"Game stats JSON too large: {size_bytes / 1024:.1f}KB "
+                        f"exceeds maximum {settings.max_game_stats_kb}KB"
+                    ),
                 )
 
             # Get or create session (removes any knowledge session for this user)
@@ -185,16 +209,17 @@ async def in_game_coaching(
                 user_id=str(user.id)
             )
 
-            # Get coaching advice using transcribed question
-            coach_response: str = get_coach_advice(
+            # Stream coaching advice for the transcribed question
+            advice_stream = get_coach_advice_stream(
                 session=session,
                 user_question=user_question,
-                game_stats_json=game_stats_json,
                 language=language.value,
+                game_stats_dict=game_stats_dict,
             )
 
-        # Convert text response to speech using OpenAI TTS with streaming
-        audio_stream = text_to_speech_stream(coach_response)
+        # Wait for the first text chunk so setup and LLM errors still surface as an
+        # HTTP error, then speak each sentence while the rest is generated
+        audio_stream = text_stream_to_speech(await _prime_stream(advice_stream))
 
         # Return streaming WAV audio
         return StreamingResponse(
@@ -211,9 +236,7 @@ async def in_game_coaching(
 
     except Exception as e:
         # Log the full error with traceback for debugging
-        import traceback
-        logging.error(f"Coach advice error: {str(e)}")
-        logging.error(f"Full traceback:\n{traceback.format_exc()}")
+        logger.exception("Coach advice error: %s", e)
 
         # Catch any other unexpected errors
         raise HTTPException(
@@ -223,7 +246,7 @@ async def in_game_coaching(
 
 
 @router.get("/health")
-async def health_check() -> JSONResponse:
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring and load balancers.
 
@@ -246,17 +269,11 @@ async def health_check() -> JSONResponse:
     ## Response Codes
     - **200 OK**: Service is running and healthy
     """
-    return JSONResponse(
-        status_code=200,
-        content={
-            "status": "healthy",
-            "service": "sensei-lol-coach",
-        },
-    )
+    return Response(content=_HEALTH_PAYLOAD, media_type="application/json")
 
 
 @router.get("/ready")
-async def readiness_check() -> JSONResponse:
+async def readiness_check(request: Request) -> ORJSONResponse:
     """
     Readiness check endpoint for monitoring and orchestration.
 
@@ -296,26 +313,29 @@ async def readiness_check() -> JSONResponse:
             detail="League of Legends champions data directory not found",
         )
 
-    # Check if there are champion files in the directory
-    champion_files = list(settings.champions_dir.glob("*.xml"))
-    if not champion_files:
+    # Champion count is cached at startup; only re-scan if it was never found
+    champions_loaded = getattr(request.app.state, "champions_loaded", 0)
+    if not champions_loaded:
+        champions_loaded = count_champion_files()
+        request.app.state.champions_loaded = champions_loaded
+    if not champions_loaded:
         raise HTTPException(
             status_code=503,
             detail="No champion data files found in champions directory",
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "status": "ready",
             "service": "sensei-lol-coach",
-            "champions_loaded": len(champion_files),
+            "champions_loaded": champions_loaded,
         },
     )
 
 
 @router.get("/languages")
-async def list_languages() -> JSONResponse:
+async def list_languages() -> Response:
     """
     List all supported languages for voice transcription and text-to-speech.
 
@@ -369,19 +389,11 @@ async def list_languages() -> JSONResponse:
       -F "language=japanese"
     ```
     """
-    languages = get_all_supported_languages()
-    return JSONResponse(
-        status_code=200,
-        content={
-            "languages": languages,
-            "default": "english",
-            "count": len(languages),
-        },
-    )
+    return Response(content=_LANGUAGES_PAYLOAD, media_type="application/json")
 
 
 @router.get("/suggestions")
-async def get_suggestions() -> JSONResponse:
+async def get_suggestions() -> Response:
     """
     Get suggested coaching questions for users.
 
@@ -416,16 +428,4 @@ async def get_suggestions() -> JSONResponse:
     These suggestions can be displayed in a client application to help users
     get started with voice coaching.
     """
-    suggestions = [
-        "What's the best second item for me here?",
-        "What should we do after taking mid inhib?",
-        "Should I freeze or push the wave right now?",
-        "Who should I focus in teamfights?",
-    ]
-
-    return JSONResponse(
-        status_code=200,
-        content={
-            "suggestions": suggestions,
-        },
-    )
+    return Response(content=_SUGGESTIONS_PAYLOAD, media_type="application/json")
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Optional
 
+from cachetools import TTLCache
 from motor.motor_asyncio import AsyncIOMotorCollection
 from pymongo import ReturnDocument
 
@@ -10,49 +10,93 @@ from app.core.mongodb import get_database
 from app.users.models import User, UserProfile
 
 
+# Users by id, so authenticated requests skip Mongo on repeat lookups. Writes in
+# this module invalidate their entry. Cache reads and writes never await, so no
+# lock is needed on the event loop. Cached users never carry the Auth0 refresh
+# token: it can be rotated by another worker at any time, and replaying a stale
+# one makes Auth0 revoke the whole token family.
+_user_cache: TTLCache[str, User] = TTLCache(maxsize=10_000, ttl=30)
+
+_WITHOUT_AUTH0_TOKEN = {"auth0RefreshToken": False}
+
+
+def forget_user(user_id: str) -> None:
+    """Drop a user from the lookup cache (e.g. on logout)."""
+    _user_cache.pop(user_id, None)
+
+
+_collection: Optional[AsyncIOMotorCollection] = None
+
+
 def _get_collection() -> AsyncIOMotorCollection:
-    db = get_database()
-    return db["users"]
+    """Return the process-wide users collection handle, created on first use."""
+    global _collection
+    if _collection is None:
+        _collection = get_database()["users"]
+    return _collection
 
 
 async def upsert_user(profile: UserProfile) -> User:
-    now = datetime.now(timezone.utc)
     collection = _get_collection()
-    update = {
-        "$set": {
-            "email": profile.email,
-            "displayName": profile.name or profile.nickname,
-            "pictureUrl": profile.picture,
-            "updatedAt": now,
-            "lastLoginAt": now,
-        },
-        "$setOnInsert": {
-            "createdAt": now,
-        },
-    }
+    # Pipeline update so the server stamps all timestamps with its own clock
+    # ($$NOW), including createdAt on insert. Profile values are wrapped in
+    # $literal so strings starting with "$" are not read as field paths.
+    update = [
+        {
+            "$set": {
+                "email": {"$literal": profile.email},
+                "displayName": {"$literal": profile.name or profile.nickname},
+                "pictureUrl": {"$literal": profile.picture},
+                "updatedAt": "$$NOW",
+                "lastLoginAt": "$$NOW",
+                "createdAt": {"$ifNull": ["$createdAt", "$$NOW"]},
+            }
+        }
+    ]
+    _user_cache.pop(profile.sub, None)
+    # One round trip for both new and returning users; the stored Auth0 refresh
+    # token is not needed by the login flow (it is rewritten right after), so it
+    # is left out of the returned document.
     document = await collection.find_one_and_update(
         {"_id": profile.sub},
         update,
+        projection=_WITHOUT_AUTH0_TOKEN,
         upsert=True,
         return_document=ReturnDocument.AFTER,
     )
     return User(**document)
 
 
-async def get_user_by_id(user_id: str) -> Optional[User]:
+async def get_user_by_id(user_id: str, use_cache: bool = True) -> Optional[User]:
+    """Look up a user by id.
+
+    The cached path (the default, used per authenticated request) returns users
+    without ``auth0_refresh_token``. Pass ``use_cache=False`` to read the full,
+    current document from Mongo, as the token refresh flow must.
+    """
     collection = _get_collection()
-    document = await collection.find_one({"_id": user_id})
+    if not use_cache:
+        document = await collection.find_one({"_id": user_id})
+        return User(**document) if document else None
+
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+    document = await collection.find_one({"_id": user_id}, projection=_WITHOUT_AUTH0_TOKEN)
     if not document:
         return None
-    return User(**document)
+    user = User(**document)
+    _user_cache[user_id] = user
+    return user
 
 
 async def update_auth0_refresh_token(user_id: str, auth0_refresh_token: str) -> Optional[User]:
     """Update the Auth0 refresh token for a user."""
+    _user_cache.pop(user_id, None)
     collection = _get_collection()
     document = await collection.find_one_and_update(
         {"_id": user_id},
-        {"$set": {"auth0RefreshToken": auth0_refresh_token, "updatedAt": datetime.now(timezone.utc)}},
+        {"$set": {"auth0RefreshToken": auth0_refresh_token}, "$currentDate": {"updatedAt": True}},
         return_document=ReturnDocument.AFTER,
     )
     if not document:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response
 
 from app.auth.dependencies import get_current_user
 from app.users.models import User
@@ -8,6 +9,7 @@ from app.users.models import User
 router = APIRouter(prefix="/api/v1/users", tags=["users"])
 
 
-@router.get("/me", response_model=User)
-async def get_current_user_profile(user: User = Depends(get_current_user)) -> User:
-    return user
+@router.get("/me", response_model=None, responses={200: {"model": User}})
+async def get_current_user_profile(user: User = Depends(get_current_user)) -> Response:
+    # The user is already validated; serialize it straight to JSON in one pass
+    return Response(content=user.model_dump_json(by_alias=True), media_type="application/json")
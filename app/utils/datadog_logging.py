@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import gzip
 import logging
+import queue
 import socket
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import orjson
+import urllib3
+from urllib3.exceptions import ReadTimeoutError
 from datadog_api_client import ApiClient, Configuration
 from datadog_api_client.v2.api.logs_api import LogsApi
 from datadog_api_client.v2.model.http_log import HTTPLog
@@ -13,6 +20,10 @@ from datadog_api_client.v2.model.http_log_item import HTTPLogItem
 
 from app.config import Settings
 
+# Datadog HTTP intake limits per request (uncompressed payload)
+_INTAKE_MAX_ITEMS = 1000
+_INTAKE_MAX_BYTES = 5 * 1024 * 1024
+
 
 class DatadogLogHandler(logging.Handler):
     """Custom logging handler that ships records to Datadog Logs."""
@@ -33,11 +44,35 @@ class DatadogLogHandler(logging.Handler):
 
         self._client = ApiClient(configuration)
         self._api = LogsApi(self._client)
+
+        # Batches go straight to the HTTP intake as gzipped JSON; the SDK path is
+        # only used as a fallback
+        self._intake_url = f"https://http-intake.logs.{settings.datadog_site}/api/v2/logs"
+        self._intake_headers = {
+            "DD-API-KEY": settings.datadog_api_key,
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+        }
+        self._http = urllib3.PoolManager(maxsize=4)
         self._service = settings.datadog_service
         self._env = settings.datadog_env
         self._version = settings.datadog_version
         self._hostname = self._resolve_hostname()
         self._ddtags = f"service:{self._service},env:{self._env},version:{self._version}"
+        # Logger names are a small fixed set, so their tag strings are built once
+        self._tags_by_logger: Dict[str, str] = {}
+
+        # emit() only enqueues; a worker thread batches records and sends them in
+        # one submit_log call when the batch is full or the flush interval elapses.
+        # When the queue is full, new records are dropped rather than blocking callers.
+        self._max_batch = settings.datadog_log_batch_size
+        self._flush_interval = settings.datadog_log_flush_interval_seconds
+        self._queue: "queue.Queue[Optional[Tuple[str, str, str]]]" = queue.Queue(
+            maxsize=settings.datadog_log_queue_size
+        )
+        self._dropped = 0
+        self._worker = threading.Thread(target=self._run, name="datadog-log-worker", daemon=True)
+        self._worker.start()
 
     @staticmethod
     def _resolve_hostname() -> str:
@@ -46,26 +81,115 @@ class DatadogLogHandler(logging.Handler):
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            message = self.format(record)
-            payload = HTTPLog(
-                [
-                    HTTPLogItem(
-                        ddsource="python",
-                        ddtags=f"{self._ddtags},logger:{record.name}",
-                        hostname=self._hostname,
-                        message=message,
-                        service=self._service,
-                        status=record.levelname.lower(),
-                    )
-                ]
-            )
-            self._api.submit_log(body=payload)
+            # Format here so the worker never sees arguments mutated after the call
+            self._queue.put_nowait((record.name, self.format(record), record.levelname.lower()))
+        except queue.Full:
+            # The worker reads and resets the counter under the same (reentrant) lock
+            with self.lock:
+                self._dropped += 1
         except Exception:  # pragma: no cover - never raise log handler errors
             self.handleError(record)
 
+    def _run(self) -> None:
+        # One buffer for the worker's lifetime: _submit serializes it before it is cleared
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + self._flush_interval
+        while True:
+            try:
+                entry = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                entry = ()
+            if entry is None:
+                self._submit(batch)
+                return
+            if entry:
+                name, message, status = entry
+                batch.append(self._log_item(name, message, status))
+            if len(batch) >= self._max_batch or time.monotonic() >= deadline:
+                self._submit(batch)
+                batch.clear()
+                deadline = time.monotonic() + self._flush_interval
+
+    def _log_item(self, logger_name: str, message: str, status: str) -> Dict[str, Any]:
+        tags = self._tags_by_logger.get(logger_name)
+        if tags is None:
+            tags = self._tags_by_logger[logger_name] = f"{self._ddtags},logger:{logger_name}"
+        return {
+            "ddsource": "python",
+            "ddtags": tags,
+            "hostname": self._hostname,
+            "message": message,
+            "service": self._service,
+            "status": status,
+        }
+
+    def _submit(self, batch: List[Dict[str, Any]]) -> None:
+        with self.lock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            batch.append(
+                self._log_item(__name__, f"Dropped {dropped} log records: Datadog log queue was full", "warning")
+            )
+        if not batch:
+            return
+        # Each request is accepted or rejected as a whole, so only the items of
+        # requests that failed go to the SDK fallback
+        failed: List[Dict[str, Any]] = []
+        for items, body in self._intake_requests(batch):
+            if not self._post_to_intake(body):
+                failed.extend(items)
+        if not failed:
+            return
+        try:
+            self._api.submit_log(body=HTTPLog([HTTPLogItem(**item) for item in failed]))
+        except Exception:  # pragma: no cover - dropping logs beats crashing the worker
+            pass
+
+    @staticmethod
+    def _intake_requests(
+        batch: List[Dict[str, Any]],
+    ) -> Iterator[Tuple[List[Dict[str, Any]], bytes]]:
+        """Split a batch into (items, JSON body) pairs within the intake's per-request limits."""
+        items: List[Dict[str, Any]] = []
+        encoded: List[bytes] = []
+        size = 2
+        for item in batch:
+            data = orjson.dumps(item)
+            if items and (len(items) >= _INTAKE_MAX_ITEMS or size + len(data) + 1 > _INTAKE_MAX_BYTES):
+                yield items, b"[" + b",".join(encoded) + b"]"
+                items, encoded, size = [], [], 2
+            items.append(item)
+            encoded.append(data)
+            size += len(data) + 1
+        if items:
+            yield items, b"[" + b",".join(encoded) + b"]"
+
+    def _post_to_intake(self, body: bytes) -> bool:
+        """POST one request body to the HTTP intake; False only if it surely wasn't delivered."""
+        try:
+            response = self._http.request(
+                "POST",
+                self._intake_url,
+                body=gzip.compress(body),
+                headers=self._intake_headers,
+                retries=False,
+            )
+        except ReadTimeoutError:
+            # The body was sent and may have been accepted; resending could duplicate it
+            return True
+        except Exception:
+            return False
+        return response.status < 400
+
     def close(self) -> None:
         try:
+            # Sentinel: the worker sends what it has buffered and exits
+            self._queue.put(None, timeout=self._flush_interval)
+            self._worker.join(timeout=10)
+            self._http.clear()
             self._client.close()
+        except Exception:  # pragma: no cover - shutdown is best effort
+            pass
         finally:
             super().close()
 
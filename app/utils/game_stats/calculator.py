@@ -2,13 +2,33 @@
 Game state calculator - Processes events and calculates objectives, structures, and battle log
 """
 
-from typing import Optional, List
-from .models import MatchState, Team, GameEventLog
+import heapq
+from bisect import insort
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Dict, Optional, List, Tuple
+from .models import MatchState, Player, Team, GameEventLog
+
+
+@lru_cache(maxsize=4096)
+def _format_mmss(total_seconds: int) -> str:
+    """MM:SS for a whole number of seconds; many events share the same second"""
+    m, s = divmod(total_seconds, 60)
+    return f"{m}:{s:02d}"
 
 
 class GameCalculator:
     """Calculates game statistics from events and enriches the MatchState"""
 
+    # Turret position code (third token of e.g. "Turret_TChaos_L1_P3_...") -> display name
+    _POS_TO_NAME = {
+        "P1": "Inhib Turret",
+        "P2": "Tier 2",
+        "P3": "Tier 1",
+        "P4": "Nexus Turret",
+        "P5": "Nexus Turret",
+    }
+
     def __init__(self, state: MatchState, raw_events: list):
         """
         Initialize calculator with game state and event data
@@ -21,28 +41,29 @@ class GameCalculator:
         self.events = raw_events
         self.lane_map = {"L0": "Bottom", "L1": "Middle", "L2": "Top"}
 
-        # Mapping Summoner Name to Champion Name for clean logs
-        self.sum_to_champ = {}
-        # Mapping for name resolution (handles both full names with tags and game names without tags)
-        self.name_to_player = {}
-        all_p = self.state.allies.players + self.state.enemies.players
-        for p in all_p:
-            self.sum_to_champ[p.summoner_name] = p.champion_name
-            # Store player by full summoner name
-            self.name_to_player[p.summoner_name] = p
-            # Also store by game name without tag (if applicable)
-            if '#' in p.summoner_name:
-                game_name = p.summoner_name.split('#')[0]
-                self.name_to_player[game_name] = p
-            # Store by champion name as well
-            self.name_to_player[p.champion_name] = p
+        # Name resolution is built by GameParser; fill it here only for hand-built states
+        if not self.state.name_index:
+            for team in (self.state.allies, self.state.enemies):
+                for p in team.players:
+                    self.state.index_player(p, team)
+        self._resolve: Dict[str, Tuple[Player, Team]] = self.state.name_index
+
+        # EventName -> handler, so each event costs a single dict lookup
+        self._event_handlers: Dict[str, Callable[[dict, Optional[str], str, str], str]] = {
+            'ChampionKill': self._on_champion_kill,
+            'TurretKilled': self._on_turret,
+            'InhibKilled': self._on_inhib,
+            'DragonKill': self._on_dragon,
+            'BaronKill': self._on_baron,
+            'HeraldKill': self._on_herald,
+            'HordeKill': self._on_horde,
+        }
 
     def process(self):
         """Process all calculations and enrich the state"""
         self._calc_scores()
         self._format_time()
-        self._process_structures_and_objectives()
-        self._process_event_history()
+        self._process_events()
 
     def _calc_scores(self):
         """Calculate total team kills"""
@@ -51,15 +72,12 @@ class GameCalculator:
 
     def _format_time(self):
         """Format game time as MM:SS"""
-        mins = int(self.state.game_time // 60)
-        secs = int(self.state.game_time % 60)
-        self.state.formatted_time = f"{mins}:{secs:02d}"
+        self.state.formatted_time = self._format_timestamp(self.state.game_time)
 
-    def _format_timestamp(self, seconds: float) -> str:
+    @staticmethod
+    def _format_timestamp(seconds: float) -> str:
         """Format a timestamp as MM:SS"""
-        m = int(seconds // 60)
-        s = int(seconds % 60)
-        return f"{m}:{s:02d}"
+        return _format_mmss(int(seconds))
 
     def _get_team_for_entity(self, killer_name: str, raw_team_str: str = "") -> Optional[Team]:
         """
@@ -75,13 +93,10 @@ class GameCalculator:
         if not killer_name:
             return None
 
-        # 1. Try using the name_to_player mapping (handles full names, game names without tags, and champion names)
-        if killer_name in self.name_to_player:
-            player = self.name_to_player[killer_name]
-            if player in self.state.allies.players:
-                return self.state.allies
-            elif player in self.state.enemies.players:
-                return self.state.enemies
+        # 1. Try the name resolution map (handles full names, game names without tags, and champion names)
+        got = self._resolve.get(killer_name)
+        if got is not None:
+            return got[1]
 
         # 2. Try by raw string (e.g., TChaos)
         if "Chaos" in raw_team_str:
@@ -91,75 +106,6 @@ class GameCalculator:
 
         return None
 
-    def _process_structures_and_objectives(self):
-        """Process structure destruction and objective captures"""
-        for e in self.events:
-            name = e.get('EventName')
-            time = e.get('EventTime', 0.0)
-            formatted_time = self._format_timestamp(time)
-
-            # --- STRUCTURES ---
-            if name == 'TurretKilled':
-                token = e.get('TurretKilled', '')
-                parts = token.split('_')
-                if len(parts) >= 4:
-                    team_raw, lane_code, pos = parts[1], parts[2], parts[3]
-
-                    # Target team is who LOST the turret
-                    target_team = None
-                    if "Chaos" in team_raw:
-                        target_team = self.state.allies if self.state.allies.team_id == "CHAOS" else self.state.enemies
-                    else:
-                        target_team = self.state.allies if self.state.allies.team_id == "ORDER" else self.state.enemies
-
-                    pos_name = "Tier 1"
-                    if "P2" in pos:
-                        pos_name = "Tier 2"
-                    if "P1" in pos:
-                        pos_name = "Inhib Turret"
-                    if "P4" in pos or "P5" in pos:
-                        pos_name = "Nexus Turret"
-
-                    lane_name = self.lane_map.get(lane_code, "Unknown")
-                    if lane_name in target_team.lanes:
-                        target_team.lanes[lane_name].turrets_lost.append(pos_name)
-
-            elif name == 'InhibKilled':
-                token = e.get('InhibKilled', '')
-                parts = token.split('_')
-                if len(parts) >= 3:
-                    team_raw, lane_code = parts[1], parts[2]
-
-                    target_team = None
-                    if "Chaos" in team_raw:
-                        target_team = self.state.allies if self.state.allies.team_id == "CHAOS" else self.state.enemies
-                    else:
-                        target_team = self.state.allies if self.state.allies.team_id == "ORDER" else self.state.enemies
-
-                    lane_name = self.lane_map.get(lane_code, "Unknown")
-                    if lane_name in target_team.lanes:
-                        target_team.lanes[lane_name].inhib_lost = True
-
-            # --- OBJECTIVES ---
-            # For objectives, we check the Killer to see who GAINED it
-            killer_name = e.get('KillerName')
-            killer_team = self._get_team_for_entity(killer_name)
-
-            if killer_team:
-                if name == 'DragonKill':
-                    d_type = e.get('DragonType', 'Unknown')
-                    killer_team.dragons.count += 1
-                    killer_team.dragons.timers.append(f"{formatted_time} ({d_type})")
-                elif name == 'BaronKill':
-                    killer_team.barons.count += 1
-                    killer_team.barons.timers.append(f"{formatted_time}")
-                elif name == 'HeraldKill':
-                    killer_team.heralds.count += 1
-                    killer_team.heralds.timers.append(f"{formatted_time}")
-                elif name == 'HordeKill':  # Void Grubs
-                    killer_team.grubs.count += 1
-                    killer_team.grubs.timers.append(f"{formatted_time}")
-
     def _get_champion_with_team(self, player_name: str) -> str:
         """
         Get champion name with team tag for display
@@ -173,67 +119,124 @@ class GameCalculator:
         if not player_name:
             return "Minion/Monster"
 
-        # Try to find the player
-        if player_name in self.name_to_player:
-            player = self.name_to_player[player_name]
+        got = self._resolve.get(player_name)
+        if got is not None:
+            player = got[0]
             return f"{player.champion_name} ({player.team_id})"
 
-        # Fallback: check if it's already a champion name
-        champion_name = self.sum_to_champ.get(player_name, player_name)
-        if champion_name and champion_name != player_name:
-            # We found a champion name, now find the team
-            if player_name in self.name_to_player:
-                player = self.name_to_player[player_name]
-                return f"{champion_name} ({player.team_id})"
-            return champion_name
+        return player_name
 
-        return player_name if player_name else "Minion/Monster"
-
-    def _process_event_history(self):
-        """Process event history and build battle log"""
-        all_logs = []
+    def _team_losing(self, team_raw: str) -> Team:
+        """Resolve the team that owns a structure from its raw team token (e.g. "TChaos")"""
+        if "Chaos" in team_raw:
+            return self.state.allies if self.state.allies.team_id == "CHAOS" else self.state.enemies
+        return self.state.allies if self.state.allies.team_id == "ORDER" else self.state.enemies
+
+    # --- EVENT HANDLERS ---
+    # Each handler applies the event to the state and returns its battle log message
+
+    def _on_champion_kill(self, e: dict, killer_key: Optional[str], killer: str, formatted_time: str) -> str:
+        """Log a champion kill"""
+        victim = self._get_champion_with_team(e.get('VictimName'))
+        return f"{killer} killed {victim}"
+
+    def _on_turret(self, e: dict, killer_key: Optional[str], killer: str, formatted_time: str) -> str:
+        """Record a lost turret on its lane"""
+        parts = e.get('TurretKilled', '').split('_')
+        if len(parts) >= 4:
+            team_raw, lane_code, pos = parts[1], parts[2], parts[3]
+
+            # Target team is who LOST the turret
+            target_team = self._team_losing(team_raw)
+
+            pos_name = self._POS_TO_NAME.get(pos, "Tier 1")
+            lane_name = self.lane_map.get(lane_code, "Unknown")
+            if lane_name in target_team.lanes:
+                # Kept sorted on insert so the report can print it as-is
+                insort(target_team.lanes[lane_name].turrets_lost, pos_name)
+        return f"{killer} destroyed a Turret"
+
+    def _on_inhib(self, e: dict, killer_key: Optional[str], killer: str, formatted_time: str) -> str:
+        """Record a lost inhibitor on its lane"""
+        parts = e.get('InhibKilled', '').split('_')
+        if len(parts) >= 3:
+            team_raw, lane_code = parts[1], parts[2]
+            target_team = self._team_losing(team_raw)
+
+            lane_name = self.lane_map.get(lane_code, "Unknown")
+            if lane_name in target_team.lanes:
+                target_team.lanes[lane_name].inhib_lost = True
+        return f"{killer} destroyed an Inhibitor"
+
+    # For objectives, we check the Killer to see who GAINED it
+
+    def _on_dragon(self, e: dict, killer_key: Optional[str], killer: str, formatted_time: str) -> str:
+        """Credit a dragon to the killing team"""
+        killer_team = self._get_team_for_entity(killer_key)
+        if killer_team:
+            d_type = e.get('DragonType', 'Unknown')
+            killer_team.dragons.count += 1
+            killer_team.dragons.timers.append(f"{formatted_time} ({d_type})")
+        return f"{killer} took {e.get('DragonType', 'Elemental')} Dragon"
+
+    def _on_baron(self, e: dict, killer_key: Optional[str], killer: str, formatted_time: str) -> str:
+        """Credit Baron Nashor to the killing team"""
+        killer_team = self._get_team_for_entity(killer_key)
+        if killer_team:
+            killer_team.barons.count += 1
+            killer_team.barons.timers.append(formatted_time)
+        return f"{killer} took Baron Nashor"
+
+    def _on_herald(self, e: dict, killer_key: Optional[str], killer: str, formatted_time: str) -> str:
+        """Credit Rift Herald to the killing team"""
+        killer_team = self._get_team_for_entity(killer_key)
+        if killer_team:
+            killer_team.heralds.count += 1
+            killer_team.heralds.timers.append(formatted_time)
+        return f"{killer} took Rift Herald"
+
+    def _on_horde(self, e: dict, killer_key: Optional[str], killer: str, formatted_time: str) -> str:
+        """Credit Void Grubs to the killing team"""
+        killer_team = self._get_team_for_entity(killer_key)
+        if killer_team:
+            killer_team.grubs.count += 1
+            killer_team.grubs.timers.append(formatted_time)
+        return f"{killer} took Void Grubs"
+
+    def _process_events(self):
+        """Process structures, objectives and the battle log in a single pass over the events"""
+        # Split by age during the pass so only the logs that can be shown get sorted
+        recent_logs = []
+        older_logs = []
+        # Bind hot attributes to locals once instead of per event
+        get_handler = self._event_handlers.get
+        resolve = self._get_champion_with_team
+        fmt = self._format_timestamp
+        game_time = self.state.game_time
 
         for e in self.events:
-            ago = int(self.state.game_time - e['EventTime'])
-            ev_name = e.get('EventName')
-
-            # Resolve Killer/Victim to Champion Names with Team
-            killer_key = e.get('KillerName')
-            victim_key = e.get('VictimName')
-
-            killer = self._get_champion_with_team(killer_key)
-            victim = self._get_champion_with_team(victim_key)
-
-            msg = ""
-            if ev_name == 'ChampionKill':
-                msg = f"{killer} killed {victim}"
-            elif ev_name == 'TurretKilled':
-                msg = f"{killer} destroyed a Turret"
-            elif ev_name == 'InhibKilled':
-                msg = f"{killer} destroyed an Inhibitor"
-            elif ev_name == 'DragonKill':
-                d_type = e.get('DragonType', 'Elemental')
-                msg = f"{killer} took {d_type} Dragon"
-            elif ev_name == 'BaronKill':
-                msg = f"{killer} took Baron Nashor"
-            elif ev_name == 'HeraldKill':
-                msg = f"{killer} took Rift Herald"
-            elif ev_name == 'HordeKill':
-                msg = f"{killer} took Void Grubs"
-
-            if msg:
-                all_logs.append(GameEventLog(ago, e['EventTime'], msg))
+            get = e.get
+            handler = get_handler(get('EventName'))
+            if handler is None:
+                continue
+
+            time = get('EventTime', 0.0)
+            killer_key = get('KillerName')
+
+            msg = handler(e, killer_key, resolve(killer_key), fmt(time))
+            ago = int(game_time - time)
+            (recent_logs if ago <= 60 else older_logs).append(GameEventLog(ago, time, msg))
 
         # Sort by most recent (smallest 'ago' / largest 'raw_time')
         # We use raw_time for accurate sorting, then display ago
-        all_logs.sort(key=lambda x: x.raw_time, reverse=True)
+        by_time = attrgetter('raw_time')
+        recent_logs.sort(key=by_time, reverse=True)
 
         # Logic: Get last 60s. If count < 10, fill up to 10 from history.
-        recent_window = [l for l in all_logs if l.time_ago <= 60]
-
-        if len(recent_window) >= 10:
-            self.state.event_log = recent_window
+        # Every recent log is newer than every older one, so the fill is just the newest older logs.
+        if len(recent_logs) >= 10:
+            self.state.event_log = recent_logs
         else:
             # Take top 10 regardless of time
-            self.state.event_log = all_logs[:10]
+            self.state.event_log = recent_logs + heapq.nlargest(10 - len(recent_logs), older_logs, key=by_time)
 
@@ -3,17 +3,17 @@ Data models for League of Legends game state representation
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Ability:
     """Represents a champion ability with key and level"""
     key: str
     level: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatStats:
     """Combat statistics for a player"""
     hp_current: int
@@ -27,7 +27,7 @@ class CombatStats:
     mr: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerScore:
     """Player's KDA and CS statistics"""
     k: int  # Kills
@@ -37,7 +37,7 @@ class PlayerScore:
     vis: float  # Vision Score
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game"""
     summoner_name: str
@@ -56,22 +56,22 @@ class Player:
     current_gold: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LaneState:
     """Represents the state of a lane (structures)"""
     name: str
-    turrets_lost: List[str] = field(default_factory=list)
+    turrets_lost: List[str] = field(default_factory=list)  # Kept sorted (bisect.insort)
     inhib_lost: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectiveStat:
     """Statistics for objectives (dragons, barons, etc.)"""
     count: int = 0
     timers: List[str] = field(default_factory=list)  # e.g. ["15:30 (Chemtech)", "22:10 (Baron)"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """Represents a team with players and objectives"""
     team_id: str
@@ -85,15 +85,14 @@ class Team:
     grubs: ObjectiveStat = field(default_factory=ObjectiveStat)
 
 
-@dataclass
-class GameEventLog:
-    """Represents a game event for the battle log"""
+class GameEventLog(NamedTuple):
+    """Represents a game event for the battle log (a tuple: built once per event)"""
     time_ago: int
     raw_time: float
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchState:
     """Complete game state representation"""
     game_time: float
@@ -102,4 +101,16 @@ class MatchState:
     allies: Optional[Team] = None
     enemies: Optional[Team] = None
     event_log: List[GameEventLog] = field(default_factory=list)
+    # Full summoner name, game name without tag, or champion name -> (Player, Team)
+    name_index: Dict[str, Tuple[Player, Team]] = field(default_factory=dict, repr=False, compare=False)
+
+    def index_player(self, player: Player, team: Team) -> None:
+        """Register every name a player can appear under in game events"""
+        entry = (player, team)
+        self.name_index[player.summoner_name] = entry
+        # Also store by game name without tag (if applicable)
+        if '#' in player.summoner_name:
+            self.name_index[player.summoner_name.split('#', 1)[0]] = entry
+        # Store by champion name as well
+        self.name_index[player.champion_name] = entry
 
@@ -2,11 +2,17 @@
 Game data parser - Converts raw League Client API JSON to structured MatchState
 """
 
+from sys import intern
+
 from .models import (
     MatchState, Player, PlayerScore, Team, LaneState,
     CombatStats, Ability
 )
 
+# Shared read-only fallback for missing nested objects, so the per-player
+# .get() chains don't allocate a fresh {} on every miss
+_EMPTY: dict = {}
+
 
 class GameParser:
     """Parses raw JSON data from League Client API into structured MatchState"""
@@ -23,14 +29,9 @@ class GameParser:
         """
         game_data = self.raw.get('gameData', {})
         g_time = game_data.get('gameTime', 0.0)
-        
-        # Format game time as MM:SS
-        total_seconds = int(g_time)
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        formatted_time = f"{minutes:02d}:{seconds:02d}"
-        
-        state = MatchState(game_time=g_time, formatted_time=formatted_time)
+
+        # formatted_time is filled in by GameCalculator alongside the event timers
+        state = MatchState(game_time=g_time)
 
         ap_data = self.raw.get('activePlayer', {})
         ap_name = ap_data.get('summonerName', 'Unknown')
@@ -41,58 +42,61 @@ class GameParser:
         all_players_list = self.raw.get('allPlayers', [])
 
         for p_raw in all_players_list:
+            get = p_raw.get
             # Name Resolution
-            s_name = p_raw.get('summonerName')
+            s_name = get('summonerName')
             if not s_name:
-                riot_name = p_raw.get('riotIdGameName')
+                riot_name = get('riotIdGameName')
                 if riot_name:
-                    tag = p_raw.get('riotIdTagLine', '')
+                    tag = get('riotIdTagLine', '')
                     s_name = f"{riot_name}#{tag}" if tag else riot_name
                 else:
-                    s_name = p_raw.get('championName', 'Unknown Champion')
+                    s_name = get('championName', 'Unknown Champion')
 
             # Items
-            raw_items = p_raw.get('items', [])
-            items = [i.get('displayName', 'Unknown Item') for i in raw_items if i.get('displayName')]
+            raw_items = get('items', ())
+            items = [name for i in raw_items if (name := i.get('displayName'))]
             if not items:
                 items = ["Empty Inventory"]
 
             # Spells
-            spells_raw = p_raw.get('summonerSpells', {})
-            spell_one = spells_raw.get('summonerSpellOne', {}).get('displayName', 'Unknown')
-            spell_two = spells_raw.get('summonerSpellTwo', {}).get('displayName', 'Unknown')
+            spells_raw = get('summonerSpells', _EMPTY)
+            spell_one = spells_raw.get('summonerSpellOne', _EMPTY).get('displayName', 'Unknown')
+            spell_two = spells_raw.get('summonerSpellTwo', _EMPTY).get('displayName', 'Unknown')
             spells = [spell_one, spell_two]
 
             # Runes
-            runes_raw = p_raw.get('runes', {})
-            keystone = runes_raw.get('keystone', {}).get('displayName', 'Unknown Rune')
+            runes_raw = get('runes', _EMPTY)
+            keystone = intern(runes_raw.get('keystone', _EMPTY).get('displayName', 'Unknown Rune'))
 
-            scores_raw = p_raw.get('scores', {})
+            scores_get = get('scores', _EMPTY).get
+            # Small closed vocabularies: intern so every tick shares one copy and == hits identity
+            team_id = intern(get('team', 'ORDER'))
 
             player = Player(
                 summoner_name=s_name,
-                champion_name=p_raw.get('championName', 'Unknown'),
-                team_id=p_raw.get('team', 'ORDER'),
-                role=p_raw.get('position', 'NONE'),
-                level=p_raw.get('level', 1),
-                is_dead=p_raw.get('isDead', False),
-                respawn_timer=p_raw.get('respawnTimer', 0.0),
+                champion_name=get('championName', 'Unknown'),
+                team_id=team_id,
+                role=intern(get('position', 'NONE')),
+                level=get('level', 1),
+                is_dead=get('isDead', False),
+                respawn_timer=get('respawnTimer', 0.0),
                 items=items,
                 spells=spells,
                 keystone=keystone,
                 scores=PlayerScore(
-                    k=scores_raw.get('kills', 0),
-                    d=scores_raw.get('deaths', 0),
-                    a=scores_raw.get('assists', 0),
-                    cs=scores_raw.get('creepScore', 0),
-                    vis=scores_raw.get('wardScore', 0.0)
+                    k=scores_get('kills', 0),
+                    d=scores_get('deaths', 0),
+                    a=scores_get('assists', 0),
+                    cs=scores_get('creepScore', 0),
+                    vis=scores_get('wardScore', 0.0)
                 )
             )
 
             players_map[s_name] = player
 
-            if s_name == ap_name or p_raw.get('summonerName') == ap_name:
-                active_team_id = p_raw.get('team', 'ORDER')
+            if s_name == ap_name or get('summonerName') == ap_name:
+                active_team_id = team_id
                 state.active_player = player
 
         # Enrich active player with detailed stats
@@ -104,7 +108,7 @@ class GameParser:
                 hp_max=int(c_stats.get('maxHealth', 1)),
                 resource_current=int(c_stats.get('resourceValue', 0)),
                 resource_max=int(c_stats.get('resourceMax', 1)),
-                resource_type=c_stats.get('resourceType', 'MANA'),
+                resource_type=intern(c_stats.get('resourceType', 'MANA')),
                 ad=int(c_stats.get('attackDamage', 0)),
                 ap=int(c_stats.get('abilityPower', 0)),
                 armor=int(c_stats.get('armor', 0)),
@@ -123,12 +127,11 @@ class GameParser:
         state.allies = Team(team_id=active_team_id)
         state.enemies = Team(team_id=enemy_id)
 
-        # Distribute players to teams
+        # Distribute players to teams, indexing their names for event resolution on the way
         for p in players_map.values():
-            if p.team_id == active_team_id:
-                state.allies.players.append(p)
-            else:
-                state.enemies.players.append(p)
+            team = state.allies if p.team_id == active_team_id else state.enemies
+            team.players.append(p)
+            state.index_player(p, team)
 
         # Initialize lane states
         for lane_name in ["Top", "Middle", "Bottom"]:
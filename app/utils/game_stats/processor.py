@@ -2,9 +2,10 @@
 Game state processor - High-level interface for processing game data into reports
 """
 
-import json
 import logging
-from typing import Optional
+from typing import Optional, Union
+
+import orjson
 
 from .models import MatchState
 from .parser import GameParser
@@ -27,7 +28,7 @@ class GameStateProcessor:
     """
 
     @staticmethod
-    def process_to_report(game_stats_json: str) -> str:
+    def process_to_report(game_stats_json: Union[str, bytes]) -> str:
         """
         Process raw game statistics JSON into a formatted text report.
 
@@ -35,7 +36,7 @@ class GameStateProcessor:
         report. It handles the full pipeline: parsing, calculating, and formatting.
 
         Args:
-            game_stats_json: Raw JSON string from League Client API
+            game_stats_json: Raw JSON string or UTF-8 bytes from League Client API
 
         Returns:
             Formatted text report with game state, objectives, teams, and battle log
@@ -50,8 +51,8 @@ class GameStateProcessor:
             >>> print(report)
         """
         try:
-            # Parse JSON
-            game_data = json.loads(game_stats_json)
+            # Parse JSON (orjson accepts both str and bytes)
+            game_data = orjson.loads(game_stats_json)
 
             # Create parser and parse game state
             parser = GameParser(game_data)
@@ -69,7 +70,7 @@ class GameStateProcessor:
 
             return report
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error("Invalid JSON in game_stats_json: %s", str(e))
             raise ValueError(f"Invalid JSON format: {str(e)}")
         except KeyError as e:
@@ -80,7 +81,7 @@ class GameStateProcessor:
             raise
 
     @staticmethod
-    def process_to_state(game_stats_json: str) -> MatchState:
+    def process_to_state(game_stats_json: Union[str, bytes]) -> MatchState:
         """
         Process raw game statistics JSON into a MatchState object.
 
@@ -88,7 +89,7 @@ class GameStateProcessor:
         a formatted text report.
 
         Args:
-            game_stats_json: Raw JSON string from League Client API
+            game_stats_json: Raw JSON string or UTF-8 bytes from League Client API
 
         Returns:
             MatchState object with all parsed and calculated data
@@ -103,9 +104,33 @@ class GameStateProcessor:
             >>> print(f"Dragons: {state.allies.dragons.count}")
         """
         try:
-            # Parse JSON
-            game_data = json.loads(game_stats_json)
+            # Parse JSON (orjson accepts both str and bytes)
+            game_data = orjson.loads(game_stats_json)
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON in game_stats_json: %s", str(e))
+            raise ValueError(f"Invalid JSON format: {str(e)}")
+
+        return GameStateProcessor.process_data_to_state(game_data)
+
+    @staticmethod
+    def process_data_to_state(game_data: dict) -> MatchState:
+        """
+        Process already-parsed game statistics into a MatchState object.
+
+        Use this when the caller has decoded the JSON itself (e.g. to validate it),
+        so the payload is not serialized and parsed a second time.
+
+        Args:
+            game_data: Decoded game statistics object from League Client API
 
+        Returns:
+            MatchState object with all parsed and calculated data
+
+        Raises:
+            ValueError: If required fields are missing
+            Exception: If processing fails
+        """
+        try:
             # Create parser and parse game state
             parser = GameParser(game_data)
             state = parser.parse()
@@ -117,9 +142,6 @@ class GameStateProcessor:
 
             return state
 
-        except json.JSONDecodeError as e:
-            logger.error("Invalid JSON in game_stats_json: %s", str(e))
-            raise ValueError(f"Invalid JSON format: {str(e)}")
         except KeyError as e:
             logger.error("Missing required field in game data: %s", str(e))
             raise ValueError(f"Missing required field: {str(e)}")
@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.utils.game_stats import GameStateProcessor, ReportGenerator
+
+TESTS_DIR = Path(__file__).parent
+GOLDEN_DIR = TESTS_DIR / "fixtures" / "game_stats"
+
+# (game data input, expected report) pairs; the expected reports were produced by
+# the parser/calculator/report pipeline before it was optimized and must not drift
+CASES = [
+    pytest.param(TESTS_DIR / "allgamedata.json", GOLDEN_DIR / "allgamedata.txt", id="allgamedata"),
+    pytest.param(
+        TESTS_DIR / "fixtures" / "coach_advice" / "allgamedata.json",
+        GOLDEN_DIR / "coach_advice.txt",
+        id="coach_advice",
+    ),
+    pytest.param(
+        TESTS_DIR / "fixtures" / "coach_advice" / "build_tool_test" / "allgamedata.json",
+        GOLDEN_DIR / "build_tool_test.txt",
+        id="build_tool_test",
+    ),
+]
+
+
+@pytest.mark.parametrize("game_data, expected", CASES)
+def test_report_matches_golden(game_data, expected):
+    report = GameStateProcessor.process_to_report(game_data.read_text(encoding="utf-8"))
+
+    assert report == expected.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("game_data, expected", CASES)
+def test_report_from_bytes_matches_golden(game_data, expected):
+    report = GameStateProcessor.process_to_report(game_data.read_bytes())
+
+    assert report == expected.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("game_data, expected", CASES)
+def test_report_from_parsed_dict_matches_golden(game_data, expected):
+    # The coach agent's path: the route hands over the already-parsed dict
+    state = GameStateProcessor.process_data_to_state(json.loads(game_data.read_bytes()))
+
+    assert ReportGenerator.generate(state) == expected.read_text(encoding="utf-8")
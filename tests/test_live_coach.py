@@ -5,23 +5,54 @@ from pathlib import Path
 
 import pytest
 
-from app.assistant.agent import get_coach_advice
-from app.assistant.knowledge_agent import get_knowledge_advice
-from app.assistant.session import session_manager
-from app.assistant.stt import transcribe_audio
-from app.assistant.tts import text_to_speech_stream
-from app.config import settings
-from app.models.language import get_language_code
+# App modules (and the LLM/speech SDKs behind them) are imported inside the tests,
+# so collecting or deselecting this module stays cheap
 
 FIXTURE_DIR = Path(__file__).parent / "fixtures" / "coach_advice"
 
+# All live tests run on one event loop: the STT/TTS clients are shared process-wide
+# and their pooled connections are bound to the loop that opened them
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _speak_advice(advice_stream):
+    """Run advice text through the route's sentence-by-sentence TTS, keeping the text"""
+    from app.assistant.tts import text_stream_to_speech
+    from app.routes.assistant import _prime_stream
+
+    text_parts = []
+
+    async def recorded():
+        async for delta in advice_stream:
+            text_parts.append(delta)
+            yield delta
+
+    audio_response = bytearray()
+    chunk_count = 0
+    first_chunk_time = None
+
+    print(f"\n🎵 Starting TTS streaming...")
+
+    # Same path as the route: prime the LLM stream, then speak it as it generates
+    async for chunk in text_stream_to_speech(await _prime_stream(recorded())):
+        if first_chunk_time is None:
+            first_chunk_time = time.perf_counter()
+        audio_response.extend(chunk)
+        chunk_count += 1
+
+    return "".join(text_parts), audio_response, chunk_count, first_chunk_time
+
 
 @pytest.mark.skipif(
     not os.getenv("GOOGLE_API_KEY") or not os.getenv("OPENAI_API_KEY"),
     reason="GOOGLE_API_KEY or OPENAI_API_KEY not set; skipping live coach integration test",
 )
-@pytest.mark.asyncio
 async def test_coach_advice_smoke_streaming():
+    from app.assistant.agent import get_coach_advice_stream
+    from app.assistant.session import session_manager
+    from app.assistant.stt import transcribe_audio
+    from app.config import settings
+
     # Print test configuration
     print(f"\n{'='*60}")
     print(f"Running STREAMING test with:")
@@ -33,67 +64,41 @@ async def test_coach_advice_smoke_streaming():
     language = "english"
     audio_bytes = (FIXTURE_DIR / audio_file).read_bytes()
     mime_type = "audio/wav"  # Known from fixture file extension
-    game_stats_json_text = (FIXTURE_DIR / "allgamedata.json").read_text()
-    game_stats_dict = json.loads(game_stats_json_text)
+    game_stats_dict = json.loads((FIXTURE_DIR / "allgamedata.json").read_bytes())
 
     print(f"Audio input - MIME type: {mime_type}, Size: {len(audio_bytes)} bytes")
 
     # STT transcription
     stt_start = time.perf_counter()
-    user_question = transcribe_audio(
-        audio_bytes=audio_bytes,
-        language=language,
-    )
+    user_question = await transcribe_audio(audio_bytes=audio_bytes, language=language)
     stt_duration = time.perf_counter() - stt_start
     print(f"Transcribed question: {user_question}")
 
-    # Step 1: Get or create session and get coaching advice
+    # Step 1: Get or create session
     coach_start = time.perf_counter()
     session = session_manager.get_or_create_session(
         game_stats_dict=game_stats_dict,
     )
     # Agent has champion guide in system prompt
     # Game stats and language instruction are passed fresh with each request in the user message
-    # Message history is managed automatically by get_coach_advice
-    response = get_coach_advice(
-        session=session,
-        user_question=user_question,
-        game_stats_json=game_stats_json_text,
-        language=language,
+    # Message history is updated by get_coach_advice_stream once the stream completes
+    # Step 2: Stream the advice into sentence-by-sentence TTS, as the route does
+    response, audio_response, chunk_count, first_chunk_time = await _speak_advice(
+        get_coach_advice_stream(
+            session=session,
+            user_question=user_question,
+            language=language,
+            game_stats_dict=game_stats_dict,
+        )
     )
     coach_duration = time.perf_counter() - coach_start
 
     print(f"coach_advice response: {response}")
 
-    # Step 2: Convert response to speech with STREAMING TTS
-    tts_start = time.perf_counter()
-
-    # Use advice directly for TTS (same as in route)
-    tts_text = response
-
-    # Collect audio chunks with streaming and log timing
-    chunks = []
-    chunk_count = 0
-    first_chunk_time = None  # Ensure variable is always defined before use
-
-    print(f"\n🎵 Starting TTS streaming...")
-
-    async for chunk in text_to_speech_stream(tts_text):
-        chunk_arrival_time = time.perf_counter()
-
-        if first_chunk_time is None:
-            first_chunk_time = chunk_arrival_time
-
-        chunks.append(chunk)
-        chunk_count += 1
-
-    # Reassemble audio
-    audio_response = b''.join(chunks)
-
     print(f"\n{'='*60}")
-    print(f"Total duration with streaming: {coach_duration + stt_duration + (first_chunk_time - tts_start):.2f}s")
-    print(f"  Coach: {coach_duration:.2f}s")
-    print(f"  TTS (streaming): {first_chunk_time - tts_start:.2f}s")
+    print(f"Total duration with streaming: {coach_duration + stt_duration:.2f}s")
+    print(f"  First audio after: {stt_duration + (first_chunk_time - coach_start):.2f}s")
+    print(f"  Coach + TTS (streaming): {coach_duration:.2f}s")
     print(f"  STT: {stt_duration:.2f}s")
     print(f"Provider used: {settings.coach_provider} ({settings.coach_model})")
     print(f"{'='*60}\n")
@@ -106,7 +111,7 @@ async def test_coach_advice_smoke_streaming():
     assert chunk_count > 0, "Should receive at least one chunk"
 
     # Verify it's a valid WAV file
-    assert audio_response[:4] == b'RIFF', "Audio should be a valid WAV file"
+    assert audio_response.startswith(b'RIFF'), "Audio should be a valid WAV file"
     assert audio_response[8:12] == b'WAVE', "Audio should be a valid WAV file"
 
     print("✓ Streaming smoke test passed: Full flow works with streaming TTS")
@@ -117,8 +122,12 @@ async def test_coach_advice_smoke_streaming():
     reason="GOOGLE_API_KEY or OPENAI_API_KEY not set; skipping live coach integration test",
 )
 @pytest.mark.parametrize("audio_file, language", [("input_audio.wav", "english")])
-@pytest.mark.asyncio
 async def test_coach_advice_with_build_tool_call(audio_file, language):
+    from app.assistant.agent import get_coach_advice_stream
+    from app.assistant.session import session_manager
+    from app.assistant.stt import transcribe_audio
+    from app.config import settings
+
     # Print test configuration
     print(f"\n{'='*60}")
     print(f"Running BUILD TOOL CALL test with:")
@@ -130,67 +139,41 @@ async def test_coach_advice_with_build_tool_call(audio_file, language):
     build_test_dir = FIXTURE_DIR / "build_tool_test"
     audio_bytes = (build_test_dir / audio_file).read_bytes()
     mime_type = "audio/wav"  # Known from fixture file extension
-    game_stats_json_text = (build_test_dir / "allgamedata.json").read_text()
-    game_stats_dict = json.loads(game_stats_json_text)
+    game_stats_dict = json.loads((build_test_dir / "allgamedata.json").read_bytes())
 
     print(f"Audio input - MIME type: {mime_type}, Size: {len(audio_bytes)} bytes")
 
     # STT transcription
     stt_start = time.perf_counter()
-    user_question = transcribe_audio(
-        audio_bytes=audio_bytes,
-        language=language,
-    )
+    user_question = await transcribe_audio(audio_bytes=audio_bytes, language=language)
     stt_duration = time.perf_counter() - stt_start
     print(f"Transcribed question: {user_question}")
 
-    # Step 1: Get or create session and get coaching advice
+    # Step 1: Get or create session
     coach_start = time.perf_counter()
     session = session_manager.get_or_create_session(
         game_stats_dict=game_stats_dict,
     )
     # Agent has champion guide in system prompt
     # Game stats and language instruction are passed fresh with each request in the user message
-    # Message history is managed automatically by get_coach_advice
-    response = get_coach_advice(
-        session=session,
-        user_question=user_question,
-        game_stats_json=game_stats_json_text,
-        language=language,
+    # Message history is updated by get_coach_advice_stream once the stream completes
+    # Step 2: Stream the advice into sentence-by-sentence TTS, as the route does
+    response, audio_response, chunk_count, first_chunk_time = await _speak_advice(
+        get_coach_advice_stream(
+            session=session,
+            user_question=user_question,
+            language=language,
+            game_stats_dict=game_stats_dict,
+        )
     )
     coach_duration = time.perf_counter() - coach_start
 
     print(f"coach_advice response: {response}")
 
-    # Step 2: Convert response to speech with STREAMING TTS
-    tts_start = time.perf_counter()
-
-    # Use advice directly for TTS (same as in route)
-    tts_text = response
-
-    # Collect audio chunks with streaming and log timing
-    chunks = []
-    chunk_count = 0
-    first_chunk_time = None  # Ensure variable is always defined before use
-
-    print(f"\n🎵 Starting TTS streaming...")
-
-    async for chunk in text_to_speech_stream(tts_text):
-        chunk_arrival_time = time.perf_counter()
-
-        if first_chunk_time is None:
-            first_chunk_time = chunk_arrival_time
-
-        chunks.append(chunk)
-        chunk_count += 1
-
-    # Reassemble audio
-    audio_response = b''.join(chunks)
-
     print(f"\n{'=' * 60}")
-    print(f"Total duration with streaming: {coach_duration + stt_duration + (first_chunk_time - tts_start):.2f}s")
-    print(f"  Coach: {coach_duration:.2f}s")
-    print(f"  TTS (streaming): {first_chunk_time - tts_start:.2f}s")
+    print(f"Total duration with streaming: {coach_duration + stt_duration:.2f}s")
+    print(f"  First audio after: {stt_duration + (first_chunk_time - coach_start):.2f}s")
+    print(f"  Coach + TTS (streaming): {coach_duration:.2f}s")
     print(f"  STT: {stt_duration:.2f}s")
     print(f"Provider used: {settings.coach_provider} ({settings.coach_model})")
     print(f"{'=' * 60}\n")
@@ -203,7 +186,7 @@ async def test_coach_advice_with_build_tool_call(audio_file, language):
     assert chunk_count > 0, "Should receive at least one chunk"
 
     # Verify it's a valid WAV file
-    assert audio_response[:4] == b'RIFF', "Audio should be a valid WAV file"
+    assert audio_response.startswith(b'RIFF'), "Audio should be a valid WAV file"
     assert audio_response[8:12] == b'WAVE', "Audio should be a valid WAV file"
 
     print("✓ Build tool call test passed: Full flow works with build-related query")
@@ -214,7 +197,6 @@ async def test_coach_advice_with_build_tool_call(audio_file, language):
     reason="GOOGLE_API_KEY or OPENAI_API_KEY not set; skipping live coach integration test",
 )
 @pytest.mark.parametrize("audio_file, language", [("input_audio_persian.wav", "persian")])
-@pytest.mark.asyncio
 async def test_knowledge_mode_out_of_game(audio_file, language):
     """
     Test knowledge mode when user is not in a game (no game_stats).
@@ -222,6 +204,12 @@ async def test_knowledge_mode_out_of_game(audio_file, language):
     This tests the out-of-game knowledge assistant that answers
     general League of Legends questions without live game context.
     """
+    from app.assistant.knowledge_agent import get_knowledge_advice_stream
+    from app.assistant.session import session_manager
+    from app.assistant.stt import transcribe_audio
+    from app.config import settings
+    from app.models.language import get_language_code
+
     # Print test configuration
     print(f"\n{'='*60}")
     print(f"Running KNOWLEDGE MODE (out-of-game) test with:")
@@ -243,14 +231,11 @@ async def test_knowledge_mode_out_of_game(audio_file, language):
     # STT transcription
     stt_start = time.perf_counter()
     language_code = get_language_code(language)
-    user_question = transcribe_audio(
-        audio_bytes=audio_bytes,
-        language=language,
-    )
+    user_question = await transcribe_audio(audio_bytes=audio_bytes, language=language)
     stt_duration = time.perf_counter() - stt_start
     print(f"Transcribed question: {user_question}")
 
-    # Step 1: Get or create knowledge session and get advice
+    # Step 1: Get or create knowledge session
     knowledge_start = time.perf_counter()
     session = session_manager.get_or_create_knowledge_session(
         user_id=user_id,
@@ -258,44 +243,22 @@ async def test_knowledge_mode_out_of_game(audio_file, language):
 
     print(f"Session created: {session}")
 
-    response = get_knowledge_advice(
-        session=session,
-        user_question=user_question,
-        language=language,
+    # Step 2: Stream the advice into sentence-by-sentence TTS, as the route does
+    response, audio_response, chunk_count, first_chunk_time = await _speak_advice(
+        get_knowledge_advice_stream(
+            session=session,
+            user_question=user_question,
+            language=language,
+        )
     )
     knowledge_duration = time.perf_counter() - knowledge_start
 
     print(f"knowledge_advice response: {response}")
 
-    # Step 2: Convert response to speech with STREAMING TTS
-    tts_start = time.perf_counter()
-
-    # Use advice directly for TTS
-    tts_text = response
-
-    # Collect audio chunks with streaming and log timing
-    chunks = []
-    chunk_count = 0
-    first_chunk_time = None  # Ensure variable is always defined before use
-
-    print(f"\n🎵 Starting TTS streaming...")
-
-    async for chunk in text_to_speech_stream(tts_text):
-        chunk_arrival_time = time.perf_counter()
-
-        if first_chunk_time is None:
-            first_chunk_time = chunk_arrival_time
-
-        chunks.append(chunk)
-        chunk_count += 1
-
-    # Reassemble audio
-    audio_response = b''.join(chunks)
-
     print(f"\n{'='*60}")
-    print(f"Total duration with streaming: {knowledge_duration + stt_duration + (first_chunk_time - tts_start):.2f}s")
-    print(f"  Knowledge Agent: {knowledge_duration:.2f}s")
-    print(f"  TTS (streaming): {first_chunk_time - tts_start:.2f}s")
+    print(f"Total duration with streaming: {knowledge_duration + stt_duration:.2f}s")
+    print(f"  First audio after: {stt_duration + (first_chunk_time - knowledge_start):.2f}s")
+    print(f"  Knowledge Agent + TTS (streaming): {knowledge_duration:.2f}s")
     print(f"  STT: {stt_duration:.2f}s")
     print(f"Provider used: {settings.coach_provider} ({settings.coach_model})")
     print(f"{'='*60}\n")
@@ -309,7 +272,7 @@ async def test_knowledge_mode_out_of_game(audio_file, language):
     assert chunk_count > 0, "Should receive at least one chunk"
 
     # Verify it's a valid WAV file
-    assert audio_response[:4] == b'RIFF', "Audio should be a valid WAV file"
+    assert audio_response.startswith(b'RIFF'), "Audio should be a valid WAV file"
     assert audio_response[8:12] == b'WAVE', "Audio should be a valid WAV file"
 
     # Test session reuse - same user should get the same session
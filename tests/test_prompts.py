@@ -0,0 +1,52 @@
+import re
+
+import pytest
+
+from app.assistant.knowledge_prompts import KNOWLEDGE_PROMPT
+from app.assistant.prompts import COACH_PROMPT_STATIC, _normalize
+
+COACH_SECTION_HEADERS = [
+    "## Personality",
+    "## Knowledge Hierarchy",
+    "## Scope",
+    "## Hard Limits",
+    "## Response Rules",
+]
+
+KNOWLEDGE_SECTION_HEADERS = [
+    "## Personality",
+    "## Scope & Boundaries",
+    "## Hard Limits",
+    "## BREVITY RULES",
+    "## Input Structure",
+    "## Response Format",
+    "## ANSWER PRECISION",
+    "## CONFLICT RESOLUTION & PRIORITY",
+]
+
+
+@pytest.mark.parametrize(
+    "prompt, header",
+    [pytest.param(COACH_PROMPT_STATIC, h, id=f"coach:{h}") for h in COACH_SECTION_HEADERS]
+    + [pytest.param(KNOWLEDGE_PROMPT, h, id=f"knowledge:{h}") for h in KNOWLEDGE_SECTION_HEADERS],
+)
+def test_section_headers_survive_normalization(prompt, header):
+    # Each header must still sit on its own line so the model sees it as a section marker
+    assert re.search(rf"^{re.escape(header)}[ \t]*$", prompt, re.MULTILINE), f"missing {header!r}"
+
+
+# The knowledge prompt appends raw playbook files after a "---" rule; only the
+# hand-written sections before it go through _normalize
+@pytest.mark.parametrize(
+    "prompt",
+    [COACH_PROMPT_STATIC, KNOWLEDGE_PROMPT.split("\n---\n", 1)[0]],
+    ids=["coach", "knowledge"],
+)
+def test_prompts_are_normalized(prompt):
+    assert not re.search(r"[ \t]+\n", prompt), "trailing whitespace left in prompt"
+    assert "\n\n\n" not in prompt, "blank-line run left in prompt"
+
+
+def test_normalize_keeps_content():
+    text = "## Scope   \nLine one\t\n\n\n\n## Response Rules\n- rule  \n"
+    assert _normalize(text) == "## Scope\nLine one\n\n## Response Rules\n- rule"
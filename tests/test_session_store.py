@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+
+from app.auth.session_store import SessionData, SessionStatus
+
+
+def _session(**overrides) -> SessionData:
+    now = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    fields = dict(session_id="abc", created_at=now, expires_at=now + timedelta(minutes=10))
+    fields.update(overrides)
+    return SessionData(**fields)
+
+
+def test_session_data_round_trip_defaults():
+    session = _session()
+
+    assert SessionData.from_json(session.to_json()) == session
+
+
+def test_session_data_round_trip_all_fields():
+    session = _session(
+        status=SessionStatus.COMPLETE,
+        state="state-1",
+        code_verifier="verifier",
+        session_token="jwt",
+        refresh_token="refresh",
+        user_id="user-1",
+        error=None,
+    )
+
+    restored = SessionData.from_json(session.to_json())
+
+    assert restored == session
+    assert restored.status is SessionStatus.COMPLETE
+    assert restored.expires_at.tzinfo is not None
+
+
+def test_session_data_from_json_accepts_str():
+    session = _session(status=SessionStatus.FAILED, error="denied")
+
+    assert SessionData.from_json(session.to_json().decode()) == session
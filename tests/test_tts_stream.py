@@ -0,0 +1,120 @@
+import pytest
+
+from app.assistant import tts
+
+# The route module (and the agents behind it) is imported inside the _prime_stream
+# tests, so the TTS tests don't need the LLM stack
+
+
+async def _text_stream(*deltas, error=None):
+    """Fake LLM stream yielding the given deltas, then optionally raising"""
+    for delta in deltas:
+        yield delta
+    if error is not None:
+        raise error
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+@pytest.fixture
+def spoken(monkeypatch):
+    """Stub TTS: each segment becomes b"<segment>|" and is recorded"""
+    segments = []
+
+    async def fake_stream_speech(client, text, response_format="wav"):
+        assert response_format == "pcm"
+        segments.append(text)
+        yield text.encode() + b"|"
+
+    monkeypatch.setattr(tts, "_client", lambda: None)
+    monkeypatch.setattr(tts, "_stream_speech", fake_stream_speech)
+    return segments
+
+
+async def test_split_sentences_regroups_deltas():
+    first = "Buy a Control Ward before you go to drag. "
+    second = "Then shove the wave and rotate mid!"
+    deltas = [first[:10], first[10:], second[:5], second[5:]]
+
+    assert await _collect(tts._split_sentences(_text_stream(*deltas))) == [
+        first.strip(),
+        second,
+    ]
+
+
+async def test_split_sentences_keeps_abbreviations_inside_a_sentence():
+    text = "Build a defensive item, e.g. Zhonya's, vs. their assassins. Then group with the team."
+
+    assert await _collect(tts._split_sentences(_text_stream(text))) == [
+        "Build a defensive item, e.g. Zhonya's, vs. their assassins.",
+        "Then group with the team.",
+    ]
+
+
+async def test_split_sentences_flushes_trailing_text_without_punctuation():
+    text = "Ward the enemy jungle entrance before you push. then back and buy boots"
+
+    assert await _collect(tts._split_sentences(_text_stream(text))) == [
+        "Ward the enemy jungle entrance before you push.",
+        "then back and buy boots",
+    ]
+
+
+async def test_split_sentences_merges_short_sentences():
+    assert await _collect(tts._split_sentences(_text_stream("Yes. Go. Now."))) == [
+        "Yes. Go. Now."
+    ]
+
+
+async def test_text_stream_to_speech_emits_a_single_header(spoken):
+    deltas = ["Back now and buy a Control Ward for drag. ", "Then group mid and siege the outer tower. ", "Go"]
+    chunks = await _collect(tts.text_stream_to_speech(_text_stream(*deltas)))
+
+    audio = b"".join(chunks)
+    assert chunks[0] == tts._STREAMING_WAV_HEADER
+    assert audio.count(b"RIFF") == 1
+    assert audio[len(tts._STREAMING_WAV_HEADER):] == b"".join(s.encode() + b"|" for s in spoken)
+    assert spoken == [
+        "Back now and buy a Control Ward for drag.",
+        "Then group mid and siege the outer tower.",
+        "Go",
+    ]
+
+
+async def test_text_stream_to_speech_raises_text_stream_errors(spoken):
+    stream = _text_stream("Back now and buy a Control Ward for drag. ", error=RuntimeError("llm down"))
+
+    with pytest.raises(RuntimeError, match="llm down"):
+        await _collect(tts.text_stream_to_speech(stream))
+
+
+async def test_text_stream_to_speech_raises_tts_errors_after_header(monkeypatch):
+    async def failing_stream_speech(client, text, response_format="wav"):
+        raise RuntimeError("tts down")
+        yield b""
+
+    monkeypatch.setattr(tts, "_client", lambda: None)
+    monkeypatch.setattr(tts, "_stream_speech", failing_stream_speech)
+
+    chunks = []
+    with pytest.raises(RuntimeError, match="tts down"):
+        async for chunk in tts.text_stream_to_speech(_text_stream("Group mid now.")):
+            chunks.append(chunk)
+    assert chunks == [tts._STREAMING_WAV_HEADER]
+
+
+async def test_prime_stream_replays_first_chunk():
+    from app.routes.assistant import _prime_stream
+
+    stream = await _prime_stream(_text_stream("a", "b", "c"))
+
+    assert await _collect(stream) == ["a", "b", "c"]
+
+
+async def test_prime_stream_raises_before_the_response_starts():
+    from app.routes.assistant import _prime_stream
+
+    with pytest.raises(RuntimeError, match="llm down"):
+        await _prime_stream(_text_stream(error=RuntimeError("llm down")))